@@ -0,0 +1,18 @@
+from abc import ABCMeta
+from six import add_metaclass
+
+
+@add_metaclass(ABCMeta)
+class AbstractIndependentDataSpecVertex(object):
+    """ A vertex whose data specification generation depends only on the\
+        mapping results passed to generate_data_spec, so that the data\
+        specifications of such vertices can be generated in separate\
+        processes.  The only host-side state kept from the generation is\
+        the weight scales set on the projection subedges coming in to each\
+        subvertex, which are passed back to the main process to read the\
+        synapses from the machine later in the run; any other state set by\
+        generate_data_spec is lost.
+    """
+
+    def __init__(self):
+        pass
@@ -13,6 +13,9 @@ from spynnaker.pyNN.models.abstract_models.abstract_synaptic_manager \
 from spynnaker.pyNN.models.abstract_models.\
     abstract_partitionable_population_vertex \
     import AbstractPartitionablePopulationVertex
+from spynnaker.pyNN.models.abstract_models\
+    .abstract_independent_data_spec_vertex \
+    import AbstractIndependentDataSpecVertex
 
 from spinn_front_end_common.abstract_models\
     .abstract_outgoing_edge_same_contiguous_keys_restrictor\
@@ -31,7 +34,8 @@ logger = logging.getLogger(__name__)
 @add_metaclass(ABCMeta)
 class AbstractPopulationDataSpec(
         AbstractSynapticManager, AbstractPartitionablePopulationVertex,
-        AbstractOutgoingEdgeSameContiguousKeysRestrictor):
+        AbstractOutgoingEdgeSameContiguousKeysRestrictor,
+        AbstractIndependentDataSpecVertex):
     """
     AbstractPopulationDataSpec: provides functioanlity on how neural models
     generate their data spec files
@@ -48,6 +52,7 @@ class AbstractPopulationDataSpec(
             timescale_factor=timescale_factor, constraints=constraints,
             max_atoms_per_core=max_atoms_per_core)
         AbstractOutgoingEdgeSameContiguousKeysRestrictor.__init__(self)
+        AbstractIndependentDataSpecVertex.__init__(self)
         self._binary = binary
         self._spikes_per_second = spikes_per_second
         self._ring_buffer_sigma = ring_buffer_sigma
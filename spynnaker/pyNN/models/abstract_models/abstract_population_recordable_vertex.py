@@ -1,21 +1,30 @@
 from spynnaker.pyNN import exceptions
 from spynnaker.pyNN.utilities import constants as local_constants
+from spynnaker.pyNN.utilities.conf import config
+from spynnaker.pyNN.utilities.recording_reader import RecordingReader
+from spynnaker.pyNN.utilities.recorded_neuron_parameter \
+    import RecordedNeuronParameter
 
 from pacman.utilities import constants as pacman_constants
 from pacman.utilities.progress_bar import ProgressBar
 
-from data_specification import utility_calls as dsg_utility_calls
-
 import logging
 import numpy
-import struct
-import tempfile
 from abc import ABCMeta
 from six import add_metaclass
 from abc import abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# The number of bits set in each value of a byte
+_BITS_SET = numpy.unpackbits(
+    numpy.arange(256, dtype="uint8").reshape((-1, 1)), axis=1).sum(
+    axis=1).astype("uint8")
+
+# The number of time steps of spike bitfields which are counted at once,
+# which limits the memory used to unpack the bits
+_COUNT_CHUNK_TIMESTEPS = 4096
+
 
 @add_metaclass(ABCMeta)
 class AbstractPopulationRecordableVertex(object):
@@ -75,173 +84,319 @@ class AbstractPopulationRecordableVertex(object):
         return (local_constants.RECORDING_ENTRY_BYTE_SIZE +
                 (self._no_machine_time_steps * bytes_per_timestep))
 
-    def _get_spikes(
-            self, graph_mapper, placements, transceiver, compatible_output,
-            spike_recording_region, sub_vertex_out_spike_bytes_function):
+    @staticmethod
+    def _get_recording_reader(transceiver):
+        """ Get a reader for the recording regions, which reads with the\
+            number of threads given in the Recording section of the\
+            configuration
         """
-        Return a 2-column numpy array containing cell ids and spike times for
-        recorded cells.   This is read directly from the memory for the board.
+        return RecordingReader(
+            transceiver, config.getint("Recording", "n_read_threads"))
+
+    def _get_spike_recording_regions(
+            self, graph_mapper, placements, reader, spike_recording_region,
+            sub_vertex_out_spike_bytes_function):
+        """ Find where the spikes of every core of this vertex are and how\
+            many bytes of them there are, checking that the number of bytes\
+            fits in the region allocated for them
+
+        :return: a list of (subvertex slice, placement, out spike bytes,\
+                    (data address, n bytes written)) for each subvertex, in\
+                    order of atom
         """
-
-        logger.info("Getting spikes for {}".format(self._label))
-
-        spike_times = list()
-        spike_ids = list()
-        ms_per_tick = self._machine_time_step / 1000.0
-
-        # Find all the sub-vertices that this pynn_population.py exists on
-        subvertices = graph_mapper.get_subvertices_from_vertex(self)
-        progress_bar = ProgressBar(len(subvertices), "Getting spikes")
-        for subvertex in subvertices:
-            placement = placements.get_placement_of_subvertex(subvertex)
-            (x, y, p) = placement.x, placement.y, placement.p
+        subvertices = sorted(
+            graph_mapper.get_subvertices_from_vertex(self),
+            key=lambda subvertex:
+                graph_mapper.get_subvertex_slice(subvertex).lo_atom)
+        subvertex_placements = [
+            placements.get_placement_of_subvertex(subvertex)
+            for subvertex in subvertices]
+        recording_regions = reader.get_recording_regions(
+            subvertex_placements, spike_recording_region)
+
+        spike_regions = list()
+        for subvertex, placement, recording_region in zip(
+                subvertices, subvertex_placements, recording_regions):
             subvertex_slice = graph_mapper.get_subvertex_slice(subvertex)
-            lo_atom = subvertex_slice.lo_atom
-            hi_atom = subvertex_slice.hi_atom
-
-            logger.debug("Reading spikes from chip {}, {}, core {}, "
-                         "lo_atom {} hi_atom {}".format(
-                             x, y, p, lo_atom, hi_atom))
-
-            # Get the App Data for the core
-            app_data_base_address = \
-                transceiver.get_cpu_information_from_core(x, y, p).user[0]
-
-            # Get the position of the spike buffer
-            spike_region_base_address_offset = \
-                dsg_utility_calls.get_region_base_address_offset(
-                    app_data_base_address, spike_recording_region)
-            spike_region_base_address_buf = transceiver.read_memory(
-                x, y, spike_region_base_address_offset, 4)
-            spike_region_base_address = struct.unpack_from(
-                "<I", spike_region_base_address_buf)[0]
-            spike_region_base_address += app_data_base_address
-
-            # Read the spike data size
-            number_of_bytes_written_buf = transceiver.read_memory(
-                x, y, spike_region_base_address, 4)
-            number_of_bytes_written = struct.unpack_from(
-                "<I", number_of_bytes_written_buf)[0]
-
-            # check that the number of spikes written is smaller or the same as
-            # the size of the memory region we allocated for spikes
             out_spike_bytes = sub_vertex_out_spike_bytes_function(
                 subvertex, subvertex_slice)
-            size_of_region = self.get_recording_region_size(out_spike_bytes)
 
+            # check that the number of spikes written is smaller or the same
+            # as the size of the memory region we allocated for spikes
+            number_of_bytes_written = recording_region[1]
+            size_of_region = self.get_recording_region_size(out_spike_bytes)
             if number_of_bytes_written > size_of_region:
                 raise exceptions.MemReadException(
                     "the amount of memory written ({}) was larger than was "
                     "allocated for it ({})"
                     .format(number_of_bytes_written, size_of_region))
 
-            # Read the spikes
-            logger.debug("Reading {} ({}) bytes starting at {} + 4"
-                         .format(number_of_bytes_written,
-                                 hex(number_of_bytes_written),
-                                 hex(spike_region_base_address)))
-            spike_data = transceiver.read_memory(
-                x, y, spike_region_base_address + 4, number_of_bytes_written)
-            numpy_data = numpy.asarray(spike_data, dtype="uint8").view(
-                dtype="uint32").byteswap().view("uint8")
-            bits = numpy.fliplr(numpy.unpackbits(numpy_data).reshape(
-                (-1, 32))).reshape((-1, out_spike_bytes * 8))
-            times, indices = numpy.where(bits == 1)
-            times = times * ms_per_tick
-            indices = indices + lo_atom
-            spike_ids.append(indices)
-            spike_times.append(times)
+            spike_regions.append((subvertex_slice, placement, out_spike_bytes,
+                                  recording_region))
+        return spike_regions
+
+    @staticmethod
+    def _decode_spikes(spike_data, out_spike_bytes, lo_atom, ms_per_tick,
+                       first_time_step=0):
+        """ Decode the spike bitfields of one core into a 2-column array of\
+            cell ids and spike times, ordered by id and then by time
+
+        :param spike_data: the bitfields, with one bitfield of\
+                    out_spike_bytes for each time step
+        :param out_spike_bytes: the number of bytes in each bitfield
+        :param lo_atom: the id of the first atom of the core
+        :param ms_per_tick: the number of milliseconds in each time step
+        :param first_time_step: the time step of the first bitfield
+        """
+        words = numpy.asarray(spike_data, dtype="uint8").view(dtype="<u4")
+        words_per_tick = out_spike_bytes // 4
+
+        # Only the words with a spike in them are expanded into bits, so the
+        # work done depends on the number of spikes rather than the size of
+        # the recording
+        word_indices = numpy.flatnonzero(words)
+        spike_words = words[word_indices].astype("<u4")
+        bits = numpy.unpackbits(spike_words.view("uint8")).reshape(
+            (-1, 4, 8))[:, :, ::-1].reshape((-1, 32))
+        spike_word_indices, spike_bits = numpy.nonzero(bits)
+        word_indices = word_indices[spike_word_indices]
+        indices = ((word_indices % words_per_tick) * 32 + spike_bits +
+                   lo_atom)
+        times = word_indices // words_per_tick
+
+        order = numpy.lexsort((times, indices))
+        return numpy.column_stack((
+            indices[order], (times[order] + first_time_step) * ms_per_tick))
+
+    @staticmethod
+    def _count_spikes(spike_data, out_spike_bytes, n_atoms):
+        """ Count the spikes in the spike bitfields of one core, without\
+            decoding the id and time of each spike
+
+        :param spike_data: the bitfields, with one bitfield of\
+                    out_spike_bytes for each time step
+        :param out_spike_bytes: the number of bytes in each bitfield
+        :param n_atoms: the number of atoms of the core
+        :return: a tuple of an array of the number of spikes of each atom\
+                    and an array of the number of spikes of all of the atoms\
+                    at each time step
+        """
+        n_timesteps = len(spike_data) // out_spike_bytes
+        data = numpy.asarray(spike_data, dtype="uint8")[
+            :n_timesteps * out_spike_bytes].reshape(
+            (n_timesteps, out_spike_bytes))
+
+        # The bitfields are little-endian words, so the bits of each byte
+        # are for the next 8 atoms, with the lowest bit for the first
+        bit_counts = numpy.zeros(out_spike_bytes * 8, dtype="uint32")
+        timestep_counts = numpy.zeros(n_timesteps, dtype="uint32")
+        for first in xrange(0, n_timesteps, _COUNT_CHUNK_TIMESTEPS):
+            chunk = data[first:first + _COUNT_CHUNK_TIMESTEPS]
+            bit_counts += numpy.unpackbits(chunk, axis=1).sum(
+                axis=0, dtype="uint32")
+            timestep_counts[first:first + chunk.shape[0]] = \
+                _BITS_SET[chunk].sum(axis=1, dtype="uint32")
+        atom_counts = bit_counts.reshape((-1, 8))[:, ::-1].ravel()[:n_atoms]
+        return atom_counts, timestep_counts
+
+    def _get_spike_counts(
+            self, graph_mapper, placements, transceiver,
+            spike_recording_region, sub_vertex_out_spike_bytes_function):
+        """ Count the spikes of this vertex straight from the spike\
+            bitfields, reading the spikes of one core at a time
+
+        :return: a tuple of an array of the number of spikes of each atom\
+                    and an array of the number of spikes of all of the atoms\
+                    at each time step
+        """
+        logger.info("Counting spikes for {}".format(self._label))
+        reader = self._get_recording_reader(transceiver)
+        spike_regions = self._get_spike_recording_regions(
+            graph_mapper, placements, reader, spike_recording_region,
+            sub_vertex_out_spike_bytes_function)
+        n_time_steps = max([0] + [
+            n_bytes // out_spike_bytes
+            for (_, _, out_spike_bytes, (_, n_bytes)) in spike_regions])
+
+        atom_counts = numpy.zeros(self._n_atoms, dtype="uint32")
+        timestep_counts = numpy.zeros(n_time_steps, dtype="uint32")
+        progress_bar = ProgressBar(len(spike_regions), "Counting spikes")
+        for (subvertex_slice, placement, out_spike_bytes,
+                recording_region) in spike_regions:
+            spike_data = reader.read_recording_regions(
+                [placement], [recording_region])[0]
+            core_atom_counts, core_timestep_counts = self._count_spikes(
+                spike_data, out_spike_bytes, subvertex_slice.n_atoms)
+            atom_counts[subvertex_slice.lo_atom:
+                        subvertex_slice.hi_atom + 1] = core_atom_counts
+            timestep_counts[:core_timestep_counts.size] += \
+                core_timestep_counts
             progress_bar.update()
+        progress_bar.end()
+        return atom_counts, timestep_counts
 
+    def _get_spikes(
+            self, graph_mapper, placements, transceiver, compatible_output,
+            spike_recording_region, sub_vertex_out_spike_bytes_function):
+        """
+        Return a 2-column numpy array containing cell ids and spike times for
+        recorded cells.   This is read directly from the memory for the board.
+        """
+
+        logger.info("Getting spikes for {}".format(self._label))
+        ms_per_tick = self._machine_time_step / 1000.0
+
+        # Find where the spikes of every core are and how many there are
+        reader = self._get_recording_reader(transceiver)
+        spike_regions = self._get_spike_recording_regions(
+            graph_mapper, placements, reader, spike_recording_region,
+            sub_vertex_out_spike_bytes_function)
+
+        # Read the spikes
+        progress_bar = ProgressBar(len(spike_regions), "Getting spikes")
+        all_spike_data = reader.read_recording_regions(
+            [placement for (_, placement, _, _) in spike_regions],
+            [recording_region for (_, _, _, recording_region)
+             in spike_regions], progress_bar)
         progress_bar.end()
-        spike_ids = numpy.hstack(spike_ids)
-        spike_times = numpy.hstack(spike_times)
-        result = numpy.dstack((spike_ids, spike_times))[0]
-        return result[numpy.lexsort((spike_times, spike_ids))]
+
+        # As the cores are in order of atom, and the spikes of each are
+        # ordered by id and time, so are all the spikes
+        spikes = [numpy.zeros((0, 2))]
+        for (subvertex_slice, _, out_spike_bytes, _), spike_data in zip(
+                spike_regions, all_spike_data):
+            spikes.append(self._decode_spikes(
+                spike_data, out_spike_bytes, subvertex_slice.lo_atom,
+                ms_per_tick))
+        return numpy.vstack(spikes)
+
+    def _iter_spikes_by_core(
+            self, graph_mapper, placements, transceiver,
+            spike_recording_region, sub_vertex_out_spike_bytes_function):
+        """ Iterate over the spikes of this vertex, reading the spikes of\
+            one core at a time
+
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one for each core in order of atom, with each\
+                    ordered by id and then by time
+        """
+        logger.info("Getting spikes for {}".format(self._label))
+        ms_per_tick = self._machine_time_step / 1000.0
+        reader = self._get_recording_reader(transceiver)
+        spike_regions = self._get_spike_recording_regions(
+            graph_mapper, placements, reader, spike_recording_region,
+            sub_vertex_out_spike_bytes_function)
+
+        for (subvertex_slice, placement, out_spike_bytes,
+                recording_region) in spike_regions:
+            spike_data = reader.read_recording_regions(
+                [placement], [recording_region])[0]
+            yield self._decode_spikes(
+                spike_data, out_spike_bytes, subvertex_slice.lo_atom,
+                ms_per_tick)
+
+    def _iter_spikes(
+            self, graph_mapper, placements, transceiver,
+            spike_recording_region, sub_vertex_out_spike_bytes_function,
+            chunk_timesteps):
+        """ Iterate over the spikes of this vertex, reading chunk_timesteps\
+            time steps of every core at a time
+
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one for each chunk of time steps in order of\
+                    time, with each ordered by time and then by id
+        """
+        if chunk_timesteps < 1:
+            raise exceptions.ConfigurationException(
+                "The number of time steps in each chunk must be at least 1")
+
+        logger.info("Getting spikes for {}".format(self._label))
+        ms_per_tick = self._machine_time_step / 1000.0
+        reader = self._get_recording_reader(transceiver)
+        spike_regions = self._get_spike_recording_regions(
+            graph_mapper, placements, reader, spike_recording_region,
+            sub_vertex_out_spike_bytes_function)
+        n_time_steps = max([0] + [
+            n_bytes // out_spike_bytes
+            for (_, _, out_spike_bytes, (_, n_bytes)) in spike_regions])
+
+        for first_time_step in xrange(0, n_time_steps, chunk_timesteps):
+
+            # Work out which part of each region holds the chunk
+            chunk_regions = list()
+            for (subvertex_slice, placement, out_spike_bytes,
+                    (address, n_bytes)) in spike_regions:
+                offset = first_time_step * out_spike_bytes
+                if offset < n_bytes:
+                    chunk_regions.append((
+                        subvertex_slice, placement, out_spike_bytes,
+                        (address + offset,
+                         min(chunk_timesteps * out_spike_bytes,
+                             n_bytes - offset))))
+
+            all_spike_data = reader.read_recording_regions(
+                [placement for (_, placement, _, _) in chunk_regions],
+                [recording_region for (_, _, _, recording_region)
+                 in chunk_regions])
+            spikes = [numpy.zeros((0, 2))]
+            for (subvertex_slice, _, out_spike_bytes, _), spike_data in zip(
+                    chunk_regions, all_spike_data):
+                spikes.append(self._decode_spikes(
+                    spike_data, out_spike_bytes, subvertex_slice.lo_atom,
+                    ms_per_tick, first_time_step))
+            spikes = numpy.vstack(spikes)
+            yield spikes[numpy.lexsort((spikes[:, 0], spikes[:, 1]))]
 
     def get_neuron_parameter(
             self, region, compatible_output, has_ran, graph_mapper, placements,
-            txrx, machine_time_step, runtime):
+            txrx, machine_time_step, runtime, filename=None):
+        """ Read a recorded neuron parameter from every core of this vertex
+
+        :param filename: the name of a file to memory map the values into,\
+                    or None to hold them in memory
+        :return: the values of the parameter
+        :rtype: \
+                    :py:class:`spynnaker.pyNN.utilities.recorded_neuron_parameter.RecordedNeuronParameter`
+        """
         if not has_ran:
             raise exceptions.SpynnakerException(
                 "The simulation has not yet ran, therefore neuron param "
                 "cannot be retrieved")
 
         ms_per_tick = self._machine_time_step / 1000.0
-        n_timesteps = runtime / ms_per_tick
-
-        tempfilehandle = tempfile.NamedTemporaryFile()
-        data = numpy.memmap(
-            tempfilehandle.file, shape=(n_timesteps, self._n_atoms),
-            dtype="float64,float64,float64")
-        data["f0"] = (numpy.arange(self._n_atoms * n_timesteps) %
-                      self._n_atoms).reshape((n_timesteps, self._n_atoms))
-        data["f1"] = numpy.repeat(numpy.arange(0, n_timesteps * ms_per_tick,
-                                  ms_per_tick), self._n_atoms).reshape(
-                                      (n_timesteps, self._n_atoms))
+        n_timesteps = int(round(runtime / ms_per_tick))
+        recorded_parameter = RecordedNeuronParameter(
+            n_timesteps, self._n_atoms, ms_per_tick, filename)
 
         # Find all the sub-vertices that this pynn_population.py exists on
-        subvertices = graph_mapper.get_subvertices_from_vertex(self)
+        subvertices = list(graph_mapper.get_subvertices_from_vertex(self))
+        subvertex_placements = [
+            placements.get_placement_of_subvertex(subvertex)
+            for subvertex in subvertices]
+
+        # Find and read the values of every core
+        reader = self._get_recording_reader(txrx)
+        recording_regions = reader.get_recording_regions(
+            subvertex_placements, region)
         progress_bar = ProgressBar(len(subvertices), "Getting recorded data")
-        for subvertex in subvertices:
-            placment = placements.get_placement_of_subvertex(subvertex)
-            (x, y, p) = placment.x, placment.y, placment.p
-
-            # Get the App Data for the core
-            app_data_base_address = txrx.\
-                get_cpu_information_from_core(x, y, p).user[0]
-
-            # Get the position of the value buffer
-            neuron_param_region_base_address_offset = \
-                dsg_utility_calls.get_region_base_address_offset(
-                    app_data_base_address, region)
-            neuron_param_region_base_address_buf = txrx.read_memory(
-                x, y, neuron_param_region_base_address_offset, 4)
-            neuron_param_region_base_address = struct.unpack_from(
-                "<I", neuron_param_region_base_address_buf)[0]
-            neuron_param_region_base_address += app_data_base_address
-
-            # Read the size
-            number_of_bytes_written_buf = txrx.read_memory(
-                x, y, neuron_param_region_base_address, 4)
-
-            number_of_bytes_written = struct.unpack_from(
-                "<I", number_of_bytes_written_buf)[0]
-
-            # Read the values
-            logger.debug("Reading {} ({}) bytes starting at {}".format(
-                number_of_bytes_written, hex(number_of_bytes_written),
-                hex(neuron_param_region_base_address + 4)))
-
-            neuron_param_region_data = txrx.read_memory(
-                x, y, neuron_param_region_base_address + 4,
-                number_of_bytes_written)
+        all_region_data = reader.read_recording_regions(
+            subvertex_placements, recording_regions, progress_bar)
+        progress_bar.end()
 
+        for subvertex, neuron_param_region_data in zip(
+                subvertices, all_region_data):
             vertex_slice = graph_mapper.get_subvertex_slice(subvertex)
-
-            bytes_per_time_step = vertex_slice.n_atoms * 4
-
-            number_of_time_steps_written = \
-                number_of_bytes_written / bytes_per_time_step
+            numpy_data = numpy.asarray(
+                neuron_param_region_data, dtype="uint8").view(dtype="<i4")
+            number_of_time_steps_written = min(
+                len(numpy_data) // vertex_slice.n_atoms, n_timesteps)
 
             logger.debug("Processing {} timesteps"
                          .format(number_of_time_steps_written))
 
-            numpy_data = (numpy.asarray(
-                neuron_param_region_data, dtype="uint8").view(dtype="<i4") /
-                32767.0).reshape((n_timesteps, vertex_slice.n_atoms))
-            data["f2"][:, vertex_slice.lo_atom:vertex_slice.hi_atom + 1] =\
-                numpy_data
-            progress_bar.update()
-
-        progress_bar.end()
-        data.shape = self._n_atoms * n_timesteps
-
-        # Sort the data - apparently, using lexsort is faster, but it might
-        # consume more memory, so the option is left open for sort-in-place
-        order = numpy.lexsort((data["f1"], data["f0"]))
-        # data.sort(order=['f0', 'f1'], axis=0)
+            recorded_parameter.set_raw_values(
+                vertex_slice.lo_atom, numpy_data[
+                    :number_of_time_steps_written * vertex_slice.n_atoms]
+                .reshape((number_of_time_steps_written, vertex_slice.n_atoms)))
 
-        result = data.view(dtype="float64").reshape(
-            (self._n_atoms * n_timesteps, 3))[order]
-        return result
+        return recorded_parameter
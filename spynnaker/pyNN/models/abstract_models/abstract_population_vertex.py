@@ -41,6 +41,10 @@ class AbstractPopulationVertex(AbstractPopulationRecordableVertex,
     def weight_scale(self):
         return self._weight_scale
 
+    @staticmethod
+    def _get_out_spike_bytes(subvertex, subvertex_slice):
+        return int(ceil(subvertex_slice.n_atoms / 32.0)) * 4
+
     def get_spikes(self, txrx, placements, graph_mapper,
                    compatible_output=False):
 
@@ -48,22 +52,56 @@ class AbstractPopulationVertex(AbstractPopulationRecordableVertex,
         return self._get_spikes(
             graph_mapper=graph_mapper, placements=placements, transceiver=txrx,
             compatible_output=compatible_output,
-            sub_vertex_out_spike_bytes_function=(
-                lambda subvertex, subvertex_slice: int(ceil(
-                    subvertex_slice.n_atoms / 32.0)) * 4),
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes,
+            spike_recording_region=(constants.POPULATION_BASED_REGIONS
+                                    .SPIKE_HISTORY.value))
+
+    def iter_spikes(self, txrx, placements, graph_mapper, chunk_timesteps):
+        """ Iterate over the spikes in chunks of chunk_timesteps time steps,\
+            with each chunk a 2-column numpy array of cell ids and spike\
+            times ordered by time
+        """
+        return self._iter_spikes(
+            graph_mapper=graph_mapper, placements=placements, transceiver=txrx,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes,
+            spike_recording_region=(constants.POPULATION_BASED_REGIONS
+                                    .SPIKE_HISTORY.value),
+            chunk_timesteps=chunk_timesteps)
+
+    def iter_spikes_by_core(self, txrx, placements, graph_mapper):
+        """ Iterate over the spikes of each core in order of atom, with each\
+            a 2-column numpy array of cell ids and spike times ordered by id
+        """
+        return self._iter_spikes_by_core(
+            graph_mapper=graph_mapper, placements=placements, transceiver=txrx,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes,
+            spike_recording_region=(constants.POPULATION_BASED_REGIONS
+                                    .SPIKE_HISTORY.value))
+
+    def get_spike_counts(self, txrx, placements, graph_mapper):
+        """ Count the spikes of each atom and of each time step, without\
+            decoding the spikes
+        """
+        return self._get_spike_counts(
+            graph_mapper=graph_mapper, placements=placements, transceiver=txrx,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes,
             spike_recording_region=(constants.POPULATION_BASED_REGIONS
                                     .SPIKE_HISTORY.value))
 
     def get_v(self, has_ran, graph_mapper, placements,
-              txrx, machine_time_step, runtime, compatible_output=False):
+              txrx, machine_time_step, runtime, compatible_output=False,
+              filename=None):
         """
-        Return a 3-column numpy array containing cell ids, time, and Vm for
-        recorded cells.
+        Return the recorded Vm of every cell, as a RecordedNeuronParameter
+        holding a (n_timesteps, n_atoms) matrix of the values.
 
         :param bool gather:
             not used - inserted to match PyNN specs
         :param bool compatible_output:
             not used - inserted to match PyNN specs
+        :param str filename:
+            a file to memory map the values into, or None to hold them in
+            memory
         """
         logger.info("Getting v for {}".format(self.label))
         if not has_ran:
@@ -74,15 +112,20 @@ class AbstractPopulationVertex(AbstractPopulationRecordableVertex,
             region=constants.POPULATION_BASED_REGIONS.POTENTIAL_HISTORY.value,
             compatible_output=compatible_output, has_ran=has_ran,
             machine_time_step=machine_time_step, graph_mapper=graph_mapper,
-            placements=placements, txrx=txrx, runtime=runtime)
+            placements=placements, txrx=txrx, runtime=runtime,
+            filename=filename)
 
     def get_gsyn(self, has_ran, graph_mapper, placements, txrx,
-                 machine_time_step, runtime, compatible_output=False):
+                 machine_time_step, runtime, compatible_output=False,
+                 filename=None):
         """
-        Return a 3-column numpy array containing cell ids and synaptic
-        conductances for recorded cells.
+        Return the recorded synaptic conductances of every cell, as a
+        RecordedNeuronParameter holding a (n_timesteps, n_atoms) matrix of
+        the values.
 
         :param compatible_output:
+        :param filename: a file to memory map the values into, or None to\
+                    hold them in memory
         """
         logger.info("Getting gsyn for {}".format(self.label))
         if not has_ran:
@@ -93,7 +136,8 @@ class AbstractPopulationVertex(AbstractPopulationRecordableVertex,
             region=constants.POPULATION_BASED_REGIONS.GSYN_HISTORY.value,
             compatible_output=compatible_output, has_ran=has_ran,
             machine_time_step=machine_time_step, graph_mapper=graph_mapper,
-            placements=placements, txrx=txrx, runtime=runtime)
+            placements=placements, txrx=txrx, runtime=runtime,
+            filename=filename)
 
     def is_recordable(self):
         """ helper method for is instance
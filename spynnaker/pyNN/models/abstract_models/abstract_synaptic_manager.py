@@ -18,6 +18,7 @@ from spynnaker.pyNN.models.neural_properties import master_pop_table_generators
 from spynnaker.pyNN import exceptions
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.utilities import conf
+from spynnaker.pyNN.utilities.region_data_cache import RegionDataCache
 
 # pacman imports
 from pacman.model.partitionable_graph.abstract_partitionable_vertex \
@@ -25,7 +26,6 @@ from pacman.model.partitionable_graph.abstract_partitionable_vertex \
 
 # dsg imports
 from data_specification.enums.data_type import DataType
-from data_specification import utility_calls as dsg_utilities
 
 # general imports
 import logging
@@ -101,57 +101,8 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
         block_start_addr = write_ptr
 
         # Write the synaptic block, tracking the word count:
-        synaptic_rows = sublist.get_rows()
-        data = numpy.zeros(
-            (fixed_row_length +
-             constants.SYNAPTIC_ROW_HEADER_WORDS) *
-            sublist.get_n_rows(), dtype="uint32")
-        data.fill(0xBBCCDDEE)
-
-        for row_no, row in enumerate(synaptic_rows):
-            data_pos = ((fixed_row_length +
-                         constants.SYNAPTIC_ROW_HEADER_WORDS) *
-                        row_no)
-
-            plastic_region = row_io.get_packed_plastic_region(
-                row, weight_scales, n_synapse_type_bits)
-
-            # Write the size of the plastic region
-            data[data_pos] = plastic_region.size
-            data_pos += 1
-
-            # Write the plastic region
-            data[data_pos:(data_pos + plastic_region.size)] = plastic_region
-            data_pos += plastic_region.size
-
-            fixed_fixed_region = row_io.get_packed_fixed_fixed_region(
-                row, weight_scales, n_synapse_type_bits)
-            fixed_plastic_region = row_io.get_packed_fixed_plastic_region(
-                row, weight_scales, n_synapse_type_bits)
-
-            # Write the size of the fixed parts
-            data[data_pos] = fixed_fixed_region.size
-            data[data_pos + 1] = fixed_plastic_region.size
-            data_pos += 2
-
-            # Write the fixed fixed region
-            data[data_pos:(data_pos + fixed_fixed_region.size)] = \
-                fixed_fixed_region
-            data_pos += fixed_fixed_region.size
-
-            # As everything needs to be word aligned, add extra zero to
-            # fixed_plastic Region if it has an odd number of entries and build
-            # uint32 view of it
-            if (fixed_plastic_region.size % 2) != 0:
-                fixed_plastic_region = numpy.asarray(numpy.append(
-                    fixed_plastic_region, 0), dtype='uint16')
-            # does indeed return something (due to c fancy stuff in numpi) ABS
-
-            # noinspection PyNoneFunctionAssignment
-            fixed_plastic_region_words = fixed_plastic_region.view(
-                dtype="uint32")
-            data[data_pos:(data_pos + fixed_plastic_region_words.size)] = \
-                fixed_plastic_region_words
+        data = row_io.get_packed_synaptic_block(
+            sublist, fixed_row_length, weight_scales, n_synapse_type_bits)
 
         spec.write_array(data)
         write_ptr += data.size * 4
@@ -179,9 +130,8 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
 
             sublist = subedge.get_synapse_sublist(graph_mapper)
             max_n_words = \
-                max([graph_mapper.get_partitionable_edge_from_partitioned_edge(
-                     subedge).get_synapse_row_io().get_n_words(synapse_row)
-                    for synapse_row in sublist.get_rows()])
+                graph_mapper.get_partitionable_edge_from_partitioned_edge(
+                    subedge).get_synapse_row_io().get_max_n_words(sublist)
 
             all_syn_block_sz = \
                 self._calculate_all_synaptic_block_size(sublist,
@@ -372,22 +322,29 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
                 a good starting choice is 5.0.  Given length of simulation we
                 can set this for approximate number of saturation events
 
+        weight_mean, weight_std_dev and n_synapses_in may also be numpy
+        arrays of the same shape, in which case the bound is calculated for
+        each element at once.
+
         """
 
         # E[ number of spikes ] in a timestep
         # x /1000000.0 = conversion between microsecond to second
         average_spikes_per_timestep = (
-            float(n_synapses_in * spikes_per_second) *
-            (float(machine_timestep) / 1000000.0))
+            numpy.asarray(n_synapses_in, dtype="float") *
+            float(spikes_per_second) * (float(machine_timestep) / 1000000.0))
+        weight_mean = numpy.asarray(weight_mean, dtype="float")
+        weight_std_dev = numpy.asarray(weight_std_dev, dtype="float")
 
         # Exact variance contribution from inherent Poisson variation
         poisson_variance = average_spikes_per_timestep * (weight_mean ** 2)
 
         # Upper end of range for Poisson summation required below
         # upper_bound needs to be an integer
-        upper_bound = int(round(average_spikes_per_timestep +
-                                constants.POSSION_SIGMA_SUMMATION_LIMIT *
-                                math.sqrt(average_spikes_per_timestep)))
+        upper_bound = numpy.floor(average_spikes_per_timestep +
+                                  constants.POSSION_SIGMA_SUMMATION_LIMIT *
+                                  numpy.sqrt(average_spikes_per_timestep) +
+                                  0.5)
 
         # Closed-form exact solution for summation that gives the variance
         # contributed by weight distribution variation when modulated by
@@ -397,32 +354,39 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
         # multiplication and (2) it's actually the complement that is needed
         # i.e. 'gammaincc']
 
-        weight_variance = 0.0
-
-        if weight_std_dev > 0:
+        weight_variance = numpy.zeros(numpy.broadcast(
+            average_spikes_per_timestep, weight_std_dev).shape)
 
+        # Elements which don't meet the conditions are left with no weight
+        # variance, so ignore any numerical problems that they cause
+        with numpy.errstate(all="ignore"):
             lngamma = special.gammaln(1 + upper_bound)
 
             gammai = special.gammaincc(1 + upper_bound,
                                        average_spikes_per_timestep)
 
-            big_ratio = (math.log(average_spikes_per_timestep) * upper_bound -
-                         lngamma)
+            big_ratio = (numpy.log(average_spikes_per_timestep) *
+                         upper_bound - lngamma)
 
-            if -701.0 < big_ratio < 701.0 and big_ratio != 0.0:
+            log_weight_variance = (
+                -average_spikes_per_timestep +
+                numpy.log(average_spikes_per_timestep) +
+                2.0 * numpy.log(weight_std_dev) +
+                numpy.log(numpy.exp(average_spikes_per_timestep) * gammai -
+                          numpy.exp(big_ratio)))
 
-                log_weight_variance = (
-                    -average_spikes_per_timestep +
-                    math.log(average_spikes_per_timestep) +
-                    2.0 * math.log(weight_std_dev) +
-                    math.log(math.exp(average_spikes_per_timestep) * gammai -
-                             math.exp(big_ratio)))
+            has_weight_variance = (
+                (weight_std_dev > 0) & (-701.0 < big_ratio) &
+                (big_ratio < 701.0) & (big_ratio != 0.0) &
+                numpy.isfinite(log_weight_variance))
 
-                weight_variance = math.exp(log_weight_variance)
+            weight_variance = numpy.where(
+                has_weight_variance, numpy.exp(log_weight_variance),
+                weight_variance)
 
         # upper bound calculation -> mean + n * SD
         return ((average_spikes_per_timestep * weight_mean) +
-                (sigma * math.sqrt(poisson_variance + weight_variance)))
+                (sigma * numpy.sqrt(poisson_variance + weight_variance)))
 
     def _get_ring_buffer_totals(self, subvertex, sub_graph, graph_mapper):
         in_sub_edges = sub_graph.incoming_subedges_from_subvertex(subvertex)
@@ -442,24 +406,28 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
         total_items = numpy.zeros((n_synapse_types, vertex_slice.n_atoms))
         for subedge in in_sub_edges:
             sublist = subedge.get_synapse_sublist(graph_mapper)
-            sublist.sum_n_connections(total_items)
+            weights, square_weights, n_connections, max_weights = \
+                sublist.get_weight_statistics(n_synapse_types,
+                                              vertex_slice.n_atoms)
+            total_items += n_connections
             edge = graph_mapper.get_partitionable_edge_from_partitioned_edge(
                 subedge)
 
             if edge.synapse_dynamics is None:
 
                 # If there's no STDP maximum weight, sum the initial weights
-                sublist.max_weights(absolute_max_weights)
-                sublist.sum_weights(total_weights)
-                sublist.sum_square_weights(total_square_weights)
+                numpy.maximum(absolute_max_weights, max_weights,
+                              out=absolute_max_weights)
+                total_weights += weights
+                total_square_weights += square_weights
 
             else:
 
                 # Otherwise, sum the pathalogical case of all columns being
                 # at stdp_max_weight
-                sublist.sum_fixed_weight(total_weights, stdp_max_weight)
-                sublist.sum_fixed_weight(total_square_weights,
-                                         stdp_max_weight * stdp_max_weight)
+                total_weights += n_connections * stdp_max_weight
+                total_square_weights += (n_connections * stdp_max_weight *
+                                         stdp_max_weight)
 
         return (total_weights, total_square_weights, total_items,
                 absolute_max_weights)
@@ -483,7 +451,7 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
 
         # Get maximum weight that can go into each post-synaptic neuron per
         # synapse-type
-        max_weights = [max(t) for t in total_weights]
+        max_weights = numpy.amax(total_weights, axis=1)
 
         # Clip the total items to avoid problems finding the mean of nothing(!)
         total_items = numpy.clip(total_items, a_min=1,
@@ -498,16 +466,10 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
                              total_items),
                 total_items), a_min=0.0, a_max=numpy.finfo(float).max))
 
-        vertex_slice = graph_mapper.get_subvertex_slice(subvertex)
-        n_synapse_types = len(self.get_synapse_targets())
-        expected_weights = numpy.fromfunction(
-            numpy.vectorize(
-                lambda i, j: self._ring_buffer_expected_upper_bound(
-                    weight_means[i][j], weight_std_devs[i][j],
-                    spikes_per_second, machine_timestep, total_items[i][j],
-                    sigma)),
-            (n_synapse_types, vertex_slice.n_atoms))
-        expected_max_weights = [max(t) for t in expected_weights]
+        expected_weights = self._ring_buffer_expected_upper_bound(
+            weight_means, weight_std_devs, spikes_per_second,
+            machine_timestep, total_items, sigma)
+        expected_max_weights = numpy.amax(expected_weights, axis=1)
         max_weights = [min((w, e))
                        for w, e in zip(max_weights, expected_max_weights)]
         max_weights = [max((w, a))
@@ -592,8 +554,7 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
             row_io = associated_edge.get_synapse_row_io()
 
             # Get the maximum row length in words, excluding headers
-            max_row_length = max([row_io.get_n_words(row)
-                                 for row in sublist.get_rows()])
+            max_row_length = row_io.get_max_n_words(sublist)
 
             # Get an entry in the row length table for this length
             row_length = (self._master_pop_table_generator
@@ -647,167 +608,141 @@ class AbstractSynapticManager(AbstractProvidesIncomingEdgeConstraints):
         :param weight_scales:
         :return:
         """
+        incoming_key_combo = None
+        for subedge in subgraph.incoming_subedges_from_subvertex(
+                post_subvertex):
+            if subedge.pre_subvertex == pre_subvertex:
+                routing_info = \
+                    routing_infos.get_subedge_information_from_subedge(subedge)
+                incoming_key_combo = routing_info.keys_and_masks[0].key
+                break
 
-        synaptic_block, max_row_length = self._retrieve_synaptic_block(
-            placements, transceiver, pre_subvertex, pre_n_atoms,
-            post_subvertex, routing_infos, subgraph)
-
-        # translate the synaptic block into a sublist of synapse_row_infos
-        synapse_list = None
-        if max_row_length > 0:
-            synapse_list = \
-                self._translate_synaptic_block_from_memory(
-                    synaptic_block, pre_n_atoms, max_row_length, synapse_io,
-                    weight_scales)
-        else:
-            synapse_list = SynapticList([])
-        return synapse_list
-
-    def _translate_synaptic_block_from_memory(self, synaptic_block, n_atoms,
-                                              max_row_length, synapse_io,
-                                              weight_scales):
-        """
-        translates a collection of memory into synaptic rows
-        """
-        synaptic_list = list()
-        numpy_block = numpy.frombuffer(dtype='uint8',
-                                       buffer=synaptic_block).view(dtype='<u4')
-        position_in_block = 0
-        for atom in range(n_atoms):
-
-            # extract the 3 elements of a row (PP, FF, FP)
-            p_p_entries, f_f_entries, f_p_entries = \
-                self._extract_row_data_from_memory_block(numpy_block,
-                                                         position_in_block)
-
-            # new position in synpaptic block
-            position_in_block = ((atom + 1) *
-                                 (max_row_length +
-                                  constants.SYNAPTIC_ROW_HEADER_WORDS))
-
-            bits_reserved_for_type = self.get_n_synapse_type_bits()
-            synaptic_row = synapse_io.create_row_info_from_elements(
-                p_p_entries, f_f_entries, f_p_entries, bits_reserved_for_type,
-                weight_scales)
-
-            synaptic_list.append(synaptic_row)
-        return SynapticList(synaptic_list)
-
-    @staticmethod
-    def _extract_row_data_from_memory_block(synaptic_block, position_in_block):
-
-        """
-        extracts the 6 elements from a data block which is ordered
-        no PP, pp, No ff, NO fp, FF fp
-        """
-
-        # read in number of plastic plastic entries
-        no_plastic_plastic_entries = synaptic_block[position_in_block]
-        position_in_block += 1
-
-        # read inall the plastic entries
-        end_point = position_in_block + no_plastic_plastic_entries
-        plastic_plastic_entries = synaptic_block[position_in_block:end_point]
-
-        # update position in block
-        position_in_block = end_point
-
-        # read in number of both fixed fixed and fixed plastic
-        no_fixed_fixed = synaptic_block[position_in_block]
-        position_in_block += 1
-        no_fixed_plastic = synaptic_block[position_in_block]
-        position_in_block += 1
-
-        # read in fixed fixed
-        end_point = position_in_block + no_fixed_fixed
-        fixed_fixed_entries = synaptic_block[position_in_block:end_point]
-        position_in_block = end_point
-
-        # read in fixed plastic (fixed plastic are in 16 bits, so each int is
-        # 2 entries)
-        end_point = position_in_block + math.ceil(no_fixed_plastic / 2.0)
-        fixed_plastic_entries = \
-            synaptic_block[position_in_block:end_point].view(dtype='<u2')
-        if no_fixed_plastic % 2.0 == 1:  # remove last entry if required
-            fixed_plastic_entries = \
-                fixed_plastic_entries[0:len(fixed_plastic_entries) - 1]
-
-        # return the different entries
-        return plastic_plastic_entries, fixed_fixed_entries, \
-            fixed_plastic_entries
-
-    def _retrieve_synaptic_block(self, placements, transceiver,
-                                 pre_subvertex, pre_n_atoms,
-                                 post_subvertex, routing_infos,
-                                 subgraph):
-        """
-        reads in a synaptic block from a given processor and subvertex on the
-        machine.
-        """
-        post_placement = placements.get_placement_of_subvertex(post_subvertex)
+        return self._read_synaptic_lists_from_machine(
+            placements.get_placement_of_subvertex(post_subvertex),
+            transceiver, synapse_io,
+            [(incoming_key_combo, pre_n_atoms, weight_scales)])[0]
+
+    def get_synaptic_lists_from_machine(
+            self, placements, transceiver, post_subvertex, subedges,
+            graph_mapper, partitioned_graph, synapse_io, routing_infos):
+        """ Read the synaptic lists of a number of subedges which all end at\
+            the same subvertex.  The synaptic matrix region of the subvertex\
+            is read up to the end of the last block of any projection\
+            subedge that ends at the subvertex, in a single read, so that\
+            when reading through a cache, the lists of any other subedges\
+            ending at the subvertex are read from the cache.
+
+        :param placements: the placements of the subvertices
+        :param transceiver: the transceiver to read with, or a\
+                    RegionDataCache to read through
+        :param post_subvertex: the subvertex that the subedges end at
+        :param subedges: the subedges to read the lists of
+        :param graph_mapper: the mapping between the graphs
+        :param partitioned_graph: the graph holding the subedges
+        :param synapse_io: the reader of the rows of the subedges
+        :param routing_infos: the routing information of the subedges
+        :return: a list of synaptic lists, one for each subedge, with one\
+                    row for each row of the subedge
+        """
+        requested_subedges = set(subedges)
+        in_proj_subedges = [
+            subedge for subedge in
+            partitioned_graph.incoming_subedges_from_subvertex(post_subvertex)
+            if isinstance(subedge, ProjectionPartitionedEdge) and
+            subedge not in requested_subedges]
+
+        # Only the blocks of the requested subedges are translated; the
+        # others are just located
+        blocks = list()
+        for subedge in subedges:
+            routing_info = \
+                routing_infos.get_subedge_information_from_subedge(subedge)
+            blocks.append((routing_info.keys_and_masks[0].key,
+                           subedge.get_n_rows(graph_mapper),
+                           subedge.weight_scales))
+        for subedge in in_proj_subedges:
+            routing_info = \
+                routing_infos.get_subedge_information_from_subedge(subedge)
+            blocks.append((routing_info.keys_and_masks[0].key,
+                           subedge.get_n_rows(graph_mapper), None))
+
+        return self._read_synaptic_lists_from_machine(
+            placements.get_placement_of_subvertex(post_subvertex),
+            transceiver, synapse_io, blocks)[:len(subedges)]
+
+    def _read_synaptic_lists_from_machine(
+            self, post_placement, transceiver, synapse_io, blocks):
+        """ Reads a number of blocks from the synaptic matrix region of a\
+            core in a single read and translates each into a synaptic list
+
+        :param post_placement: the placement of the core
+        :param transceiver: the transceiver to read with, or a\
+                    RegionDataCache to read through
+        :param synapse_io: the reader of the rows of the blocks
+        :param blocks: a list of (incoming key, number of rows, weight\
+                    scales) for each block, where the weight scales are None\
+                    if the block is to be read but not translated
+        :return: a list of synaptic lists, one for each block, or None for\
+                    each block that is not translated
+        """
+        if not isinstance(transceiver, RegionDataCache):
+            transceiver = RegionDataCache(transceiver)
         post_x, post_y, post_p = \
             post_placement.x, post_placement.y, post_placement.p
 
-        # either read in the master pop table or retrieve it from storage
-        master_pop_base_mem_address, app_data_base_address = \
+        # locate the master pop table
+        master_pop_base_mem_address, _ = \
             self._master_pop_table_generator.\
             locate_master_pop_table_base_address(
                 post_x, post_y, post_p, transceiver,
                 constants.POPULATION_BASED_REGIONS.POPULATION_TABLE.value)
 
-        incoming_edges = subgraph.incoming_subedges_from_subvertex(
-            post_subvertex)
-        incoming_key_combo = None
-        for subedge in incoming_edges:
-            if subedge.pre_subvertex == pre_subvertex:
-                routing_info = \
-                    routing_infos.get_subedge_information_from_subedge(subedge)
-                keys_and_masks = routing_info.keys_and_masks
-                incoming_key_combo = keys_and_masks[0].key
-                break
-
-        maxed_row_length, synaptic_block_base_address_offset = \
-            self._master_pop_table_generator.\
-            extract_synaptic_matrix_data_location(
-                incoming_key_combo, master_pop_base_mem_address,
-                transceiver, post_x, post_y)
-
-        block = None
-        if maxed_row_length > 0:
-
-            # calculate the synaptic block size in words
-            synaptic_block_size = (pre_n_atoms * 4 *
+        # Find the offset and size of each block in the synaptic matrix
+        block_locations = list()
+        for (incoming_key_combo, n_rows, _) in blocks:
+            maxed_row_length, synaptic_block_base_address_offset = \
+                self._master_pop_table_generator.\
+                extract_synaptic_matrix_data_location(
+                    incoming_key_combo, master_pop_base_mem_address,
+                    transceiver, post_x, post_y)
+            synaptic_block_size = (n_rows * 4 *
                                    (constants.SYNAPTIC_ROW_HEADER_WORDS +
                                     maxed_row_length))
-
-            # read in the base address of the synaptic matrix in the app region
-            # table
-            synapse_region_base_address_location = \
-                dsg_utilities.get_region_base_address_offset(
-                    app_data_base_address,
-                    constants.POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX.value)
-
-            # read in the memory address of the synaptic_region base address
-            synapse_region_base_address = helpful_functions.read_data(
-                post_x, post_y, synapse_region_base_address_location, 4,
-                "<I", transceiver)
-
-            # the base address of the synaptic block in absolute terms is the app
-            # base, plus the synaptic matrix base plus the offset
-            synaptic_block_base_address = (app_data_base_address +
-                                           synapse_region_base_address +
-                                           synaptic_block_base_address_offset)
-
-            # read in and return the synaptic block
-            block = transceiver.read_memory(
-                post_x, post_y, synaptic_block_base_address,
-                synaptic_block_size)
-
-            if len(block) != synaptic_block_size:
+            block_locations.append((maxed_row_length,
+                                    synaptic_block_base_address_offset,
+                                    synaptic_block_size))
+
+        # Read the synaptic matrix up to the end of the last block
+        data_size = max([0] + [offset + size for (row_length, offset, size)
+                               in block_locations if row_length > 0])
+        data = None
+        if data_size > 0:
+            data = transceiver.read_region(
+                post_placement,
+                constants.POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX.value,
+                data_size)
+            if len(data) < data_size:
                 raise exceptions.SynapticBlockReadException(
                     "Not enough data has been read"
                     " (aka, something funkky happened)")
-        return block, maxed_row_length
+            data = numpy.frombuffer(
+                dtype="<u4", buffer=data, count=data_size // 4)
+
+        # translate each block into a synaptic list
+        n_synapse_type_bits = self.get_n_synapse_type_bits()
+        synaptic_lists = list()
+        for (_, n_rows, weight_scales), (row_length, offset, size) in zip(
+                blocks, block_locations):
+            if weight_scales is None:
+                synaptic_lists.append(None)
+            elif row_length > 0:
+                synaptic_lists.append(synapse_io.read_packed_synaptic_block(
+                    data[offset // 4:(offset + size) // 4], n_rows,
+                    row_length, weight_scales, n_synapse_type_bits))
+            else:
+                synaptic_lists.append(SynapticList.from_arrays(
+                    numpy.zeros(n_rows, dtype="int64"), [], [], [], []))
+        return synaptic_lists
 
     # inhirrted from AbstractProvidesIncomingEdgeConstraints
     def get_incoming_edge_constraints(self, partitioned_edge, graph_mapper):
@@ -1,12 +1,13 @@
 from spynnaker.pyNN.models.neural_projections.connectors.abstract_connector \
     import AbstractConnector
+from spynnaker.pyNN.models.neural_projections.connectors.seed_info \
+    import SeedInfo
 from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
 from spynnaker.pyNN.models.neural_properties.synapse_row_info \
     import SynapseRowInfo
 from spynnaker.pyNN.models.neural_properties.randomDistributions \
     import generate_parameter_array
 import numpy
-import random
 from spinn_front_end_common.utilities import exceptions
 
 
@@ -32,9 +33,13 @@ class FixedNumberPreConnector(AbstractConnector):
     :param `pyNN.Space` space:
         a Space object, needed if you wish to specify distance-
         dependent weights or delays - not implemented
+    :param `int` seed:
+        the seed of the choice of pre-synaptic neurons; the same seed always
+        gives the same choice.  If `None`, a seed is drawn from the numpy
+        random stream.
     """
     def __init__(self, n, weights=0.0, delays=1,
-                 allow_self_connections=True):
+                 allow_self_connections=True, seed=None):
         """
         Creates a new FixedNumberPreConnector
         """
@@ -42,6 +47,7 @@ class FixedNumberPreConnector(AbstractConnector):
         self._weights = float(weights)
         self._delays = int(delays)
         self._allow_self_connections = allow_self_connections
+        self._seed = seed
 
     def generate_synapse_list(
             self, presynaptic_population, postsynaptic_population, delay_scale,
@@ -64,8 +70,8 @@ class FixedNumberPreConnector(AbstractConnector):
             raise exceptions.ConfigurationException(
                 "Sample size has to be a number less than the size of the "
                 "population but greater than zero")
-        pre_synaptic_neurons = random.sample(range(0, prevertex.n_atoms),
-                                             self._n_pre)
+        pre_synaptic_neurons = SeedInfo.create(self._seed).get_rng().choice(
+            prevertex.n_atoms, self._n_pre, replace=False)
 
         for pre_atom in pre_synaptic_neurons:
 
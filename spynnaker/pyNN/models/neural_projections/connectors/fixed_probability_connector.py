@@ -1,11 +1,12 @@
 from spynnaker.pyNN.models.neural_projections.connectors.abstract_connector \
     import AbstractConnector
+from spynnaker.pyNN.models.neural_projections.connectors.seed_info \
+    import SeedInfo
 from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
-from spynnaker.pyNN.models.neural_properties.synapse_row_info \
-    import SynapseRowInfo
 from spynnaker.pyNN.models.neural_properties.randomDistributions \
     import generate_parameter_array
 from spinn_front_end_common.utilities import exceptions
+import math
 import numpy
 
 
@@ -31,9 +32,13 @@ class FixedProbabilityConnector(AbstractConnector):
     :param `pyNN.Space` space:
         a Space object, needed if you wish to specify distance-
         dependent weights or delays - not implemented
+    :param `int` seed:
+        the seed of the connections; the same seed always gives the same
+        connections between the same populations.  If `None`, a seed is
+        drawn from the numpy random stream.
     """
     def __init__(self, p_connect, weights=0.0, delays=1,
-                 allow_self_connections=True):
+                 allow_self_connections=True, seed=None):
         """
         Creates a new FixedProbabilityConnector.
         """
@@ -41,6 +46,7 @@ class FixedProbabilityConnector(AbstractConnector):
         self._weights = weights
         self._delays = delays
         self._allow_self_connections = allow_self_connections
+        self._seed = seed
 
         if not 0 <= self._p_connect <= 1:
             raise exceptions.ConfigurationException(
@@ -53,37 +59,88 @@ class FixedProbabilityConnector(AbstractConnector):
         prevertex = presynaptic_population._get_vertex
         postvertex = postsynaptic_population._get_vertex
 
-        present = (numpy.random.rand(postvertex.n_atoms * prevertex.n_atoms) <=
-                   self._p_connect)
-        ids = numpy.where(present)[0]
-        n_present = numpy.sum(present)
+        allow_self_connections = (
+            self._allow_self_connections or
+            presynaptic_population != postsynaptic_population)
 
-        source_ids = ids / postvertex.n_atoms
-        source_ids.sort()
-        target_ids = ids % postvertex.n_atoms
-        delays = generate_parameter_array(
-            self._delays, n_present, present) * delay_scale
-        weights = generate_parameter_array(
-            self._weights, n_present, present) * weight_scale
+        # Each block of sources and targets is generated from a stream of its
+        # own, and the pairs of each block of sources are then put in order
+        seed_info = SeedInfo.create(self._seed)
+        post_blocks = seed_info.get_blocks(postvertex.n_atoms)
+        source_id_blocks = list()
+        target_id_blocks = list()
+        for pre_block, pre_lo_atom, pre_hi_atom in seed_info.get_blocks(
+                prevertex.n_atoms):
+            block_source_ids = list()
+            block_target_ids = list()
+            for post_block, post_lo_atom, post_hi_atom in post_blocks:
+                n_targets = post_hi_atom - post_lo_atom
+                connected = self._generate_connected_pairs(
+                    (pre_hi_atom - pre_lo_atom) * n_targets,
+                    seed_info.get_block_rng(pre_block, post_block))
+                block_source_ids.append(connected // n_targets + pre_lo_atom)
+                block_target_ids.append(connected % n_targets + post_lo_atom)
+            block_source_ids = numpy.concatenate(block_source_ids)
+            block_target_ids = numpy.concatenate(block_target_ids)
+            order = numpy.argsort(block_source_ids, kind="mergesort")
+            source_id_blocks.append(block_source_ids[order])
+            target_id_blocks.append(block_target_ids[order])
+        source_ids = numpy.concatenate(
+            source_id_blocks + [numpy.zeros(0, dtype="int64")])
+        target_ids = numpy.concatenate(
+            target_id_blocks + [numpy.zeros(0, dtype="int64")])
 
-        pre_counts = numpy.histogram(source_ids,
-                                     numpy.arange(prevertex.n_atoms + 1))[0]
-        pre_end_idxs = numpy.cumsum(pre_counts)
-        pre_start_idxs = numpy.append(0, pre_end_idxs[:-1])
+        # Each pair is independent, so self connections can just be removed
+        if not allow_self_connections:
+            not_self = source_ids != target_ids
+            source_ids = source_ids[not_self]
+            target_ids = target_ids[not_self]
 
-        synaptic_rows = []
-        n_synapses = 0
-        for _, (start, end) in enumerate(zip(pre_start_idxs, pre_end_idxs)):
+        # The index of each connection in the full source by target matrix
+        ids = source_ids * postvertex.n_atoms + target_ids
+        delays = self._generate_parameter_array(self._delays, ids) * \
+            delay_scale
+        weights = self._generate_parameter_array(self._weights, ids) * \
+            weight_scale
 
-            this_target_ids = target_ids[start:end]
-            this_weights = weights[start:end]
-            this_delays = delays[start:end]
-            this_synapes_types = numpy.ones(
-                len(this_target_ids), dtype="uint32") * synapse_type
-            n_synapses += len(this_target_ids)
+        pre_counts = numpy.bincount(source_ids, minlength=prevertex.n_atoms)
+        return SynapticList.from_arrays(
+            pre_counts, target_ids, weights, delays, synapse_type)
 
-            synaptic_rows.append(SynapseRowInfo(
-                this_target_ids, this_weights, this_delays,
-                this_synapes_types))
+    def _generate_connected_pairs(self, n_pairs, rng):
+        """
+        Generates the indices of the connected pairs out of a number of
+        potential pairs, in order, using the given random number stream.
+        Rather than testing each pair, the gaps between connected pairs are
+        drawn from a geometric distribution, so that the time and memory
+        taken are proportional to the number of connections rather than the
+        number of pairs.
+        """
+        if n_pairs == 0 or self._p_connect == 0:
+            return numpy.zeros(0, dtype="int64")
+
+        chunks = list()
+        last_pair = -1
+        while last_pair < n_pairs:
 
-        return SynapticList(synaptic_rows)
+            # Draw a few more gaps than are expected to be needed to reach
+            # the end, so that more are rarely needed
+            n_expected = (n_pairs - last_pair - 1) * self._p_connect
+            n_gaps = int(n_expected + (5 * math.sqrt(n_expected)) + 10)
+            pairs = last_pair + numpy.cumsum(
+                rng.geometric(self._p_connect, n_gaps),
+                dtype="int64")
+            chunks.append(pairs)
+            last_pair = pairs[-1]
+        pairs = numpy.concatenate(chunks)
+        return pairs[pairs < n_pairs]
+
+    @staticmethod
+    def _generate_parameter_array(param_info, ids):
+        """
+        Returns an array of parameter values for the connections with the
+        given indices in the full source by target matrix
+        """
+        if isinstance(param_info, list):
+            return numpy.asarray(param_info)[ids]
+        return generate_parameter_array(param_info, len(ids))
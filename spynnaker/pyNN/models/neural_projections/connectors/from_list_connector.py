@@ -2,8 +2,6 @@ from spynnaker.pyNN import exceptions
 from spynnaker.pyNN.models.neural_projections.connectors.abstract_connector \
     import AbstractConnector
 from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
-from spynnaker.pyNN.models.neural_properties.synapse_row_info \
-    import SynapseRowInfo
 import logging
 import numpy
 
@@ -64,29 +62,7 @@ class FromListConnector(AbstractConnector):
         pre_counts = numpy.histogram(
             conn_list_numpy["source"], numpy.arange(prevertex.n_atoms + 1))[0]
 
-        # Take cumulative sum of these counts to get start and end indices of
-        # the blocks of connections coming from each pre-synaptic neuron
-        pre_end_idxs = numpy.cumsum(pre_counts)
-        pre_start_idxs = numpy.append(0, pre_end_idxs[:-1])
-
-        # Loop through slices of connections
-        synaptic_rows = []
-        for _, (start, end) in enumerate(zip(pre_start_idxs, pre_end_idxs)):
-
-            # Get slice
-            pre_conns = conn_list_numpy[start:end]
-
-            # Repeat synapse type correct number of times
-            synapse_type_row = numpy.empty(len(pre_conns), dtype="uint32")
-            synapse_type_row.fill(synapse_type)
-
-            # Combine post-synaptic neuron ids, weights, delays
-            # and synapse types together into synaptic row
-            synaptic_rows.append(
-                SynapseRowInfo(pre_conns["target"],
-                               pre_conns["weight"],
-                               pre_conns["delay"],
-                               synapse_type_row))
-
         # Return full synaptic list
-        return SynapticList(synaptic_rows)
+        return SynapticList.from_arrays(
+            pre_counts, conn_list_numpy["target"], conn_list_numpy["weight"],
+            conn_list_numpy["delay"], synapse_type)
@@ -1,8 +1,8 @@
 from spynnaker.pyNN.models.neural_projections.connectors.abstract_connector \
     import AbstractConnector
+from spynnaker.pyNN.models.neural_projections.connectors.seed_info \
+    import SeedInfo
 from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
-from spynnaker.pyNN.models.neural_properties.synapse_row_info \
-    import SynapseRowInfo
 from spynnaker.pyNN.models.neural_properties.randomDistributions \
     import generate_parameter_array
 import numpy
@@ -25,10 +25,14 @@ class MultapseConnector(AbstractConnector):
     :param delays:
         as `weights`. If `None`, all synaptic delays will be set
         to the global minimum delay.
+    :param seed:
+        Integer. The seed of the connections; the same seed always gives the
+        same connections between the same populations.  If `None`, a seed is
+        drawn from the numpy random stream.
 
     """
     def __init__(self, num_synapses=0, weights=0.0, delays=1,
-                 connection_array=None):
+                 connection_array=None, seed=None):
         """
         Creates a new connector.
         """
@@ -36,6 +40,7 @@ class MultapseConnector(AbstractConnector):
         self._weights = weights
         self._delays = delays
         self._connection_array = connection_array
+        self._seed = seed
 
     def generate_synapse_list(
             self, presynaptic_population, postsynaptic_population, delay_scale,
@@ -44,11 +49,37 @@ class MultapseConnector(AbstractConnector):
         prevertex = presynaptic_population._get_vertex
         postvertex = postsynaptic_population._get_vertex
 
-        source_ids = numpy.random.choice(
-            prevertex.n_atoms, size=self._num_synapses, replace=True)
-        source_ids.sort()
-        target_ids = numpy.random.choice(
-            postvertex.n_atoms, size=self._num_synapses, replace=True)
+        # Share the synapses out between the blocks of sources and targets
+        # in proportion to their size, and then choose the synapses of each
+        # block from a stream of its own
+        seed_info = SeedInfo.create(self._seed)
+        pre_blocks = seed_info.get_blocks(prevertex.n_atoms)
+        post_blocks = seed_info.get_blocks(postvertex.n_atoms)
+        block_sizes = numpy.outer(
+            [pre_hi_atom - pre_lo_atom
+             for _, pre_lo_atom, pre_hi_atom in pre_blocks],
+            [post_hi_atom - post_lo_atom
+             for _, post_lo_atom, post_hi_atom in post_blocks])
+        block_n_synapses = seed_info.get_rng().multinomial(
+            self._num_synapses,
+            block_sizes.flatten() / float(block_sizes.sum())).reshape(
+                block_sizes.shape)
+
+        source_id_blocks = [numpy.zeros(0, dtype="int64")]
+        target_id_blocks = [numpy.zeros(0, dtype="int64")]
+        for pre_block, pre_lo_atom, pre_hi_atom in pre_blocks:
+            for post_block, post_lo_atom, post_hi_atom in post_blocks:
+                n_synapses = block_n_synapses[pre_block, post_block]
+                if n_synapses > 0:
+                    rng = seed_info.get_block_rng(pre_block, post_block)
+                    source_id_blocks.append(rng.randint(
+                        pre_lo_atom, pre_hi_atom, n_synapses))
+                    target_id_blocks.append(rng.randint(
+                        post_lo_atom, post_hi_atom, n_synapses))
+        source_ids = numpy.concatenate(source_id_blocks)
+        order = numpy.argsort(source_ids, kind="mergesort")
+        source_ids = source_ids[order]
+        target_ids = numpy.concatenate(target_id_blocks)[order]
         weights = generate_parameter_array(
             self._weights, self._num_synapses, target_ids) * weight_scale
         delays = generate_parameter_array(
@@ -56,22 +87,5 @@ class MultapseConnector(AbstractConnector):
 
         pre_counts = numpy.histogram(source_ids,
                                      numpy.arange(prevertex.n_atoms + 1))[0]
-        pre_end_idxs = numpy.cumsum(pre_counts)
-        pre_start_idxs = numpy.append(0, pre_end_idxs[:-1])
-
-        synaptic_rows = []
-        n_synapses = 0
-        for _, (start, end) in enumerate(zip(pre_start_idxs, pre_end_idxs)):
-
-            this_target_ids = target_ids[start:end]
-            this_weights = weights[start:end]
-            this_delays = delays[start:end]
-            this_synapes_types = numpy.ones(
-                len(this_target_ids), dtype="uint32") * synapse_type
-            n_synapses += len(this_target_ids)
-
-            synaptic_rows.append(SynapseRowInfo(
-                this_target_ids, this_weights, this_delays,
-                this_synapes_types))
-
-        return SynapticList(synaptic_rows)
+        return SynapticList.from_arrays(
+            pre_counts, target_ids, weights, delays, synapse_type)
@@ -1,9 +1,69 @@
+import numpy
+
+# The number of atoms in each block of atoms given a stream of random numbers
+# of its own; this is fixed rather than following the partitioning, so that
+# the numbers drawn for each atom do not depend on how the populations are
+# split across cores
+BLOCK_N_ATOMS = 256
+
+
 class SeedInfo(object):
     """
     Parent seed for random numbers plus a dictionary of seeds at various
     intervals so the same stream of random numbers can be re-generated later.
+
+    Each block of pre- and post-synaptic atoms also has a stream of its own,
+    seeded from the parent seed and the position of the block, so that the
+    connections of the blocks can be generated in any order (or in parallel)
+    and still be the same.
     """
-    def __init__(self):
-        self._parent_seed = 0
+    def __init__(self, parent_seed=0):
+        self._parent_seed = parent_seed
         self._seed_stream = dict()
         self._seed_stream_indices = list()
+
+    @staticmethod
+    def create(seed=None):
+        """
+        Create seed information from a seed, or from a seed drawn from the
+        global numpy random stream if the seed is None
+
+        :param seed: an integer seed between 0 and 0xFFFFFFFF, or None
+        """
+        if seed is None:
+            seed = numpy.random.randint(0x7FFFFFFF)
+        return SeedInfo(seed)
+
+    @property
+    def parent_seed(self):
+        return self._parent_seed
+
+    @staticmethod
+    def get_blocks(n_atoms):
+        """
+        Get the blocks that a number of atoms is split into
+
+        :return: a list of the index, first atom and last atom plus one of\
+                    each block
+        """
+        return [(block, lo_atom, min(lo_atom + BLOCK_N_ATOMS, n_atoms))
+                for block, lo_atom in
+                enumerate(xrange(0, n_atoms, BLOCK_N_ATOMS))]
+
+    def get_rng(self):
+        """
+        Get the stream of random numbers of the parent seed, for choices
+        which cover whole populations
+        """
+        return numpy.random.RandomState([self._parent_seed])
+
+    def get_block_rng(self, pre_block, post_block):
+        """
+        Get the stream of random numbers of a block of pre- and
+        post-synaptic atoms
+
+        :param pre_block: the index of the block of pre-synaptic atoms
+        :param post_block: the index of the block of post-synaptic atoms
+        """
+        return numpy.random.RandomState(
+            [self._parent_seed, pre_block, post_block])
@@ -3,21 +3,13 @@ DelayPartitionableEdge
 """
 
 # spynnaker imports
-import copy
 from spynnaker.pyNN.models.neural_projections.projection_partitionable_edge \
     import ProjectionPartitionableEdge
 from spynnaker.pyNN.models.neural_projections.delay_partitioned_edge \
     import DelayPartitionedEdge
-from spynnaker.pyNN.utilities import conf
-
-# spinn front end common imports
-from spinn_front_end_common.utilities.timer import Timer
-
-# pacman imports
-from pacman.utilities.progress_bar import ProgressBar
 
 # general imports
-import math
+import numpy
 import logging
 
 
@@ -99,69 +91,27 @@ class DelayPartitionableEdge(ProjectionPartitionableEdge):
         constraints.extend(self._constraints)
         return DelayPartitionedEdge(presubvertex, postsubvertex, constraints)
 
-    def get_synaptic_list_from_machine(self, graph_mapper, partitioned_graph,
-                                       placements, transceiver, routing_infos):
+    def _set_synaptic_sublist_values(self, synaptic_list, sublist,
+                                     pre_vertex_slice, post_vertex_slice):
         """
-        Get synaptic data for all connections in this Projection from the
-        machine.
-        :param graph_mapper:
-        :param partitioned_graph:
-        :param placements:
-        :param transceiver:
-        :param routing_infos:
-        :return:
+        Sets the values of the synapses of a subedge in the synaptic list of
+        this edge to those read from the machine, where the sublist holds
+        the rows of each delay stage in turn, with delays relative to the
+        stage
         """
-        if self._stored_synaptic_data_from_machine is None:
-            logger.debug("Reading synapse data for edge between {} and {}"
-                         .format(self._pre_vertex.label,
-                                 self._post_vertex.label))
-            timer = None
-            if conf.config.getboolean("Reports", "outputTimesForSections"):
-                timer = Timer()
-                timer.start_timing()
-
-            subedges = \
-                graph_mapper.get_partitioned_edges_from_partitionable_edge(
-                    self)
-            if subedges is None:
-                subedges = list()
-
-            synaptic_list = copy.copy(self._synapse_list)
-            synaptic_list_rows = synaptic_list.get_rows()
-            progress_bar = ProgressBar(
-                len(subedges), "progress on reading back synaptic matrix")
-            for subedge in subedges:
-                n_rows = subedge.get_n_rows(graph_mapper)
-                pre_vertex_slice = \
-                    graph_mapper.get_subvertex_slice(subedge.pre_subvertex)
-                post_vertex_slice = \
-                    graph_mapper.get_subvertex_slice(subedge.post_subvertex)
-
-                sub_edge_post_vertex = \
-                    graph_mapper.get_vertex_from_subvertex(
-                        subedge.post_subvertex)
-                rows = sub_edge_post_vertex.get_synaptic_list_from_machine(
-                    placements, transceiver, subedge.pre_subvertex, n_rows,
-                    subedge.post_subvertex,
-                    self._synapse_row_io, partitioned_graph,
-                    routing_infos, subedge.weight_scales).get_rows()
-
-                for i in range(len(rows)):
-                    delay_stage = math.floor(
-                        float(i) / float(pre_vertex_slice.n_atoms)) + 1
-                    min_delay = (delay_stage *
-                                 self.pre_vertex.max_delay_per_neuron)
-                    max_delay = (min_delay +
-                                 self.pre_vertex.max_delay_per_neuron - 1)
-                    synaptic_list_rows[
-                        (i % pre_vertex_slice.n_atoms) +
-                        pre_vertex_slice.lo_atom].set_slice_values(
-                            rows[i], post_vertex_slice, min_delay, max_delay)
-                progress_bar.update()
-            progress_bar.end()
-            self._stored_synaptic_data_from_machine = synaptic_list
-
-            if conf.config.getboolean("Reports", "outputTimesForSections"):
-                timer.take_sample()
-
-        return self._stored_synaptic_data_from_machine
+        max_delay_per_neuron = self.pre_vertex.max_delay_per_neuron
+        n_stages = sublist.get_n_rows() // pre_vertex_slice.n_atoms
+
+        # Shift the delays of each stage back to the full delay
+        stage_delays = ((numpy.arange(sublist.get_n_rows()) //
+                         pre_vertex_slice.n_atoms) + 1) * max_delay_per_neuron
+        delays = sublist.delays
+        delays += numpy.repeat(stage_delays, sublist.row_lengths).astype(
+            delays.dtype)
+
+        for stage in range(n_stages):
+            min_delay = ((stage + 1) * max_delay_per_neuron) + 1
+            max_delay = ((stage + 2) * max_delay_per_neuron)
+            synaptic_list.set_slice_values(
+                sublist, pre_vertex_slice, post_vertex_slice, min_delay,
+                max_delay, first_row=stage * pre_vertex_slice.n_atoms)
@@ -48,18 +48,24 @@ class DelayPartitionedEdge(ProjectionPartitionedEdge):
                 "Delay sub-vertices can only support up to 256 incoming"
                 " neurons!")
 
-        full_delay_list = list()
+        full_delay_list = SynapticList([])
         for stage in range(0, delay_edge.num_delay_stages):
             min_delay = ((stage + 1) * delay_edge.max_delay_per_neuron) + 1
             max_delay = ((stage + 2) * delay_edge.max_delay_per_neuron)
-            delay_list = synapse_sublist.get_delay_sublist(
+            delay_list = synapse_sublist.create_delay_sublist(
                 min_delay, max_delay)
-            for row in delay_list:
-                row.delays -= (min_delay - 1)
-            full_delay_list.extend(delay_list)
+            delays = delay_list.delays
+            delays -= (min_delay - 1)
+            full_delay_list.append(delay_list)
 
-        self._synapse_sublist = SynapticList(full_delay_list)
-        self._synapse_delay_rows = len(full_delay_list)
+        if (full_delay_list.get_n_synapses() !=
+                synapse_sublist.get_n_synapses()):
+            raise exceptions.DelayExtensionException(
+                "Some of the delays are outside of the {} stages of the delay"
+                " extension".format(delay_edge.num_delay_stages))
+
+        self._synapse_sublist = full_delay_list
+        self._synapse_delay_rows = full_delay_list.get_n_rows()
 
     def free_sublist(self):
         """
@@ -13,8 +13,8 @@ from spynnaker.pyNN.models.neural_properties.synapse_dynamics.\
 
 from spinn_front_end_common.utilities.timer import Timer
 
+from collections import OrderedDict
 import logging
-import copy
 logger = logging.getLogger(__name__)
 
 
@@ -59,14 +59,8 @@ class ProjectionPartitionableEdge(MultiCastPartitionableEdge):
         :param vertex_slice: the vertex slice for this vertex which contains \
         the lo and hi atoms for this slice
         """
-        if vertex_slice is None:
-            return max([self._synapse_row_io.get_n_words(
-                synapse_row)
-                for synapse_row in self._synapse_list.get_rows()])
-        else:
-            return max([self._synapse_row_io.get_n_words(
-                synapse_row, vertex_slice)
-                for synapse_row in self._synapse_list.get_rows()])
+        return self._synapse_row_io.get_max_n_words(
+            self._synapse_list, vertex_slice=vertex_slice)
 
     def get_n_rows(self):
         """
@@ -86,6 +80,9 @@ class ProjectionPartitionableEdge(MultiCastPartitionableEdge):
         """
         Get synaptic data for all connections in this Projection from the
         machine.
+
+        :param transceiver: the transceiver to read with, or a\
+                    RegionDataCache to read through
         """
         if self._stored_synaptic_data_from_machine is None:
             timer = None
@@ -102,31 +99,34 @@ class ProjectionPartitionableEdge(MultiCastPartitionableEdge):
             if subedges is None:
                 subedges = list()
 
-            synaptic_list = copy.copy(self._synapse_list)
-            synaptic_list_rows = synaptic_list.get_rows()
+            # Group the subedges by the subvertex they end at, so that the
+            # blocks of each subvertex are read together
+            subedges_by_post_subvertex = OrderedDict()
+            for subedge in subedges:
+                subedges_by_post_subvertex.setdefault(
+                    subedge.post_subvertex, list()).append(subedge)
+
+            synaptic_list = self._synapse_list.copy()
             progress_bar = ProgressBar(
                 len(subedges), "progress on reading back synaptic matrix")
-            for subedge in subedges:
-                n_rows = subedge.get_n_rows(graph_mapper)
-                pre_vertex_slice = \
-                    graph_mapper.get_subvertex_slice(subedge.pre_subvertex)
+            for post_subvertex, post_subedges in \
+                    subedges_by_post_subvertex.iteritems():
                 post_vertex_slice = \
-                    graph_mapper.get_subvertex_slice(subedge.post_subvertex)
-
-                sub_edge_post_vertex = \
-                    graph_mapper.get_vertex_from_subvertex(
-                        subedge.post_subvertex)
-                rows = sub_edge_post_vertex.get_synaptic_list_from_machine(
-                    placements, transceiver, subedge.pre_subvertex, n_rows,
-                    subedge.post_subvertex,
-                    self._synapse_row_io, partitioned_graph,
-                    routing_infos, subedge.weight_scales).get_rows()
-
-                for i in range(len(rows)):
-                    synaptic_list_rows[
-                        i + pre_vertex_slice.lo_atom].set_slice_values(
-                            rows[i], vertex_slice=post_vertex_slice)
-                progress_bar.update()
+                    graph_mapper.get_subvertex_slice(post_subvertex)
+                post_vertex = \
+                    graph_mapper.get_vertex_from_subvertex(post_subvertex)
+                sublists = post_vertex.get_synaptic_lists_from_machine(
+                    placements, transceiver, post_subvertex, post_subedges,
+                    graph_mapper, partitioned_graph, self._synapse_row_io,
+                    routing_infos)
+
+                for subedge, sublist in zip(post_subedges, sublists):
+                    pre_vertex_slice = \
+                        graph_mapper.get_subvertex_slice(subedge.pre_subvertex)
+                    self._set_synaptic_sublist_values(
+                        synaptic_list, sublist, pre_vertex_slice,
+                        post_vertex_slice)
+                    progress_bar.update()
             progress_bar.end()
             self._stored_synaptic_data_from_machine = synaptic_list
             if conf.config.getboolean("Reports", "outputTimesForSections"):
@@ -134,6 +134,20 @@ class ProjectionPartitionableEdge(MultiCastPartitionableEdge):
 
         return self._stored_synaptic_data_from_machine
 
+    def _set_synaptic_sublist_values(self, synaptic_list, sublist,
+                                     pre_vertex_slice, post_vertex_slice):
+        """
+        Sets the values of the synapses of a subedge in the synaptic list of
+        this edge to those read from the machine
+
+        :param synaptic_list: the synaptic list of this edge
+        :param sublist: the synaptic list read for the subedge
+        :param pre_vertex_slice: the slice of the source of the subedge
+        :param post_vertex_slice: the slice of the target of the subedge
+        """
+        synaptic_list.set_slice_values(sublist, pre_vertex_slice,
+                                       post_vertex_slice)
+
     @property
     def synapse_dynamics(self):
         """
@@ -1,6 +1,13 @@
+from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN import exceptions
+
 from abc import ABCMeta
 from six import add_metaclass
 from abc import abstractmethod
+import numpy
+
+# The value that unused words at the end of each row are filled with
+_ROW_PADDING_WORD = 0xBBCCDDEE
 
 
 @add_metaclass(ABCMeta)
@@ -13,6 +20,14 @@ class AbstractSynapseRowIo(object):
         words
         """
 
+    @abstractmethod
+    def get_max_n_words(self, synaptic_list, vertex_slice=None,
+                        lo_delay=None, hi_delay=None):
+        """
+        Returns the largest total size of the fixed and plastic regions of
+        any of the rows of a synaptic list in words
+        """
+
     @abstractmethod
     def get_packed_fixed_fixed_region(self, synapse_row, weight_scale,
                                       n_synapse_type_bits):
@@ -35,6 +50,23 @@ class AbstractSynapseRowIo(object):
         Gets the plastic part of the plastic region as an array of 32-bit words
         """
 
+    @abstractmethod
+    def get_packed_synaptic_block(self, synaptic_list, row_length,
+                                  weight_scales, n_synapse_type_bits):
+        """
+        Gets all the rows of a synaptic list packed into a block of 32-bit
+        words for the synaptic matrix, with each row padded to row_length
+        words plus the row header
+        """
+
+    @abstractmethod
+    def read_packed_synaptic_block(self, block, n_rows, row_length,
+                                   weight_scales, n_synapse_type_bits):
+        """
+        Reads all the rows of a block of 32-bit words of the synaptic matrix
+        back into a synaptic list; the reverse of get_packed_synaptic_block
+        """
+
     @abstractmethod
     def create_row_info_from_elements(self, p_p_entries, f_f_entries,
                                       f_p_entries, bits_reserved_for_type,
@@ -46,3 +78,151 @@ class AbstractSynapseRowIo(object):
         p_p_entries and f_p_entries are ignored due to this model dealing with
         fixed synapses
         """
+
+    @staticmethod
+    def _get_range_indices(starts, lengths):
+        """
+        Returns the indices of every element of a set of ranges, each given
+        by a start index and a length, in order of range
+        """
+        range_offsets = numpy.cumsum(lengths) - lengths
+        return (numpy.arange(numpy.sum(lengths), dtype="int64") +
+                numpy.repeat(starts - range_offsets, lengths))
+
+    @staticmethod
+    def _pack_synaptic_block(
+            synaptic_list, row_length, plastic_header_words=0,
+            plastic_words=None, plastic_half_words=None,
+            fixed_fixed_words=None, fixed_plastic_half_words=None):
+        """
+        Packs the regions of all the rows of a synaptic list into a block
+        of 32-bit words for the synaptic matrix.  Each of the regions is
+        given as a flat array holding one value per synapse, ordered by row,
+        or None if the region is empty; half-word regions are padded with a
+        zero half-word when a row has an odd number of synapses.
+
+        :param synaptic_list: the list whose rows are to be packed
+        :param row_length: the number of words in each row, excluding the\
+                    header
+        :param plastic_header_words: the number of zero words at the start\
+                    of the plastic region of each row
+        :param plastic_words: the plastic region, with one word per synapse
+        :param plastic_half_words: the plastic region, with one half-word\
+                    per synapse
+        :param fixed_fixed_words: the fixed-fixed region, with one word per\
+                    synapse
+        :param fixed_plastic_half_words: the fixed-plastic region, with one\
+                    half-word per synapse
+        :return: the block as an array of uint32
+        """
+        n_rows = synaptic_list.get_n_rows()
+        row_lengths = synaptic_list.row_lengths
+        row_half_word_lengths = (row_lengths + 1) // 2
+        row_stride = row_length + constants.SYNAPTIC_ROW_HEADER_WORDS
+
+        n_plastic_words = numpy.empty(n_rows, dtype="int64")
+        n_plastic_words.fill(plastic_header_words)
+        if plastic_words is not None:
+            n_plastic_words += row_lengths
+        elif plastic_half_words is not None:
+            n_plastic_words += row_half_word_lengths
+        n_fixed_fixed_words = numpy.zeros(n_rows, dtype="int64")
+        if fixed_fixed_words is not None:
+            n_fixed_fixed_words += row_lengths
+        n_fixed_plastic_half_words = numpy.zeros(n_rows, dtype="int64")
+        n_fixed_plastic_words = numpy.zeros(n_rows, dtype="int64")
+        if fixed_plastic_half_words is not None:
+            n_fixed_plastic_half_words += row_lengths
+            n_fixed_plastic_words += row_half_word_lengths
+
+        if n_rows > 0 and numpy.amax(n_plastic_words + n_fixed_fixed_words +
+                                     n_fixed_plastic_words) > row_length:
+            raise exceptions.SynapticBlockGenerationException(
+                "One or more rows are too long for the row length of {}"
+                .format(row_length))
+
+        data = numpy.empty(n_rows * row_stride, dtype="uint32")
+        data.fill(_ROW_PADDING_WORD)
+        half_word_data = data.view(dtype="uint16")
+
+        # Write the plastic region, zeroing it first to get the header and
+        # any padding half-word
+        plastic_starts = numpy.arange(n_rows, dtype="int64") * row_stride + 1
+        data[plastic_starts - 1] = n_plastic_words
+        data[AbstractSynapseRowIo._get_range_indices(
+            plastic_starts, n_plastic_words)] = 0
+        plastic_starts += plastic_header_words
+        if plastic_words is not None:
+            data[AbstractSynapseRowIo._get_range_indices(
+                plastic_starts, row_lengths)] = plastic_words
+        elif plastic_half_words is not None:
+            half_word_data[AbstractSynapseRowIo._get_range_indices(
+                plastic_starts * 2, row_lengths)] = plastic_half_words
+
+        # Write the sizes of the fixed regions
+        fixed_starts = plastic_starts + n_plastic_words - plastic_header_words
+        data[fixed_starts] = n_fixed_fixed_words
+        data[fixed_starts + 1] = n_fixed_plastic_half_words
+        fixed_starts += 2
+
+        # Write the fixed-fixed region
+        if fixed_fixed_words is not None:
+            data[AbstractSynapseRowIo._get_range_indices(
+                fixed_starts, row_lengths)] = fixed_fixed_words
+
+        # Write the fixed-plastic region, again zeroing it first
+        if fixed_plastic_half_words is not None:
+            fixed_plastic_starts = fixed_starts + n_fixed_fixed_words
+            data[AbstractSynapseRowIo._get_range_indices(
+                fixed_plastic_starts, n_fixed_plastic_words)] = 0
+            half_word_data[AbstractSynapseRowIo._get_range_indices(
+                fixed_plastic_starts * 2, row_lengths)] = \
+                fixed_plastic_half_words
+
+        return data
+
+    @staticmethod
+    def _unpack_synaptic_block(block, n_rows, row_length):
+        """
+        Finds the regions of all the rows of a block of 32-bit words of the
+        synaptic matrix, in which each row is padded to row_length words plus
+        the row header; the reverse of _pack_synaptic_block
+
+        :param block: the block as an array of uint32
+        :param n_rows: the number of rows in the block
+        :param row_length: the number of words in each row, excluding the\
+                    header
+        :return: a tuple of the index of the first word of the plastic region\
+                    of each row, the number of plastic words in each row,\
+                    the index of the first fixed-fixed word of each row, the\
+                    number of fixed-fixed words in each row, the index of\
+                    the first fixed-plastic word of each row and the number\
+                    of fixed-plastic half-words in each row
+        """
+        row_stride = row_length + constants.SYNAPTIC_ROW_HEADER_WORDS
+        if len(block) < n_rows * row_stride:
+            raise exceptions.SynapticBlockReadException(
+                "The block of {} words is too small to hold {} rows of {}"
+                " words".format(len(block), n_rows, row_stride))
+
+        plastic_starts = numpy.arange(n_rows, dtype="int64") * row_stride + 1
+        n_plastic_words = block[plastic_starts - 1].astype("int64")
+        if n_rows > 0 and numpy.amax(n_plastic_words) > row_length:
+            raise exceptions.SynapticBlockReadException(
+                "One or more rows are longer than the row length of {}"
+                .format(row_length))
+
+        fixed_starts = plastic_starts + n_plastic_words
+        n_fixed_fixed_words = block[fixed_starts].astype("int64")
+        n_fixed_plastic_half_words = block[fixed_starts + 1].astype("int64")
+        if n_rows > 0 and numpy.amax(
+                n_plastic_words + n_fixed_fixed_words +
+                ((n_fixed_plastic_half_words + 1) // 2)) > row_length:
+            raise exceptions.SynapticBlockReadException(
+                "One or more rows are longer than the row length of {}"
+                .format(row_length))
+        fixed_starts += 2
+
+        return (plastic_starts, n_plastic_words, fixed_starts,
+                n_fixed_fixed_words, fixed_starts + n_fixed_fixed_words,
+                n_fixed_plastic_half_words)
@@ -4,6 +4,7 @@ from spynnaker.pyNN.models.neural_properties.synapse_dynamics.\
     abstract_rules.abstract_synapse_row_io import AbstractSynapseRowIo
 from spynnaker.pyNN.models.neural_properties.synapse_row_info import \
     SynapseRowInfo
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
 from spynnaker.pyNN import exceptions
 
 # ABS the noinspections are due to a problem mapping from non static to static
@@ -29,6 +30,13 @@ class FixedSynapseRowIO(AbstractSynapseRowIo):
         return synapse_row.get_n_connections(
             vertex_slice=vertex_slice, lo_delay=lo_delay, hi_delay=hi_delay)
 
+    # noinspection PyMethodOverriding
+    @staticmethod
+    def get_max_n_words(synaptic_list, vertex_slice=None,
+                        lo_delay=None, hi_delay=None):
+        return synaptic_list.get_max_n_connections(
+            vertex_slice=vertex_slice, lo_delay=lo_delay, hi_delay=hi_delay)
+
     # noinspection PyMethodOverriding
     @staticmethod
     def get_packed_fixed_fixed_region(synapse_row, weight_scales,
@@ -61,7 +69,7 @@ class FixedSynapseRowIO(AbstractSynapseRowIo):
 
         max_delay = (1 << (8 - n_synapse_type_bits)) - 1
         if ((len(synapse_row.delays) > 0) and
-                (max(synapse_row.delays) > max_delay)):
+                (numpy.amax(synapse_row.delays) > max_delay)):
             raise Exception("One or more delays are too large for the row")
 
         ids = synapse_row.target_indices & 0xFF
@@ -84,6 +92,40 @@ class FixedSynapseRowIO(AbstractSynapseRowIo):
                                   n_synapse_type_bits):
         return numpy.zeros(0)
 
+    # noinspection PyMethodOverriding
+    @staticmethod
+    def get_packed_synaptic_block(synaptic_list, row_length, weight_scales,
+                                  n_synapse_type_bits):
+
+        # The fixed-fixed words are packed per synapse, so the whole list
+        # can be packed in one go
+        return FixedSynapseRowIO._pack_synaptic_block(
+            synaptic_list, row_length,
+            fixed_fixed_words=FixedSynapseRowIO.get_packed_fixed_fixed_region(
+                synaptic_list, weight_scales, n_synapse_type_bits))
+
+    # noinspection PyMethodOverriding
+    @staticmethod
+    def read_packed_synaptic_block(block, n_rows, row_length, weight_scales,
+                                   n_synapse_type_bits):
+        (_, n_plastic_words, fixed_fixed_starts, n_fixed_fixed_words, _,
+         n_fixed_plastic_half_words) = \
+            FixedSynapseRowIO._unpack_synaptic_block(block, n_rows, row_length)
+        if numpy.any(n_plastic_words) or numpy.any(n_fixed_plastic_half_words):
+            raise exceptions.SynapticBlockReadException(
+                "fixed synapse rows do not contain a plastic region")
+
+        # The fixed-fixed words are unpacked per synapse, so the words of all
+        # the rows can be unpacked in one go
+        fixed_fixed_words = block[FixedSynapseRowIO._get_range_indices(
+            fixed_fixed_starts, n_fixed_fixed_words)]
+        synapses = FixedSynapseRowIO.create_row_info_from_elements(
+            numpy.zeros(0), fixed_fixed_words, numpy.zeros(0),
+            n_synapse_type_bits, weight_scales)
+        return SynapticList.from_arrays(
+            n_fixed_fixed_words, synapses.target_indices, synapses.weights,
+            synapses.delays, synapses.synapse_types)
+
     # noinspection PyMethodOverriding
     @staticmethod
     def create_row_info_from_elements(p_p_entries, f_f_entries,
@@ -4,6 +4,7 @@ from spynnaker.pyNN.models.neural_properties.synapse_dynamics.abstract_rules.\
     abstract_synapse_row_io import AbstractSynapseRowIo
 from spynnaker.pyNN.models.neural_properties.\
     synapse_row_info import SynapseRowInfo
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
 from spynnaker.pyNN import exceptions
 
 
@@ -39,6 +40,20 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
 
         return num_words
 
+    def get_max_n_words(self, synaptic_list, vertex_slice=None,
+                        lo_delay=None, hi_delay=None):
+        """
+        Returns the largest size of the fixed and plastic regions of any of
+        the rows of a synaptic list in words
+        """
+        num_synapses = synaptic_list.get_max_n_connections(
+            vertex_slice=vertex_slice, lo_delay=lo_delay, hi_delay=hi_delay)
+        num_fixed_plastic_words = num_synapses / 2
+        if (num_synapses % 2) != 0:
+            num_fixed_plastic_words += 1
+        return (num_synapses + num_fixed_plastic_words +
+                self._num_header_words)
+
     def get_packed_fixed_fixed_region(self, synapse_row, weight_scale,
                                       n_synapse_type_bits):
         """
@@ -59,7 +74,8 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
             raise Exception("One or more target indices are too large")
 
         max_delay = (1 << (8 - n_synapse_type_bits)) - 1
-        if len(synapse_row.delays) > 0 and max(synapse_row.delays) > max_delay:
+        if (len(synapse_row.delays) > 0 and
+                numpy.amax(synapse_row.delays) > max_delay):
             raise Exception("One or more delays are too large for the row")
 
         # Use dendritic delay fraction to split delay into components
@@ -85,23 +101,8 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
         """
         Gets the plastic region of the row as an array of 32-bit words
         """
-        # Convert per-synapse type weight scales to numpy and
-        # Index this to obtain per-synapse weight scales.
-        weight_scales_numpy = numpy.array(weight_scales, dtype="float")
-        synapse_weight_scales = weight_scales_numpy[synapse_row.synapse_types]
-
-        # Scale absoluate weights and convert to uint16
-        half_word_datatype = None
-        scaled_weights = None
-        if self._signed:
-            scaled_weights = numpy.rint(
-                synapse_row.weights * synapse_weight_scales).astype("int16")
-            half_word_datatype = "int16"
-        else:
-            scaled_weights = numpy.rint(
-                numpy.abs(synapse_row.weights) *
-                synapse_weight_scales).astype("uint16")
-            half_word_datatype = "uint16"
+        scaled_weights = self._get_scaled_weights(synapse_row, weight_scales)
+        half_word_datatype = scaled_weights.dtype
 
         # Interleave these with zeros and get uint32 view
         padded_weights = numpy.zeros(len(scaled_weights) * 2,
@@ -116,9 +117,78 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
         # Combine together into plastic region and return
         plastic_region = numpy.asarray(numpy.append(
             pre_synaptic_event_buffer, padded_weights_view), dtype='uint32')
-        
+
         return plastic_region
 
+    def _get_scaled_weights(self, synapse_row, weight_scales):
+        """
+        Gets the weights of the row scaled into 16-bit half-words, which are
+        signed if the weights are signed
+        """
+        # Convert per-synapse type weight scales to numpy and
+        # Index this to obtain per-synapse weight scales.
+        weight_scales_numpy = numpy.array(weight_scales, dtype="float")
+        synapse_weight_scales = weight_scales_numpy[synapse_row.synapse_types]
+
+        # Scale absoluate weights and convert to uint16
+        if self._signed:
+            return numpy.rint(
+                synapse_row.weights * synapse_weight_scales).astype("int16")
+        return numpy.rint(
+            numpy.abs(synapse_row.weights) *
+            synapse_weight_scales).astype("uint16")
+
+    def get_packed_synaptic_block(self, synaptic_list, row_length,
+                                  weight_scales, n_synapse_type_bits):
+        """
+        Gets all the rows of a synaptic list packed into a block of 32-bit
+        words for the synaptic matrix
+        """
+
+        # Each weight goes in the low half-word of a zeroed word
+        scaled_weights = self._get_scaled_weights(synaptic_list,
+                                                  weight_scales)
+        plastic_words = scaled_weights.view(dtype="uint16").astype("uint32")
+
+        return self._pack_synaptic_block(
+            synaptic_list, row_length,
+            plastic_header_words=self._num_header_words,
+            plastic_words=plastic_words,
+            fixed_plastic_half_words=self.get_packed_fixed_plastic_region(
+                synaptic_list, weight_scales, n_synapse_type_bits))
+
+    def read_packed_synaptic_block(self, block, n_rows, row_length,
+                                   weight_scales, n_synapse_type_bits):
+        """
+        Reads all the rows of a block of 32-bit words of the synaptic matrix
+        back into a synaptic list
+        """
+        (plastic_starts, _, _, n_fixed_fixed_words, fixed_plastic_starts,
+         n_fixed_plastic_half_words) = self._unpack_synaptic_block(
+            block, n_rows, row_length)
+        if numpy.any(n_fixed_fixed_words):
+            raise exceptions.SynapticBlockReadException(
+                "plastic synapse rows do not contain fixed-fixed entries")
+
+        fixed_plastic_half_words = block.view(dtype="uint16")[
+            self._get_range_indices(fixed_plastic_starts * 2,
+                                    n_fixed_plastic_half_words)]
+
+        # Each weight is in the low half-word of a word, after the header of
+        # the plastic region
+        half_word_datatype = "int16" if self._signed else "uint16"
+        weight_half_words = block.view(dtype=half_word_datatype)[
+            self._get_range_indices(
+                plastic_starts + self._num_header_words,
+                n_fixed_plastic_half_words) * 2]
+
+        synapses = self._create_row_info(
+            fixed_plastic_half_words, weight_half_words, n_synapse_type_bits,
+            weight_scales)
+        return SynapticList.from_arrays(
+            n_fixed_plastic_half_words, synapses.target_indices,
+            synapses.weights, synapses.delays, synapses.synapse_types)
+
     def create_row_info_from_elements(self, p_p_entries, f_f_entries,
                                       f_p_entries, bits_reserved_for_type,
                                       weight_scales):
@@ -133,6 +203,23 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
             raise exceptions.SynapticBlockGenerationException(
                 "plastic synapses cannot create row ios from fixed entries.")
 
+        # Get half word view of plastic region with correct signedness
+        half_word_datatype = "int16" if self._signed else "uint16"
+        half_words = p_p_entries[self._num_header_words:].view(
+            dtype=half_word_datatype)
+
+        # Slice out weight half words
+        return self._create_row_info(f_p_entries, half_words[0::2],
+                                     bits_reserved_for_type, weight_scales)
+
+    @staticmethod
+    def _create_row_info(f_p_entries, weight_half_words,
+                         bits_reserved_for_type, weight_scales):
+        """
+        Creates a row from the fixed-plastic half-word and the weight
+        half-word of each synapse
+        """
+
         # Calculate masks and convert per-synapse type weight scales to numpy
         synaptic_type_mask = (1 << bits_reserved_for_type) - 1
         delay_mask = (1 << (8 - bits_reserved_for_type)) - 1
@@ -140,21 +227,15 @@ class PlasticWeightControlSynapseRowIo(AbstractSynapseRowIo):
 
         # Extract indices, delays and synapse types from fixed-plastic region
         target_indices = f_p_entries & 0xFF
-        delays_in_ticks = (((f_p_entries >> 8) + bits_reserved_for_type) &
+        delays_in_ticks = ((f_p_entries >> (8 + bits_reserved_for_type)) &
                            delay_mask)
         synapse_types = (f_p_entries >> 8) & synaptic_type_mask
 
         # Index out per-synapse weight scales
         synapse_weight_scales = weight_scales_numpy[synapse_types]
 
-        # Get half word view of plastic region with correct signedness
-        half_word_datatype = "int16" if self._signed else "uint16"
-        half_words = p_p_entries[self._num_header_words:].view(
-            dtype=half_word_datatype)
-
-        # Slice out weight half words,
-        # Convert to float  and divide by weight scale
-        weights = half_words[0::2].astype("float") / synapse_weight_scales
+        # Convert to float and divide by weight scale
+        weights = weight_half_words.astype("float") / synapse_weight_scales
 
         return SynapseRowInfo(target_indices, weights, delays_in_ticks,
                               synapse_types)
@@ -4,6 +4,7 @@ from spynnaker.pyNN.models.neural_properties.synapse_dynamics.abstract_rules.\
     abstract_synapse_row_io import AbstractSynapseRowIo
 from spynnaker.pyNN.models.neural_properties.\
     synapse_row_info import SynapseRowInfo
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
 from spynnaker.pyNN import exceptions
 
 
@@ -35,6 +36,18 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
         # Many half words, this is the number of words!
         return num_half_words + self.num_header_words
 
+    def get_max_n_words(self, synaptic_list, vertex_slice=None,
+                        lo_delay=None, hi_delay=None):
+        """
+        Returns the largest size of the fixed and plastic regions of any of
+        the rows of a synaptic list in words
+        """
+        num_half_words = synaptic_list.get_max_n_connections(
+            vertex_slice=vertex_slice, lo_delay=lo_delay, hi_delay=hi_delay)
+        if (num_half_words % 2) != 0:
+            num_half_words += 1
+        return num_half_words + self.num_header_words
+
     def get_packed_fixed_fixed_region(self, synapse_row, weight_scale,
                                       n_synapse_type_bits):
         """
@@ -54,7 +67,8 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
             raise Exception("One or more target indices are too large")
 
         max_delay = (1 << (8 - n_synapse_type_bits)) - 1
-        if len(synapse_row.delays) > 0 and max(synapse_row.delays) > max_delay:
+        if (len(synapse_row.delays) > 0 and
+                numpy.amax(synapse_row.delays) > max_delay):
             raise Exception("One or more delays are too large for the row")
 
         # Use dendritic delay fraction to split delay into components
@@ -80,23 +94,8 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
         """
         Gets the plastic region of the row as an array of 32-bit words
         """
-        # Convert per-synapse type weight scales to numpy and
-        # Index this to obtain per-synapse weight scales.
-        weight_scales_numpy = numpy.array(weight_scales, dtype="float")
-        synapse_weight_scales = weight_scales_numpy[synapse_row.synapse_types]
-
-        # Scale weights
-        abs_weights = numpy.abs(synapse_row.weights)
-        abs_scaled_weights = numpy.rint(
-            abs_weights * synapse_weight_scales).astype("uint16")
-
-        # Check zeros
-        zero_float_weights = numpy.where(abs_weights == 0.0)[0]
-        zero_scaled_weights = numpy.where(abs_scaled_weights == 0)[0]
-        if (zero_float_weights.shape != zero_scaled_weights.shape or
-                (zero_float_weights != zero_scaled_weights).any()):
-            raise Exception(
-                "Weight scaling has reduced non-zero weights to zero")
+        abs_scaled_weights = self._get_scaled_weights(synapse_row,
+                                                      weight_scales)
 
         # As we're packing into uint32s, add extra weight if we have an odd
         # number
@@ -117,6 +116,73 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
             dtype='uint32')
         return plastic_region
 
+    @staticmethod
+    def _get_scaled_weights(synapse_row, weight_scales):
+        """
+        Gets the weights of the row scaled into 16-bit half-words
+        """
+        # Convert per-synapse type weight scales to numpy and
+        # Index this to obtain per-synapse weight scales.
+        weight_scales_numpy = numpy.array(weight_scales, dtype="float")
+        synapse_weight_scales = weight_scales_numpy[synapse_row.synapse_types]
+
+        # Scale weights
+        abs_weights = numpy.abs(synapse_row.weights)
+        abs_scaled_weights = numpy.rint(
+            abs_weights * synapse_weight_scales).astype("uint16")
+
+        # Check zeros
+        zero_float_weights = numpy.where(abs_weights == 0.0)[0]
+        zero_scaled_weights = numpy.where(abs_scaled_weights == 0)[0]
+        if (zero_float_weights.shape != zero_scaled_weights.shape or
+                (zero_float_weights != zero_scaled_weights).any()):
+            raise Exception(
+                "Weight scaling has reduced non-zero weights to zero")
+        return abs_scaled_weights
+
+    def get_packed_synaptic_block(self, synaptic_list, row_length,
+                                  weight_scales, n_synapse_type_bits):
+        """
+        Gets all the rows of a synaptic list packed into a block of 32-bit
+        words for the synaptic matrix
+        """
+        return self._pack_synaptic_block(
+            synaptic_list, row_length,
+            plastic_header_words=self.num_header_words,
+            plastic_half_words=self._get_scaled_weights(
+                synaptic_list, weight_scales),
+            fixed_plastic_half_words=self.get_packed_fixed_plastic_region(
+                synaptic_list, weight_scales, n_synapse_type_bits))
+
+    def read_packed_synaptic_block(self, block, n_rows, row_length,
+                                   weight_scales, n_synapse_type_bits):
+        """
+        Reads all the rows of a block of 32-bit words of the synaptic matrix
+        back into a synaptic list
+        """
+        (plastic_starts, _, _, n_fixed_fixed_words, fixed_plastic_starts,
+         n_fixed_plastic_half_words) = self._unpack_synaptic_block(
+            block, n_rows, row_length)
+        if numpy.any(n_fixed_fixed_words):
+            raise exceptions.SynapticBlockReadException(
+                "plastic synapse rows do not contain fixed-fixed entries")
+
+        # Gather the half-words of every row, skipping the header of the
+        # plastic region and any padding
+        half_words = block.view(dtype="uint16")
+        fixed_plastic_half_words = half_words[self._get_range_indices(
+            fixed_plastic_starts * 2, n_fixed_plastic_half_words)]
+        weight_half_words = half_words[self._get_range_indices(
+            (plastic_starts + self.num_header_words) * 2,
+            n_fixed_plastic_half_words)]
+
+        synapses = self._create_row_info(
+            fixed_plastic_half_words, weight_half_words, n_synapse_type_bits,
+            weight_scales)
+        return SynapticList.from_arrays(
+            n_fixed_plastic_half_words, synapses.target_indices,
+            synapses.weights, synapses.delays, synapses.synapse_types)
+
     def create_row_info_from_elements(self, p_p_entries, f_f_entries,
                                       f_p_entries, bits_reserved_for_type,
                                       weight_scales):
@@ -131,6 +197,23 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
             raise exceptions.SynapticBlockGenerationException(
                 "plastic synapses cannot create row ios from fixed entries.")
 
+        # Create a half-word view of plastic region without header
+        half_words = p_p_entries[self.num_header_words:].view(dtype="uint16")
+
+        # Trim off any extra half-words caused by padding
+        half_words = half_words[:len(f_p_entries)]
+
+        return self._create_row_info(f_p_entries, half_words,
+                                     bits_reserved_for_type, weight_scales)
+
+    @staticmethod
+    def _create_row_info(f_p_entries, weight_half_words,
+                         bits_reserved_for_type, weight_scales):
+        """
+        Creates a row from the fixed-plastic half-word and the weight
+        half-word of each synapse
+        """
+
         # Calculate masks and convert per-synapse type weight scales to numpy
         synaptic_type_mask = (1 << bits_reserved_for_type) - 1
         delay_mask = (1 << (8 - bits_reserved_for_type)) - 1
@@ -138,21 +221,15 @@ class PlasticWeightSynapseRowIo(AbstractSynapseRowIo):
 
         # Extract indices, delays and synapse types from fixed-plastic region
         target_indices = f_p_entries & 0xFF
-        delays_in_ticks = (((f_p_entries >> 8) + bits_reserved_for_type) &
+        delays_in_ticks = ((f_p_entries >> (8 + bits_reserved_for_type)) &
                            delay_mask)
         synapse_types = (f_p_entries >> 8) & synaptic_type_mask
 
         # Index out per-synapse weight scales
         synapse_weight_scales = weight_scales_numpy[synapse_types]
 
-        # Create a half-word view of plastic region without header
-        half_words = p_p_entries[self.num_header_words:].view(dtype="uint16")
-
-        # Trim off any extra half-words caused by padding
-        half_words = half_words[:len(f_p_entries)]
-
         # Cast to float and divide by weight scale
-        weights = half_words.astype("float") / synapse_weight_scales
+        weights = weight_half_words.astype("float") / synapse_weight_scales
 
         return SynapseRowInfo(target_indices, weights, delays_in_ticks,
                               synapse_types)
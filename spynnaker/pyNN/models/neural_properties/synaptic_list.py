@@ -1,198 +1,523 @@
-import operator
+from spynnaker.pyNN.models.neural_properties.synapse_row_info \
+    import SynapseRowInfo
+from spynnaker.pyNN import exceptions
+
+import numpy
+
+# The shift of the row of each synapse in the keys of the connection index,
+# which leaves room for any 32-bit target index below it
+_INDEX_ROW_SHIFT = 32
 
 
 class SynapticList(object):
+    """
+    A list of synaptic rows stored in compressed sparse row form; one array
+    of row offsets plus flat arrays of targets, weights, delays and synapse
+    types for every synapse in the list, ordered by row.  A copy of a list
+    shares the arrays of the list until one of them is changed
+    """
 
     def __init__(self, synaptic_rows):
         """
         Creates a list of synaptic rows
+
+        :param synaptic_rows: an iterable of SynapseRowInfo objects, one per\
+                    pre-synaptic neuron
+        """
+        synaptic_rows = list(synaptic_rows)
+        row_lengths = [row.target_indices.size for row in synaptic_rows]
+        if len(synaptic_rows) > 0:
+            self._set_arrays(
+                row_lengths,
+                numpy.concatenate([row.target_indices
+                                   for row in synaptic_rows]),
+                numpy.concatenate([row.weights for row in synaptic_rows]),
+                numpy.concatenate([row.delays for row in synaptic_rows]),
+                numpy.concatenate([row.synapse_types
+                                   for row in synaptic_rows]))
+        else:
+            self._set_arrays(row_lengths, [], [], [], [])
+
+    @staticmethod
+    def from_arrays(row_lengths, target_indices, weights, delays_in_ticks,
+                    synapse_types):
         """
-        self._synaptic_rows = synaptic_rows
+        Creates a list of synaptic rows directly from flat arrays, without
+        building an object per row
 
-    def get_max_n_connections(
+        :param row_lengths: the number of synapses in each row
+        :param target_indices: the post-synaptic neuron of each synapse,\
+                    grouped by row
+        :param weights: the weight of each synapse, grouped by row
+        :param delays_in_ticks: the delay of each synapse, grouped by row
+        :param synapse_types: the synapse type of each synapse, or a single\
+                    synapse type shared by all of the synapses
+        """
+        synaptic_list = SynapticList([])
+        synaptic_list._set_arrays(row_lengths, target_indices, weights,
+                                  delays_in_ticks, synapse_types)
+        return synaptic_list
+
+    def _set_arrays(self, row_lengths, target_indices, weights,
+                    delays_in_ticks, synapse_types):
+        self._row_offsets = numpy.zeros(len(row_lengths) + 1, dtype="int64")
+        numpy.cumsum(row_lengths, out=self._row_offsets[1:])
+        n_synapses = self._row_offsets[-1]
+
+        self._target_indices = numpy.asarray(target_indices, dtype="uint32")
+        self._weights = numpy.asarray(weights, dtype="float")
+        self._delays = numpy.asarray(delays_in_ticks, dtype="uint32")
+        if numpy.isscalar(synapse_types):
+            self._synapse_types = numpy.empty(n_synapses, dtype="uint32")
+            self._synapse_types.fill(synapse_types)
+        else:
+            self._synapse_types = numpy.asarray(synapse_types, dtype="uint32")
+
+        if (self._target_indices.size != n_synapses or
+                self._weights.size != n_synapses or
+                self._delays.size != n_synapses or
+                self._synapse_types.size != n_synapses):
+            raise exceptions.SynapticConfigurationException(
+                "The synapse arrays do not match the row lengths given")
+        self._shared = False
+        self._clear_connection_indices()
+
+    def copy(self):
+        """
+        Return a copy of this list; the copy shares the arrays of this list
+        until either list is changed, at which point the list being changed
+        takes its own copy of the arrays
+        """
+        synaptic_list = SynapticList([])
+        synaptic_list._row_offsets = self._row_offsets
+        synaptic_list._target_indices = self._target_indices
+        synaptic_list._weights = self._weights
+        synaptic_list._delays = self._delays
+        synaptic_list._synapse_types = self._synapse_types
+        synaptic_list._connection_indices = self._connection_indices
+        synaptic_list._max_n_connections = self._max_n_connections
+        synaptic_list._shared = True
+        self._shared = True
+        return synaptic_list
+
+    def _make_writable(self):
+        """
+        Takes a copy of the arrays if they are shared with another list, so
+        that the values can be changed in place
+        """
+        if self._shared:
+            self._target_indices = self._target_indices.copy()
+            self._weights = self._weights.copy()
+            self._delays = self._delays.copy()
+            self._synapse_types = self._synapse_types.copy()
+            self._shared = False
+
+    def _clear_connection_indices(self):
+        """
+        Forgets the connection indices and connection counts worked out from
+        the targets and delays, which must be done whenever they change
+        """
+        self._connection_indices = dict()
+        self._max_n_connections = dict()
+
+    @property
+    def row_offsets(self):
+        """
+        The index of the first synapse of each row in the flat arrays, with\
+        a final entry holding the total number of synapses
+        """
+        return self._row_offsets
+
+    @property
+    def row_lengths(self):
+        """
+        The number of synapses in each row
+        """
+        return numpy.diff(self._row_offsets)
+
+    @property
+    def target_indices(self):
+        return self._target_indices
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @property
+    def delays(self):
+        return self._delays
+
+    @property
+    def synapse_types(self):
+        return self._synapse_types
+
+    def get_row_indices(self):
+        """
+        Return the row (pre-synaptic neuron) of each synapse in the list
+        """
+        return numpy.repeat(numpy.arange(self.get_n_rows()),
+                            self.row_lengths)
+
+    def _get_connection_index(self, lo_delay=None, hi_delay=None):
+        """
+        Gets an index of the synapses with delays between lo_delay and
+        hi_delay (inclusive), or of all the synapses if either is None.  The
+        index is a sorted array holding a key of the row and the target of
+        each synapse, so the number of synapses in each row which target a
+        range of atoms can be found by bisection.  The index for each range
+        of delays is built the first time that it is asked for.
+        """
+        if lo_delay is None or hi_delay is None:
+            lo_delay = None
+            hi_delay = None
+        if (lo_delay, hi_delay) not in self._connection_indices:
+            keys = ((self.get_row_indices().astype("int64") <<
+                     _INDEX_ROW_SHIFT) + self._target_indices)
+            if lo_delay is not None:
+                keys = keys[(self._delays >= lo_delay) &
+                            (self._delays <= hi_delay)]
+            keys.sort()
+            self._connection_indices[(lo_delay, hi_delay)] = keys
+        return self._connection_indices[(lo_delay, hi_delay)]
+
+    def get_n_connections(
             self, vertex_slice=None, lo_delay=None, hi_delay=None):
         """
-        Return the maximum number of connections in the rows
+        Return the number of connections in each row which target atoms in
+        the vertex slice and which have delays between lo_delay and hi_delay
+        (inclusive)
         """
-        return max(map(operator.methodcaller(
-            'get_n_connections', vertex_slice, lo_delay, hi_delay),
-            self._synaptic_rows))
+        if vertex_slice is None and (lo_delay is None or hi_delay is None):
+            return self.row_lengths
+
+        lo_atom = 0
+        hi_atom = 0xFFFFFFFF
+        if vertex_slice is not None:
+            lo_atom = vertex_slice.lo_atom
+            hi_atom = vertex_slice.hi_atom
+        keys = self._get_connection_index(lo_delay, hi_delay)
+        row_keys = (numpy.arange(self.get_n_rows(), dtype="int64") <<
+                    _INDEX_ROW_SHIFT)
+        return (numpy.searchsorted(keys, row_keys + hi_atom, side="right") -
+                numpy.searchsorted(keys, row_keys + lo_atom, side="left"))
+
+    def get_max_n_connections(
+            self, vertex_slice=None, lo_delay=None, hi_delay=None):
+        """
+        Return the maximum number of connections in the rows; the answer for
+        each slice and range of delays is remembered, as the partitioner
+        asks the same question many times
+        """
+        key = (None, None, lo_delay, hi_delay)
+        if vertex_slice is not None:
+            key = (vertex_slice.lo_atom, vertex_slice.hi_atom, lo_delay,
+                   hi_delay)
+        if key not in self._max_n_connections:
+            max_n_connections = 0
+            if self.get_n_rows() > 0:
+                max_n_connections = int(numpy.amax(self.get_n_connections(
+                    vertex_slice, lo_delay, hi_delay)))
+            self._max_n_connections[key] = max_n_connections
+        return self._max_n_connections[key]
 
     def get_min_delay(self):
         """
-        Return the minimum and maximum delays in the rows
+        Return the minimum delay in the rows
         """
-        if len(self._synaptic_rows) == 0:
+        if self._delays.size == 0:
             return 0
-        min_delay = min(map(operator.methodcaller('get_min_delay'),
-                            self._synaptic_rows))
-        return min_delay
+        return numpy.amin(self._delays)
 
     def get_max_delay(self):
         """
-        Return the minimum and maximum delays in the rows
+        Return the maximum delay in the rows
         """
-        if len(self._synaptic_rows) == 0:
+        if self._delays.size == 0:
             return 0
-        max_delay = max(map(operator.methodcaller('get_max_delay'),
-                            self._synaptic_rows))
-        return max_delay
+        return numpy.amax(self._delays)
 
     def get_max_weight(self):
         """
         Return the maximum weight in the rows
         """
-        return max(map(operator.methodcaller('get_max_weight'),
-                       self._synaptic_rows))
+        if self._weights.size == 0:
+            return 0
+        return numpy.amax(numpy.abs(self._weights))
 
     def get_min_weight(self):
         """
         Return the minumum weight in the rows
         """
-        return min(map(operator.methodcaller('get_min_weight'),
-                       self._synaptic_rows))
+        if self._weights.size == 0:
+            return 0
+        return numpy.amin(numpy.abs(self._weights))
 
-    def sum_weights(self, sum_arrays):
-        """
-        Sums the weights going into each post-synaptic
-        neuron on a per-synapse type basis
+    def get_weight_statistics(self, n_synapse_types, n_atoms):
         """
-        # **TODO** numpyify
-        for row in self._synaptic_rows:
-            for i, w, s in zip(row.target_indices, row.weights,
-                               row.synapse_types):
-                sum_arrays[s][i] += abs(w)
+        Gets the statistics of the weights going into each post-synaptic
+        neuron on a per-synapse type basis, in a single pass over the synapses
 
-    def max_weights(self, max_arrays):
-        for row in self._synaptic_rows:
-            for w, s in zip(row.weights, row.synapse_types):
-                max_arrays[s] = max(max_arrays[s], abs(w))
+        :param n_synapse_types: the number of synapse types
+        :param n_atoms: the number of post-synaptic neurons
+        :return: a tuple of the sum of the absolute weights, the sum of the\
+                    squared weights and the number of connections, each as\
+                    an array of n_synapse_types by n_atoms, and the\
+                    maximum absolute weight of each synapse type
+        """
+        size = n_synapse_types * n_atoms
+        indices = (self._synapse_types.astype("int64") * n_atoms +
+                   self._target_indices)
+        abs_weights = numpy.abs(self._weights)
+        shape = (n_synapse_types, n_atoms)
 
-    def sum_square_weights(self, sum_arrays):
-        """
-        Sums the square of the weights going into each post-synaptic
-        neuron on a per-synapse type basis
-        """
-        for row in self._synaptic_rows:
-            for i, w, s in zip(row.target_indices, row.weights,
-                               row.synapse_types):
-                sum_arrays[s][i] += w * w
+        total_weights = numpy.bincount(
+            indices, weights=abs_weights, minlength=size)[:size]
+        total_square_weights = numpy.bincount(
+            indices, weights=abs_weights * abs_weights, minlength=size)[:size]
+        n_connections = numpy.bincount(indices, minlength=size)[:size]
+        max_weights = numpy.zeros(n_synapse_types)
+        numpy.maximum.at(max_weights, self._synapse_types, abs_weights)
 
-    def sum_fixed_weight(self, sum_arrays, fixed_weight):
-        """
-        Sums the weights going into each post-synaptic neuron,
-        Assuming each pre-synaptic neuron applies a fixed
-        Weight - used with a maximum weight provided by an STDP rule
-        """
-        # **TODO** numpyify
-        for row in self._synaptic_rows:
-            for i, s in zip(row.target_indices, row.synapse_types):
-                sum_arrays[s][i] += fixed_weight
-
-    def sum_n_connections(self, n_connections_arrays):
-        """
-        Sums the number of connections going into each post-synaptic neuron,
-        on a per-synapse type basis
-        """
-        for row in self._synaptic_rows:
-            for i, s in zip(row.target_indices, row.synapse_types):
-                n_connections_arrays[s][i] += 1
+        return (total_weights.reshape(shape),
+                total_square_weights.reshape(shape),
+                n_connections.reshape(shape), max_weights)
 
     def is_connected(self, from_vertex_slice, to_vertex_slice):
         """
         Return true if the rows are connected for the specified range of
         incoming and outgoing atoms
         """
-        for row in self._synaptic_rows[
-                from_vertex_slice.lo_atom:from_vertex_slice.hi_atom + 1]:
-            if row.get_n_connections(vertex_slice=to_vertex_slice) > 0:
-                return True
-        return False
+        targets = self._target_indices[
+            self._row_offsets[from_vertex_slice.lo_atom]:
+            self._row_offsets[from_vertex_slice.hi_atom + 1]]
+        return bool(numpy.any((targets >= to_vertex_slice.lo_atom) &
+                              (targets <= to_vertex_slice.hi_atom)))
 
     def get_atom_sublist(self, from_vertex_slice, to_vertex_slice):
         """
         Return a list of rows each of which represents only the information
         for atoms between lo_atom and hi_atom (inclusive)
         """
-        return map(operator.methodcaller(
-            'get_sub_row_by_atom', to_vertex_slice.lo_atom,
-            to_vertex_slice.hi_atom),
-            self._synaptic_rows[from_vertex_slice.lo_atom:
-                                from_vertex_slice.hi_atom + 1])
+        return self.create_atom_sublist(
+            from_vertex_slice, to_vertex_slice).get_rows()
 
     def get_delay_sublist(self, min_delay, max_delay):
         """
         Return a list of rows each of which represents only the information
         for atoms with delays between min_delay and max_delay (inclusive)
         """
-        return map(operator.methodcaller('get_sub_row_by_delay', min_delay,
-                                         max_delay),
-                   self._synaptic_rows)
+        return self.create_delay_sublist(min_delay, max_delay).get_rows()
+
+    def _create_masked_sublist(self, row_offsets, mask, target_offset=0):
+        """
+        Create a sub list from the rows starting at each of the given offsets,
+        keeping only the synapses which are set in the mask
+        """
+        row_lengths = numpy.diff(row_offsets)
+        start = row_offsets[0]
+        end = row_offsets[-1]
+        row_indices = numpy.repeat(numpy.arange(row_lengths.size),
+                                   row_lengths)
+        return SynapticList.from_arrays(
+            numpy.bincount(row_indices[mask], minlength=row_lengths.size),
+            self._target_indices[start:end][mask] - target_offset,
+            self._weights[start:end][mask], self._delays[start:end][mask],
+            self._synapse_types[start:end][mask])
 
     def create_atom_sublist(self, from_vertex_slice, to_vertex_slice):
         """
         Create a sub list of this list which contains only atoms
         between lo_atom and hi_atom (inclusive)
         """
-        return SynapticList(self.get_atom_sublist(from_vertex_slice,
-                                                  to_vertex_slice))
+        row_offsets = self._row_offsets[from_vertex_slice.lo_atom:
+                                        from_vertex_slice.hi_atom + 2]
+        targets = self._target_indices[row_offsets[0]:row_offsets[-1]]
+        mask = ((targets >= to_vertex_slice.lo_atom) &
+                (targets <= to_vertex_slice.hi_atom))
+        return self._create_masked_sublist(
+            row_offsets, mask, to_vertex_slice.lo_atom)
 
     def create_delay_sublist(self, min_delay, max_delay):
         """
         Create a sub list of this list which contains only atoms with delays
         between min_delay and max_delay (inclusive)
         """
-        return SynapticList(self.get_delay_sublist(min_delay, max_delay))
+        mask = (self._delays >= min_delay) & (self._delays <= max_delay)
+        return self._create_masked_sublist(self._row_offsets, mask)
+
+    def create_range_sublist(self, ranges):
+        """
+        Create a sub list of this list which contains only a range of the
+        synapses of each row
+
+        :param ranges: a slice of the synapses of each row, such as those\
+                    returned by ranges() or merge()
+        """
+        starts = numpy.array([row_range.start for row_range in ranges],
+                             dtype="int64")
+        lengths = numpy.array([row_range.stop - row_range.start
+                               for row_range in ranges], dtype="int64")
+        if starts.size != self.get_n_rows():
+            raise exceptions.SynapticConfigurationException(
+                "There must be one range for each row")
+        range_offsets = numpy.cumsum(lengths) - lengths
+        indices = (numpy.arange(numpy.sum(lengths), dtype="int64") +
+                   numpy.repeat(self._row_offsets[:-1] + starts -
+                                range_offsets, lengths))
+        return SynapticList.from_arrays(
+            lengths, self._target_indices[indices], self._weights[indices],
+            self._delays[indices], self._synapse_types[indices])
+
+    def set_slice_values(self, synaptic_list, from_vertex_slice,
+                         to_vertex_slice, lo_delay=0, hi_delay=None,
+                         first_row=0):
+        """
+        Sets the values of the synapses from the atoms in from_vertex_slice
+        to the atoms in to_vertex_slice (with delays between lo_delay and
+        hi_delay inclusive, if hi_delay is given) to the values of the
+        synapses in the rows of another list, which must hold the same
+        number of synapses for each atom, in the same order
+
+        :param synaptic_list: the list holding the values, with target\
+                    indices relative to to_vertex_slice
+        :param from_vertex_slice: the slice of rows to set
+        :param to_vertex_slice: the slice of target atoms to set
+        :param lo_delay: the lowest delay of the synapses to set
+        :param hi_delay: the highest delay of the synapses to set, or None\
+                    to set synapses with any delay
+        :param first_row: the row of synaptic_list which holds the values of\
+                    the first row of from_vertex_slice
+        """
+        row_offsets = self._row_offsets[from_vertex_slice.lo_atom:
+                                        from_vertex_slice.hi_atom + 2]
+        start = row_offsets[0]
+        end = row_offsets[-1]
+        targets = self._target_indices[start:end]
+        mask = ((targets >= to_vertex_slice.lo_atom) &
+                (targets <= to_vertex_slice.hi_atom))
+        if hi_delay is not None:
+            delays = self._delays[start:end]
+            mask &= (delays >= lo_delay) & (delays <= hi_delay)
+
+        # Check that each row matches before setting any values
+        value_row_lengths = synaptic_list.row_lengths[
+            first_row:first_row + from_vertex_slice.n_atoms]
+        row_indices = numpy.repeat(numpy.arange(row_offsets.size - 1),
+                                   numpy.diff(row_offsets))
+        if (value_row_lengths.size != from_vertex_slice.n_atoms or
+                not numpy.array_equal(
+                    numpy.bincount(row_indices[mask],
+                                   minlength=from_vertex_slice.n_atoms),
+                    value_row_lengths)):
+            raise exceptions.SynapticBlockReadException(
+                "The number of synapses in each row does not match the number"
+                " of synapses in the rows of the list")
+
+        self._make_writable()
+        positions = numpy.flatnonzero(mask) + start
+        value_start = synaptic_list.row_offsets[first_row]
+        value_end = value_start + positions.size
+        self._target_indices[positions] = (
+            synaptic_list.target_indices[value_start:value_end] +
+            to_vertex_slice.lo_atom)
+        self._weights[positions] = \
+            synaptic_list.weights[value_start:value_end]
+        self._delays[positions] = synaptic_list.delays[value_start:value_end]
+        self._synapse_types[positions] = \
+            synaptic_list.synapse_types[value_start:value_end]
+        self._clear_connection_indices()
 
     def get_rows(self):
         """
-        Return the rows to be written
+        Return the rows to be written; each row is a view on to the arrays of
+        this list, so changes made to the values in a row are made in the
+        list as well
         """
-        return self._synaptic_rows
+
+        # The rows could be used to change the targets or delays
+        self._make_writable()
+        self._clear_connection_indices()
+        return [SynapseRowInfo(self._target_indices[start:end],
+                               self._weights[start:end],
+                               self._delays[start:end],
+                               self._synapse_types[start:end])
+                for start, end in zip(self._row_offsets[:-1],
+                                      self._row_offsets[1:])]
 
     def get_n_rows(self):
         """
         Return the number of rows
         """
-        return len(self._synaptic_rows)
+        return self._row_offsets.size - 1
+
+    def get_n_synapses(self):
+        """
+        Return the total number of synapses in all the rows
+        """
+        return int(self._row_offsets[-1])
 
     def flip_weights(self):
         """
         flips the weights of each row from postive to negative and visa versa
         """
-        for _ in self._synaptic_rows:
-            map(operator.methodcaller('flip_weights'), self._synaptic_rows)
+        self._make_writable()
+        self._weights *= -1
 
     def append(self, synapse_list):
         """
         Appends a synapse list to the end of this one
         """
-        self._synaptic_rows.extend(synapse_list.synapticRows)
+        self._set_arrays(
+            numpy.append(self.row_lengths, synapse_list.row_lengths),
+            numpy.append(self._target_indices, synapse_list.target_indices),
+            numpy.append(self._weights, synapse_list.weights),
+            numpy.append(self._delays, synapse_list.delays),
+            numpy.append(self._synapse_types, synapse_list.synapse_types))
 
     def ranges(self):
         """
         Get the ranges of the current synaptic rows (start and end slice)
         """
-        return [slice(0, len(row.target_indices))
-                for row in self._synaptic_rows]
+        return [slice(0, length) for length in self.row_lengths]
 
     def merge(self, synapse_list):
         """
         Merge the synapse list with this one - must have the same number of
         rows
         """
-        if len(self._synaptic_rows) != synapse_list.get_n_rows():
+        if self.get_n_rows() != synapse_list.get_n_rows():
             raise Exception("Cannot merge lists as they have a different"
                             " number of rows")
-        ranges = list()
 
-        # the zip operator is a way to iterate over multiple things in unsion
-        for row, new_row in zip(self._synaptic_rows, synapse_list.get_rows()):
-            start_offset = len(row.target_indices)
-            row.append(new_row)
-            ranges.append(slice(start_offset, len(row.target_indices)))
-        return ranges
+        # Work out where each synapse of each list will be in the merged
+        # list; the synapses of each new row go after those of the old row
+        old_lengths = self.row_lengths
+        new_lengths = synapse_list.row_lengths
+        merged_offsets = numpy.zeros(self._row_offsets.size, dtype="int64")
+        numpy.cumsum(old_lengths + new_lengths, out=merged_offsets[1:])
+        old_positions = (numpy.arange(self._target_indices.size) +
+                         numpy.repeat(merged_offsets[:-1] -
+                                      self._row_offsets[:-1], old_lengths))
+        new_positions = (numpy.arange(synapse_list.target_indices.size) +
+                         numpy.repeat(merged_offsets[:-1] + old_lengths -
+                                      synapse_list.row_offsets[:-1],
+                                      new_lengths))
+
+        arrays = list()
+        for old_values, new_values in (
+                (self._target_indices, synapse_list.target_indices),
+                (self._weights, synapse_list.weights),
+                (self._delays, synapse_list.delays),
+                (self._synapse_types, synapse_list.synapse_types)):
+            merged = numpy.empty(merged_offsets[-1], dtype=old_values.dtype)
+            merged[old_positions] = old_values
+            merged[new_positions] = new_values
+            arrays.append(merged)
+        self._set_arrays(old_lengths + new_lengths, *arrays)
+
+        return [slice(start, end) for start, end in
+                zip(old_lengths, old_lengths + new_lengths)]
 
     def __str__(self):
-        return "synaptic list containing {} entries which are {}"\
-            .format(len(self._synaptic_rows), self._synaptic_rows)
+        return "synaptic list containing {} rows of {} synapses".format(
+            self.get_n_rows(), self.get_n_synapses())
@@ -92,6 +92,7 @@ class Population(object):
         self._record_gsyn_file = None
 
         self._spikes = None
+        self._spike_counts = None
         self._v = None
         self._gsyn = None
 
@@ -170,34 +171,114 @@ class Population(object):
                             " execute as if gather was true anyhow")
             timer = None
 
-            if not self._vertex.record:
-                raise exceptions.ConfigurationException(
-                    "This population has not been set to record spikes. "
-                    "Therefore spikes cannot be retrieved. Please set this "
-                    "vertex to record spikes before running this command.")
-
-            if not self._spinnaker.has_ran:
-                raise local_exceptions.SpynnakerException(
-                    "The simulation has not yet run, therefore spikes cannot"
-                    " be retrieved. Please execute the simulation before"
-                    " running this command")
+            self._check_spikes_can_be_retrieved()
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer = Timer()
                 timer.start_timing()
-            self._spikes = self._vertex.get_spikes(
-                txrx=self._spinnaker.transceiver,
-                placements=self._spinnaker.placements,
-                graph_mapper=self._spinnaker.graph_mapper,
-                compatible_output=compatible_output)
+            if self._spinnaker.host_emulator is not None:
+                self._spikes = self._spinnaker.host_emulator.get_spikes(
+                    self._vertex)
+            else:
+                self._spikes = self._vertex.get_spikes(
+                    txrx=self._spinnaker.transceiver,
+                    placements=self._spinnaker.placements,
+                    graph_mapper=self._spinnaker.graph_mapper,
+                    compatible_output=compatible_output)
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer.take_sample()
         return self._spikes
 
+    def iter_spikes(self, chunk_timesteps=1000):
+        """
+        Iterate over the recorded spikes in chunks of time, reading only one
+        chunk from the board at a time so that long recordings can be
+        processed with bounded memory.
+
+        :param int chunk_timesteps:
+            the number of machine time steps in each chunk
+        :return:
+            an iterable of 2-column numpy arrays containing cell ids and spike
+            times, one per chunk in order of time, each ordered by time and
+            then by cell id
+        """
+        self._check_spikes_can_be_retrieved()
+        if self._spinnaker.host_emulator is not None:
+            return self._spinnaker.host_emulator.iter_spikes(
+                self._vertex, chunk_timesteps)
+        return self._vertex.iter_spikes(
+            txrx=self._spinnaker.transceiver,
+            placements=self._spinnaker.placements,
+            graph_mapper=self._spinnaker.graph_mapper,
+            chunk_timesteps=chunk_timesteps)
+
+    def iter_spikes_by_core(self):
+        """
+        Iterate over the recorded spikes of each core that the population is
+        on, reading only one core from the board at a time.
+
+        :return:
+            an iterable of 2-column numpy arrays containing cell ids and spike
+            times, one per core in order of cell id, each ordered by cell id
+            and then by time
+        """
+        self._check_spikes_can_be_retrieved()
+        if self._spinnaker.host_emulator is not None:
+            return self._spinnaker.host_emulator.iter_spikes_by_core(
+                self._vertex)
+        return self._vertex.iter_spikes_by_core(
+            txrx=self._spinnaker.transceiver,
+            placements=self._spinnaker.placements,
+            graph_mapper=self._spinnaker.graph_mapper)
+
+    def _check_spikes_can_be_retrieved(self):
+        if not self._vertex.record:
+            raise exceptions.ConfigurationException(
+                "This population has not been set to record spikes. "
+                "Therefore spikes cannot be retrieved. Please set this "
+                "vertex to record spikes before running this command.")
+
+        if not self._spinnaker.has_ran:
+            raise local_exceptions.SpynnakerException(
+                "The simulation has not yet run, therefore spikes cannot"
+                " be retrieved. Please execute the simulation before"
+                " running this command")
+
+    def _get_spike_counts(self):
+        """
+        Count the spikes of each neuron and of each time step straight from
+        the recorded spike bitfields, without decoding the spikes.
+        """
+        if self._spike_counts is None:
+            self._check_spikes_can_be_retrieved()
+            if self._spinnaker.host_emulator is not None:
+                self._spike_counts = \
+                    self._spinnaker.host_emulator.get_spike_counts(
+                        self._vertex)
+            else:
+                self._spike_counts = self._vertex.get_spike_counts(
+                    txrx=self._spinnaker.transceiver,
+                    placements=self._spinnaker.placements,
+                    graph_mapper=self._spinnaker.graph_mapper)
+        return self._spike_counts
+
     def get_spike_counts(self, gather=True):
         """
         Returns the number of spikes for each neuron.
         """
-        raise NotImplementedError
+        neuron_counts, _ = self._get_spike_counts()
+        return dict(enumerate(neuron_counts.tolist()))
+
+    def get_population_rate(self, gather=True):
+        """
+        Return a 2-column numpy array containing the time of each time step
+        and the mean firing rate of the neurons in that time step, in spikes
+        per second.
+        """
+        _, timestep_counts = self._get_spike_counts()
+        ms_per_tick = self._spinnaker.machine_time_step / 1000.0
+        return numpy.column_stack((
+            numpy.arange(timestep_counts.size) * ms_per_tick,
+            timestep_counts * (1000.0 / (ms_per_tick * self._size))))
 
     # noinspection PyUnusedLocal
     def get_gsyn(self, gather=True, compatible_output=False):
@@ -206,7 +287,23 @@ class Population(object):
         conductances for recorded cells.
 
         """
-        if self._gsyn is None:
+        return self.get_gsyn_native().compatible_output
+
+    def get_gsyn_native(self, filename=None):
+        """
+        Return the synaptic conductances of the recorded cells in the layout
+        in which they are recorded, without building the 3-column array.
+
+        :param str filename:
+            a file to memory map the values into, or None to hold them in
+            memory
+        :return:
+            the recorded values, with ``values`` being a (n_timesteps,
+            n_atoms) matrix and ``times`` and ``ids`` giving its axes
+        :rtype: \
+            :py:class:`spynnaker.pyNN.utilities.recorded_neuron_parameter.RecordedNeuronParameter`
+        """
+        if self._gsyn is None or filename is not None:
             if not self._vertex.record_gsyn:
                 raise exceptions.ConfigurationException(
                     "This population has not been set to record gsyn. "
@@ -222,14 +319,17 @@ class Population(object):
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer = Timer()
                 timer.start_timing()
-            self._gsyn = self._vertex.get_gsyn(
-                has_ran=self._spinnaker.has_ran,
-                txrx=self._spinnaker.transceiver,
-                placements=self._spinnaker.placements,
-                machine_time_step=self._spinnaker.machine_time_step,
-                graph_mapper=self._spinnaker.graph_mapper,
-                compatible_output=compatible_output,
-                runtime=self._spinnaker._runtime)
+            if self._spinnaker.host_emulator is not None:
+                self._gsyn = self._spinnaker.host_emulator.get_gsyn(
+                    self._vertex, filename=filename)
+            else:
+                self._gsyn = self._vertex.get_gsyn(
+                    has_ran=self._spinnaker.has_ran,
+                    txrx=self._spinnaker.transceiver,
+                    placements=self._spinnaker.placements,
+                    machine_time_step=self._spinnaker.machine_time_step,
+                    graph_mapper=self._spinnaker.graph_mapper,
+                    runtime=self._spinnaker._runtime, filename=filename)
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer.take_sample()
         return self._gsyn
@@ -247,7 +347,23 @@ class Population(object):
             not used - inserted to match PyNN specs
         :type compatible_output: bool
         """
-        if self._v is None:
+        return self.get_v_native().compatible_output
+
+    def get_v_native(self, filename=None):
+        """
+        Return the Vm of the recorded cells in the layout in which it is
+        recorded, without building the 3-column array.
+
+        :param str filename:
+            a file to memory map the values into, or None to hold them in
+            memory
+        :return:
+            the recorded values, with ``values`` being a (n_timesteps,
+            n_atoms) matrix and ``times`` and ``ids`` giving its axes
+        :rtype: \
+            :py:class:`spynnaker.pyNN.utilities.recorded_neuron_parameter.RecordedNeuronParameter`
+        """
+        if self._v is None or filename is not None:
             if not self._vertex.record_v:
                 raise exceptions.ConfigurationException(
                     "This population has not been set to record v. "
@@ -264,14 +380,17 @@ class Population(object):
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer = Timer()
                 timer.start_timing()
-            self._v = self._vertex.get_v(
-                has_ran=self._spinnaker.has_ran,
-                txrx=self._spinnaker.transceiver,
-                placements=self._spinnaker.placements,
-                machine_time_step=self._spinnaker.machine_time_step,
-                graph_mapper=self._spinnaker.graph_mapper,
-                compatible_output=compatible_output,
-                runtime=self._spinnaker._runtime)
+            if self._spinnaker.host_emulator is not None:
+                self._v = self._spinnaker.host_emulator.get_v(
+                    self._vertex, filename=filename)
+            else:
+                self._v = self._vertex.get_v(
+                    has_ran=self._spinnaker.has_ran,
+                    txrx=self._spinnaker.transceiver,
+                    placements=self._spinnaker.placements,
+                    machine_time_step=self._spinnaker.machine_time_step,
+                    graph_mapper=self._spinnaker.graph_mapper,
+                    runtime=self._spinnaker._runtime, filename=filename)
 
             if conf.config.getboolean("Reports", "outputTimesForSections"):
                 timer.take_sample()
@@ -352,7 +471,8 @@ class Population(object):
         """
         Returns the mean number of spikes per neuron.
         """
-        raise NotImplementedError
+        neuron_counts, _ = self._get_spike_counts()
+        return float(neuron_counts.mean())
 
     def nearest(self, position):
         """
@@ -452,14 +572,19 @@ class Population(object):
     def printSpikes(self, filename, gather=True):
         """ Write spike time information from the population to a given file.
         :param filename: the absoluete file path for where the spikes are to\
-                    be printed in
+                    be printed in; if this ends in .npy or .npz, the spikes\
+                    are written as a binary numpy array of the same columns
         :param gather: Supported from the PyNN language, but ignored here
         """
         if not gather:
             logger.warn("Spynnaker only supports gather = true, will execute"
                         " as if gather was true anyhow")
         spikes = self.getSpikes(compatible_output=True)
-        if spikes is not None:
+        if spikes is not None and utility_calls.is_binary_data_file(filename):
+            utility_calls.write_binary_data_file(
+                filename, [spikes[:, [1, 0]]], spikes.shape[0], 2, 0,
+                self._vertex.n_atoms)
+        elif spikes is not None:
             first_id = 0
             num_neurons = self._vertex.n_atoms
             dimensions = self._vertex.n_atoms
@@ -477,10 +602,15 @@ class Population(object):
     def print_gsyn(self, filename, gather=True):
         """ Write conductance information from the population to a given file.
         :param filename: the absoluete file path for where the gsyn are to be\
-                    printed in
+                    printed in; if this ends in .npy or .npz, the gsyn are\
+                    written as a binary numpy array of the same columns
         :param gather: Supported from the PyNN language, but ignored here
         """
         time_step = (self._spinnaker.machine_time_step * 1.0) / 1000.0
+        if utility_calls.is_binary_data_file(filename):
+            self._write_binary_neuron_parameter(
+                filename, self.get_gsyn_native(), time_step)
+            return
         gsyn = self.get_gsyn(gather, compatible_output=True)
         first_id = 0
         num_neurons = self._vertex.n_atoms
@@ -501,10 +631,15 @@ class Population(object):
         """ Write membrane potential information from the population to a\
             given file.
         :param filename: the absolute file path for where the voltage are to\
-                     be printed in
+                     be printed in; if this ends in .npy or .npz, the voltage\
+                     are written as a binary numpy array of the same columns
         :param gather: Supported from the PyNN language, but ignored here
         """
         time_step = (self._spinnaker.machine_time_step * 1.0) / 1000.0
+        if utility_calls.is_binary_data_file(filename):
+            self._write_binary_neuron_parameter(
+                filename, self.get_v_native(), time_step)
+            return
         v = self.get_v(gather, compatible_output=True)
         utility_calls.check_directory_exists_and_create_if_not(filename)
         file_handle = open(filename, "w")
@@ -520,6 +655,16 @@ class Population(object):
             file_handle.write("{}\t{}\t{}\n".format(time, neuronId, value))
         file_handle.close()
 
+    def _write_binary_neuron_parameter(self, filename, recorded, time_step):
+        """ Write the values of a recorded neuron parameter to a binary file,\
+            a chunk of atoms at a time, in the columns of the text files
+        """
+        utility_calls.write_binary_data_file(
+            filename, (rows[:, [1, 0, 2]]
+                       for rows in recorded.iter_compatible_output()),
+            recorded.n_atoms * recorded.n_timesteps, 3, 0,
+            self._vertex.n_atoms, time_step)
+
     def rset(self, parametername, rand_distr):
         """
         'Random' set. Set the value of parametername to a value taken from
@@ -18,7 +18,6 @@ from spynnaker.pyNN.models.neural_projections\
     import DelayAfferentPartitionableEdge
 from spynnaker.pyNN.models.neural_projections.delay_partitionable_edge \
     import DelayPartitionableEdge
-from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
 
 from spinn_front_end_common.utilities import exceptions
 
@@ -26,7 +25,6 @@ from spinn_front_end_common.utilities import exceptions
 import logging
 import math
 import numpy
-import copy
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +83,7 @@ class Projection(object):
                 presynaptic_population, postsynaptic_population,
                 1000.0 / machine_time_step,
                 postsynaptic_population._get_vertex.weight_scale, synapse_type)
-        self._host_based_synapse_list = copy.deepcopy(synapse_list)
+        self._host_based_synapse_list = synapse_list.copy()
 
         # If there are some negative weights
         if synapse_list.get_min_weight() < 0:
@@ -98,7 +96,7 @@ class Projection(object):
 
             # Otherwise, the weights are all negative, so invert them(!)
             else:
-                synapse_list.flip()
+                synapse_list.flip_weights()
 
         # Set any weight scaling for STDP
         if synapse_dynamics is not None:
@@ -165,8 +163,8 @@ class Projection(object):
                 self._projection_list_ranges = synapse_list.ranges()
 
     def _find_existing_edge(self, presynaptic_vertex, postsynaptic_vertex):
-        """ searches though the partitionable graph's edges to locate any
-        edge which has the same post and pre vertex
+        """ looks up any edge in the partitionable graph which has the same
+        post and pre vertex
 
         :param presynaptic_vertex: the source partitionable vertex of the
         multapse
@@ -178,12 +176,8 @@ class Projection(object):
         pacman.model.partitionable_graph.abstract_partitionable_vertex
         :return: None or the edge going to these vertices.
         """
-        graph_edges = self._spinnaker.partitionable_graph.edges
-        for edge in graph_edges:
-            if ((edge.pre_vertex == presynaptic_vertex) and
-                    (edge.post_vertex == postsynaptic_vertex)):
-                return edge
-        return None
+        return self._spinnaker.get_edge(presynaptic_vertex,
+                                        postsynaptic_vertex)
 
     def _add_delay_extension(self, num_src_neurons, max_delay_for_projection,
                              max_delay_per_neuron, original_synapse_list,
@@ -309,31 +303,22 @@ class Projection(object):
                 "the gather param has no meaning for spinnaker when set to "
                 "false")
 
-        if (self._spinnaker.has_ran and not
-                self._has_retrieved_synaptic_list_from_machine):
+        if (self._spinnaker.has_ran and
+                self._spinnaker.host_emulator is None and
+                not self._has_retrieved_synaptic_list_from_machine):
             self._retrieve_synaptic_data_from_machine()
 
+        synapse_list = self._host_based_synapse_list
+        delays = synapse_list.delays * (
+            float(self._spinnaker.machine_time_step) / 1000.0)
         if format == 'list':
-            delays = list()
-            for row in self._host_based_synapse_list.get_rows():
-                delays.extend(
-                    numpy.asarray(
-                        row.delays * (
-                            float(self._spinnaker.machine_time_step) / 1000.0),
-                        dtype=float))
-            return delays
-
-        delays = numpy.zeros((self._projection_edge.pre_vertex.n_atoms,
-                              self._projection_edge.post_vertex.n_atoms))
-        rows = self._host_based_synapse_list.get_rows()
-        for pre_atom in range(len(rows)):
-            row = rows[pre_atom]
-            for i in xrange(len(row.target_indices)):
-                post_atom = row.target_indices[i]
-                delay = (float(row.delays[i]) *
-                         (float(self._spinnaker.machine_time_step) / 1000.0))
-                delays[pre_atom][post_atom] = delay
-        return delays
+            return list(delays)
+
+        delay_array = numpy.zeros((self._projection_edge.pre_vertex.n_atoms,
+                                   self._projection_edge.post_vertex.n_atoms))
+        delay_array[synapse_list.get_row_indices(),
+                    synapse_list.target_indices] = delays
+        return delay_array
 
     # noinspection PyPep8Naming
     def getSynapseDynamics(self, parameter_name, list_format='list',
@@ -362,27 +347,22 @@ class Projection(object):
                 "the gather param has no meaning for spinnaker when set to "
                 "false")
 
-        if (self._spinnaker.has_ran and not
-                self._has_retrieved_synaptic_list_from_machine):
+        if (self._spinnaker.has_ran and
+                self._spinnaker.host_emulator is None and
+                not self._has_retrieved_synaptic_list_from_machine):
             self._retrieve_synaptic_data_from_machine()
 
+        synapse_list = self._host_based_synapse_list
+        weights = synapse_list.weights / self._weight_scale
         if format == 'list':
-            weights = list()
-            for row in self._host_based_synapse_list.get_rows():
-                weights.extend(row.weights / self._weight_scale)
-            return weights
-
-        weights = numpy.empty((self._projection_edge.pre_vertex.n_atoms,
-                               self._projection_edge.post_vertex.n_atoms))
-        weights.fill(numpy.nan)
-        rows = self._host_based_synapse_list.get_rows()
-        for pre_atom in range(len(rows)):
-            row = rows[pre_atom]
-            for i in xrange(len(row.target_indices)):
-                post_atom = row.target_indices[i]
-                weight = row.weights[i]
-                weights[pre_atom][post_atom] = weight / self._weight_scale
-        return weights
+            return list(weights)
+
+        weight_array = numpy.empty((self._projection_edge.pre_vertex.n_atoms,
+                                    self._projection_edge.post_vertex.n_atoms))
+        weight_array.fill(numpy.nan)
+        weight_array[synapse_list.get_row_indices(),
+                     synapse_list.target_indices] = weights
+        return weight_array
 
     def __len__(self):
         """Return the total number of local connections."""
@@ -440,43 +420,37 @@ class Projection(object):
                     graph_mapper=self._spinnaker.graph_mapper,
                     partitioned_graph=self._spinnaker.partitioned_graph,
                     placements=self._spinnaker.placements,
-                    transceiver=self._spinnaker.transceiver,
+                    transceiver=self._spinnaker.region_data_cache,
                     routing_infos=self._spinnaker.routing_infos)
         if self._delay_edge is not None:
             delay_synapse_list = \
                 self._delay_edge.get_synaptic_list_from_machine(
                     graph_mapper=self._spinnaker.graph_mapper,
                     placements=self._spinnaker.placements,
-                    transceiver=self._spinnaker.transceiver,
+                    transceiver=self._spinnaker.region_data_cache,
                     partitioned_graph=self._spinnaker.partitioned_graph,
                     routing_infos=self._spinnaker.routing_infos)
 
         # If there is both a delay and a non-delay list, merge them
         if synapse_list is not None and delay_synapse_list is not None:
-            rows = synapse_list.get_rows()
-            delay_rows = delay_synapse_list.get_rows()
-            combined_rows = list()
-            for i in range(len(rows)):
-                combined_row = rows[i][self._projection_list_ranges[i]]
-                combined_row.append(delay_rows[i][self._delay_list_ranges[i]])
-                combined_rows.append(combined_row)
-            self._host_based_synapse_list = SynapticList(combined_rows)
+            self._host_based_synapse_list = \
+                synapse_list.create_range_sublist(
+                    self._projection_list_ranges)
+            self._host_based_synapse_list.merge(
+                delay_synapse_list.create_range_sublist(
+                    self._delay_list_ranges))
 
         # If there is only a synapse list, return that
         elif synapse_list is not None:
-            rows = synapse_list.get_rows()
-            new_rows = list()
-            for i in range(len(rows)):
-                new_rows.append(rows[i][self._projection_list_ranges[i]])
-            self._host_based_synapse_list = SynapticList(new_rows)
+            self._host_based_synapse_list = \
+                synapse_list.create_range_sublist(
+                    self._projection_list_ranges)
 
         # Otherwise return the delay list (there should be at least one!)
         else:
-            rows = delay_synapse_list.get_rows()
-            new_rows = list()
-            for i in range(len(rows)):
-                new_rows.append(rows[i][self._delay_list_ranges[i]])
-            self._host_based_synapse_list = SynapticList(new_rows)
+            self._host_based_synapse_list = \
+                delay_synapse_list.create_range_sublist(
+                    self._delay_list_ranges)
 
         self._has_retrieved_synaptic_list_from_machine = True
 
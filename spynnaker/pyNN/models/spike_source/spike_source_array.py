@@ -10,6 +10,8 @@ from spinn_front_end_common.abstract_models\
 from spynnaker.pyNN.utilities.conf import config
 from spynnaker.pyNN.models.spike_source.spike_source_array_partitioned_vertex\
     import SpikeSourceArrayPartitionedVertex
+from spynnaker.pyNN.models.spike_source.streamed_sending_region \
+    import StreamedSendingRegion
 from spinn_front_end_common.interface.buffer_management.storage_objects\
     .buffered_sending_region import BufferedSendingRegion
 from spinn_front_end_common.interface.buffer_management.buffer_manager \
@@ -41,7 +43,7 @@ from spinnman.messages.eieio.command_messages.event_stop_request\
 from enum import Enum
 import logging
 import sys
-import math
+import numpy
 
 logger = logging.getLogger(__name__)
 
@@ -105,8 +107,12 @@ class SpikeSourceArray(AbstractDataSpecableVertex,
                 " a negative value for a memory usage. Please correct and"
                 " try again")
 
-        # Keep track of any previously generated buffers
+        # Keep track of any previously generated buffers, the sizes of any
+        # buffers which have not been generated, and the time step of each
+        # spike
         self._send_buffers = dict()
+        self._send_buffer_sizes = dict()
+        self._spike_ticks = None
 
     @property
     def model_name(self):
@@ -138,12 +144,106 @@ class SpikeSourceArray(AbstractDataSpecableVertex,
         """
         # map region id to the sned buffer for this partitioned vertex
         send_buffer = dict()
-        send_buffer[self._SPIKE_SOURCE_REGIONS.SPIKE_DATA_REGION.value] =\
-            self._get_spike_send_buffer(vertex_slice)
+        if config.getboolean("Buffers", "stream_spike_source_arrays"):
+            send_buffer[self._SPIKE_SOURCE_REGIONS.SPIKE_DATA_REGION.value] =\
+                self._get_spike_stream(vertex_slice)
+        else:
+            send_buffer[self._SPIKE_SOURCE_REGIONS.SPIKE_DATA_REGION.value] =\
+                self._get_spike_send_buffer(vertex_slice)
         # create and return the partitioned vertex
         return SpikeSourceArrayPartitionedVertex(
             send_buffer, resources_required, label, constraints)
 
+    def _get_spike_ticks(self):
+        """ Get the time step of every spike, worked out once for all of the\
+            neurons
+
+        :return: a tuple of the time steps of the spikes and the neuron of\
+                    each spike (sorted by neuron), or None as the neurons if\
+                    every neuron spikes at every time step given
+        """
+        if self._spike_ticks is None:
+            if (len(self._spike_times) > 0 and
+                    hasattr(self._spike_times[0], "__iter__")):
+
+                # This is in SpiNNaker 'list of lists' format:
+                n_spikes = [len(times) for times in self._spike_times]
+                times = numpy.concatenate(
+                    [numpy.asarray(times, dtype="float")
+                     for times in self._spike_times] + [numpy.zeros(0)])
+                neurons = numpy.repeat(
+                    numpy.arange(len(n_spikes)), n_spikes)
+            else:
+
+                # This is in official PyNN format, all neurons use the
+                # same list:
+                times = numpy.asarray(self._spike_times, dtype="float")
+                neurons = None
+            ticks = numpy.ceil(
+                (times * 1000.0) / self._machine_time_step).astype("int64")
+            self._spike_ticks = (ticks, neurons)
+        return self._spike_ticks
+
+    def _get_spike_ticks_and_keys(self, vertex_slice):
+        """ Get the time step and key of each spike sent by the neurons of a\
+            slice, sorted by time step
+        """
+        ticks, neurons = self._get_spike_ticks()
+        if neurons is None:
+            keys = numpy.tile(numpy.arange(vertex_slice.n_atoms), ticks.size)
+            ticks = numpy.repeat(ticks, vertex_slice.n_atoms)
+        else:
+            start, end = numpy.searchsorted(
+                neurons, [vertex_slice.lo_atom, vertex_slice.hi_atom + 1])
+            keys = neurons[start:end] - vertex_slice.lo_atom
+            ticks = ticks[start:end]
+
+        # Keep the keys of each time step in neuron order
+        order = numpy.argsort(ticks, kind="mergesort")
+        return ticks[order], keys[order]
+
+    def _get_send_buffer_size(self, n_keys_per_tick):
+        """ Get the size of the buffer to send spikes, from the number of keys\
+            sent at each time step
+        """
+        total_size = EventStopRequest.get_min_packet_length()
+        n_ticks_with_n_keys = numpy.bincount(n_keys_per_tick)
+        for n_keys in numpy.flatnonzero(n_ticks_with_n_keys):
+            total_size += (int(n_ticks_with_n_keys[n_keys]) *
+                           BufferManager.get_n_bytes(int(n_keys)))
+        if total_size > self._max_on_chip_memory_usage_for_spikes:
+            total_size = self._max_on_chip_memory_usage_for_spikes
+        return total_size
+
+    def _get_spike_buffer_size(self, vertex_slice):
+        """ Get the size of the buffer to send the spikes of a slice, without\
+            building the buffer
+        """
+        key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
+        if key in self._send_buffers:
+            return self._send_buffers[key].buffer_size
+        if key not in self._send_buffer_sizes:
+            ticks, neurons = self._get_spike_ticks()
+            if neurons is not None:
+                start, end = numpy.searchsorted(
+                    neurons, [vertex_slice.lo_atom, vertex_slice.hi_atom + 1])
+                ticks = ticks[start:end]
+            n_keys_per_tick = numpy.unique(ticks, return_counts=True)[1]
+            if neurons is None:
+                n_keys_per_tick *= vertex_slice.n_atoms
+            self._send_buffer_sizes[key] = self._get_send_buffer_size(
+                n_keys_per_tick)
+        return self._send_buffer_sizes[key]
+
+    def _get_spike_stream(self, vertex_slice):
+        """ Get a region which sends the spikes of a slice from arrays of the\
+            time step and key of each spike, rather than from lists of keys
+        """
+        ticks, keys = self._get_spike_ticks_and_keys(vertex_slice)
+        send_region = StreamedSendingRegion(ticks, keys)
+        send_region.buffer_size = self._get_spike_buffer_size(vertex_slice)
+        return send_region
+
     def _get_spike_send_buffer(self, vertex_slice):
         """
         spikeArray is a list with one entry per 'neuron'. The entry for
@@ -158,39 +258,17 @@ class SpikeSourceArray(AbstractDataSpecableVertex,
         key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
         if key not in self._send_buffers:
             send_buffer = BufferedSendingRegion()
-            if isinstance(self._spike_times[0], list):
-
-                # This is in SpiNNaker 'list of lists' format:
-                for neuron in range(vertex_slice.lo_atom,
-                                    vertex_slice.hi_atom + 1):
-                    for timeStamp in sorted(self._spike_times[neuron]):
-                        time_stamp_in_ticks = int(
-                            math.ceil((timeStamp * 1000.0) /
-                                      self._machine_time_step))
-                        send_buffer.add_key(time_stamp_in_ticks,
-                                            neuron - vertex_slice.lo_atom)
-            else:
-
-                # This is in official PyNN format, all neurons use the
-                # same list:
-                neuron_list = range(vertex_slice.n_atoms)
-                for timeStamp in sorted(self._spike_times):
-                    time_stamp_in_ticks = int(
-                        math.ceil((timeStamp * 1000.0) /
-                                  self._machine_time_step))
+            ticks, keys = self._get_spike_ticks_and_keys(vertex_slice)
 
-                    # add to send_buffer collection
-                    send_buffer.add_keys(time_stamp_in_ticks, neuron_list)
+            # Add the keys of each time step together
+            unique_ticks, starts = numpy.unique(ticks, return_index=True)
+            ends = numpy.append(starts[1:], ticks.size)
+            keys = keys.tolist()
+            for tick, start, end in zip(unique_ticks.tolist(), starts, ends):
+                send_buffer.add_keys(tick, keys[start:end])
 
             # Update the size
-            total_size = 0
-            for timestamp in send_buffer.timestamps:
-                n_keys = send_buffer.get_n_keys(timestamp)
-                total_size += BufferManager.get_n_bytes(n_keys)
-            total_size += EventStopRequest.get_min_packet_length()
-            if total_size > self._max_on_chip_memory_usage_for_spikes:
-                total_size = self._max_on_chip_memory_usage_for_spikes
-            send_buffer.buffer_size = total_size
+            send_buffer.buffer_size = self._get_send_buffer_size(ends - starts)
             self._send_buffers[key] = send_buffer
         else:
             send_buffer = self._send_buffers[key]
@@ -291,12 +369,11 @@ class SpikeSourceArray(AbstractDataSpecableVertex,
         # ###################################################################
         # Reserve SDRAM space for memory areas:
         spec.comment("\nReserving memory space for spike data region:\n\n")
-        spike_buffer = self._get_spike_send_buffer(
+        spike_buffer_size = self._get_spike_buffer_size(
             graph_mapper.get_subvertex_slice(subvertex))
-        self._reserve_memory_regions(spec, spike_buffer.buffer_size)
+        self._reserve_memory_regions(spec, spike_buffer_size)
 
-        self._write_setup_info(
-            spec, spike_buffer.buffer_size, ip_tags)
+        self._write_setup_info(spec, spike_buffer_size, ip_tags)
 
         # End-of-Spec:
         spec.end_specification()
@@ -330,8 +407,7 @@ class SpikeSourceArray(AbstractDataSpecableVertex,
         objects
         :return:
         """
-        send_buffer = self._get_spike_send_buffer(vertex_slice)
-        send_size = send_buffer.buffer_size
+        send_size = self._get_spike_buffer_size(vertex_slice)
         return ((constants.DATA_SPECABLE_BASIC_SETUP_INFO_N_WORDS * 4) +
                 SpikeSourceArray._CONFIGURATION_REGION_SIZE + send_size)
 
@@ -5,7 +5,7 @@ SpikeSourceFromFile
 # spynnaker imports
 from spynnaker.pyNN.models.spike_source.spike_source_array import \
     SpikeSourceArray
-from spynnaker.pyNN import utility_calls
+from spynnaker.pyNN.utilities import utility_calls
 
 # general imports
 import numpy
@@ -25,9 +25,17 @@ class SpikeSourceFromFile(SpikeSourceArray):
             max_on_chip_memory_usage_for_spikes_in_bytes=None,
             constraints=None, label="SpikeSourceArray"):
 
-        spike_times = utility_calls.read_spikes_from_file(
+        spikes = utility_calls.read_spikes_from_file(
             spike_time_file, min_atom, max_atom, min_time, max_time)
 
+        # The spikes are sorted by atom, so the times of each neuron are a
+        # contiguous block; the first atom read is the first neuron
+        first_atom = 0 if min_atom is None else min_atom
+        boundaries = numpy.searchsorted(
+            spikes[:, 0], numpy.arange(n_neurons + 1) + first_atom)
+        spike_times = [spikes[start:end, 1].tolist()
+                       for start, end in zip(boundaries[:-1], boundaries[1:])]
+
         SpikeSourceArray.__init__(
             self, n_neurons, spike_times, machine_time_step,
             spikes_per_second, ring_buffer_sigma, timescale_factor, port=port,
@@ -6,6 +6,9 @@ from spynnaker.pyNN.models.abstract_models.\
 from spynnaker.pyNN.models.abstract_models\
     .abstract_population_recordable_vertex\
     import AbstractPopulationRecordableVertex
+from spynnaker.pyNN.models.abstract_models\
+    .abstract_independent_data_spec_vertex \
+    import AbstractIndependentDataSpecVertex
 
 from spinn_front_end_common.abstract_models.abstract_data_specable_vertex\
     import AbstractDataSpecableVertex
@@ -34,7 +37,8 @@ RANDOM_SEED_WORDS = 4
 class SpikeSourcePoisson(
         AbstractPopulationRecordableVertex, AbstractPartitionableVertex,
         AbstractDataSpecableVertex,
-        AbstractOutgoingEdgeSameContiguousKeysRestrictor):
+        AbstractOutgoingEdgeSameContiguousKeysRestrictor,
+        AbstractIndependentDataSpecVertex):
     """
     This class represents a Poisson Spike source object, which can represent
     a pynn_population.py of virtual neurons each with its own parameters.
@@ -63,6 +67,7 @@ class SpikeSourcePoisson(
             self, machine_time_step=machine_time_step,
             timescale_factor=timescale_factor)
         AbstractOutgoingEdgeSameContiguousKeysRestrictor.__init__(self)
+        AbstractIndependentDataSpecVertex.__init__(self)
         self._rate = rate
         self._start = start
         self._duration = duration
@@ -295,9 +300,62 @@ class SpikeSourcePoisson(
             graph_mapper=graph_mapper, compatible_output=compatible_output,
             spike_recording_region=self._POISSON_SPIKE_SOURCE_REGIONS
                                        .SPIKE_HISTORY_REGION.value,
-            sub_vertex_out_spike_bytes_function=(
-                lambda subvertex, subvertex_slice:
-                    int(math.ceil(subvertex_slice.n_atoms / 32.0)) * 4))
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes)
+
+    def iter_spikes(self, txrx, placements, graph_mapper, chunk_timesteps):
+        """
+
+        :param txrx:
+        :param placements:
+        :param graph_mapper:
+        :param chunk_timesteps: the number of time steps in each chunk
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one per chunk of time steps, ordered by time
+        """
+        return self._iter_spikes(
+            transceiver=txrx, placements=placements,
+            graph_mapper=graph_mapper,
+            spike_recording_region=self._POISSON_SPIKE_SOURCE_REGIONS
+                                       .SPIKE_HISTORY_REGION.value,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes,
+            chunk_timesteps=chunk_timesteps)
+
+    def iter_spikes_by_core(self, txrx, placements, graph_mapper):
+        """
+
+        :param txrx:
+        :param placements:
+        :param graph_mapper:
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one per core in order of atom, ordered by id
+        """
+        return self._iter_spikes_by_core(
+            transceiver=txrx, placements=placements,
+            graph_mapper=graph_mapper,
+            spike_recording_region=self._POISSON_SPIKE_SOURCE_REGIONS
+                                       .SPIKE_HISTORY_REGION.value,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes)
+
+    def get_spike_counts(self, txrx, placements, graph_mapper):
+        """
+
+        :param txrx:
+        :param placements:
+        :param graph_mapper:
+        :return: a tuple of an array of the number of spikes of each atom\
+                    and an array of the number of spikes of all of the atoms\
+                    at each time step
+        """
+        return self._get_spike_counts(
+            transceiver=txrx, placements=placements,
+            graph_mapper=graph_mapper,
+            spike_recording_region=self._POISSON_SPIKE_SOURCE_REGIONS
+                                       .SPIKE_HISTORY_REGION.value,
+            sub_vertex_out_spike_bytes_function=self._get_out_spike_bytes)
+
+    @staticmethod
+    def _get_out_spike_bytes(subvertex, subvertex_slice):
+        return int(math.ceil(subvertex_slice.n_atoms / 32.0)) * 4
 
     # inherited from partionable vertex
     def get_sdram_usage_for_atoms(self, vertex_slice, graph):
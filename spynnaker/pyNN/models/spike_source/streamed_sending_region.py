@@ -0,0 +1,96 @@
+"""
+StreamedSendingRegion
+"""
+
+# general imports
+import numpy
+
+
+class StreamedSendingRegion(object):
+    """ A region of keys to send to a core at each time step, with the\
+        interface of BufferedSendingRegion used by the buffer manager.  The\
+        time step and key of each spike are held in two arrays sorted by time\
+        step, and the keys are taken from the arrays as the buffer manager\
+        asks for them, so no list of keys is built for any time step.
+    """
+
+    def __init__(self, timestamps, keys):
+        """
+
+        :param timestamps: the time step of each spike, in ascending order
+        :param keys: the key of each spike
+        """
+        self._keys = numpy.asarray(keys, dtype="uint32")
+        self._timestamps, self._timestamp_starts = numpy.unique(
+            numpy.asarray(timestamps), return_index=True)
+        self._timestamp_ends = numpy.append(
+            self._timestamp_starts[1:], self._keys.size)
+        self._buffer_size = None
+        self._current_timestamp_pos = 0
+        self._current_key_pos = 0
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    @buffer_size.setter
+    def buffer_size(self, buffer_size):
+        self._buffer_size = buffer_size
+
+    @property
+    def n_timestamps(self):
+        return self._timestamps.size
+
+    @property
+    def timestamps(self):
+        return self._timestamps
+
+    def get_n_keys(self, timestamp):
+        """ Get the number of keys sent at a time step
+        """
+        index = numpy.searchsorted(self._timestamps, timestamp)
+        if (index == self._timestamps.size or
+                self._timestamps[index] != timestamp):
+            return 0
+        return int(self._timestamp_ends[index] -
+                   self._timestamp_starts[index])
+
+    @property
+    def is_next_timestamp(self):
+        return self._current_timestamp_pos < self._timestamps.size
+
+    @property
+    def next_timestamp(self):
+        if self.is_next_timestamp:
+            return int(self._timestamps[self._current_timestamp_pos])
+        return None
+
+    @property
+    def current_timestamp(self):
+        return self.next_timestamp
+
+    def is_next_key(self, timestamp):
+        """ Determine if there is another key to send at a time step
+        """
+        return (self.is_next_timestamp and
+                self._timestamps[self._current_timestamp_pos] == timestamp and
+                self._current_key_pos <
+                self._timestamp_ends[self._current_timestamp_pos])
+
+    @property
+    def next_key(self):
+        """ The next key to send, moving on to the next time step once all\
+            of the keys of a time step have been sent
+        """
+        key = int(self._keys[self._current_key_pos])
+        self._current_key_pos += 1
+        if (self._current_key_pos ==
+                self._timestamp_ends[self._current_timestamp_pos]):
+            self._current_timestamp_pos += 1
+        return key
+
+    def rewind(self):
+        """ Go back to sending the first key
+        """
+        self._current_timestamp_pos = 0
+        self._current_key_pos = 0
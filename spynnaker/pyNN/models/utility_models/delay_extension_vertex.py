@@ -1,12 +1,15 @@
-import copy
 import logging
 from enum import Enum
 
 import math
+import numpy
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN import exceptions
 from spynnaker.pyNN.models.neural_projections.\
     delay_partitionable_edge import DelayPartitionableEdge
+from spynnaker.pyNN.models.abstract_models\
+    .abstract_independent_data_spec_vertex \
+    import AbstractIndependentDataSpecVertex
 from spinn_front_end_common.abstract_models\
     .abstract_provides_incoming_edge_constraints \
     import AbstractProvidesIncomingEdgeConstraints
@@ -34,7 +37,8 @@ logger = logging.getLogger(__name__)
 class DelayExtensionVertex(AbstractPartitionableVertex,
                            AbstractDataSpecableVertex,
                            AbstractProvidesIncomingEdgeConstraints,
-                           AbstractOutgoingEdgeSameContiguousKeysRestrictor):
+                           AbstractOutgoingEdgeSameContiguousKeysRestrictor,
+                           AbstractIndependentDataSpecVertex):
     """
     Instance of this class provide delays to incoming spikes in multiples
     of the maximum delays of a neuron (typically 16 or 32)
@@ -61,6 +65,7 @@ class DelayExtensionVertex(AbstractPartitionableVertex,
             timescale_factor=timescale_factor)
         AbstractProvidesIncomingEdgeConstraints.__init__(self)
         AbstractOutgoingEdgeSameContiguousKeysRestrictor.__init__(self)
+        AbstractIndependentDataSpecVertex.__init__(self)
 
         self._max_delay_per_neuron = max_delay_per_neuron
         self._max_stages = 0
@@ -192,15 +197,18 @@ class DelayExtensionVertex(AbstractPartitionableVertex,
             spec, self._DELAY_EXTENSION_REGIONS.SYSTEM.value)
 
     def get_delay_blocks(self, subvertex, sub_graph, graph_mapper):
+        """ Get a bitfield for each stage of delay, with a bit set for each\
+            source neuron which has synapses in the range of delays of the\
+            stage
 
-        # Create empty list of words to fill in with delay data:
+        :return: the number of stages used, and an array of the bitfield\
+                    words of each stage, one row per stage
+        """
         vertex_slice = graph_mapper.get_subvertex_slice(subvertex)
         n_atoms = (vertex_slice.hi_atom - vertex_slice.lo_atom) + 1
-
         num_words_per_row = int(math.ceil(n_atoms / 32.0))
-        one_block = [0] * num_words_per_row
-        delay_block = list()
-        num_delay_blocks = 0
+        has_delays = numpy.zeros((self._max_stages, num_words_per_row * 32),
+                                 dtype="bool")
 
         for subedge in sub_graph.outgoing_subedges_from_subvertex(subvertex):
             subedge_assocated_edge = \
@@ -211,37 +219,24 @@ class DelayExtensionVertex(AbstractPartitionableVertex,
                     "One of the incoming subedges is not a subedge of a"
                     " DelayPartitionableEdge")
 
-            # Loop through each possible delay block
-            dest = subedge.post_subvertex
-            source_vertex_slice = graph_mapper.get_subvertex_slice(subvertex)
-            dest_vertex_slice = graph_mapper.get_subvertex_slice(dest)
-            partitionable_edge = graph_mapper.\
-                get_partitionable_edge_from_partitioned_edge(subedge)
-            synapse_list = partitionable_edge.synapse_list.create_atom_sublist(
-                source_vertex_slice, dest_vertex_slice)
-            rows = synapse_list.get_rows()
-
-            for (source_id, row) in zip(range(len(rows)), rows):
-                for delay in row.delays:
-                    stage = int(math.floor((delay - 1) /
-                                           self.max_delay_per_neuron)) - 1
-                    num_delay_blocks = max(stage + 1, num_delay_blocks)
-                    if num_delay_blocks > self._max_stages:
-                        raise Exception(
-                            "Too many stages ({} of {}) have been"
-                            " created for delay extension {}".format(
-                                num_delay_blocks, self._max_stages,
-                                self._label))
-                    while num_delay_blocks > len(delay_block):
-                        delay_block.append(copy.copy(one_block))
-
-                    # This source neurons has synapses in the current delay
-                    # range. So set the bit in the delay_block:
-                    word_id = int(source_id / 32)
-                    bit_id = source_id - (word_id * 32)
-                    delay_block[stage][word_id] |= (1 << bit_id)
-
-        return num_delay_blocks, delay_block
+            # The sublist of the subedge has a row for each source neuron in
+            # each stage, holding the synapses with delays in that stage
+            synapse_list = subedge.get_synapse_sublist(graph_mapper)
+            n_stages = synapse_list.get_n_rows() // n_atoms
+            has_delays[:n_stages, :n_atoms] |= (
+                synapse_list.row_lengths.reshape((n_stages, n_atoms)) > 0)
+
+        stages_used = numpy.flatnonzero(numpy.any(has_delays, axis=1))
+        num_delay_blocks = 0
+        if stages_used.size > 0:
+            num_delay_blocks = int(stages_used[-1]) + 1
+
+        # Pack the bits of each 32 neurons into a word, with the first neuron
+        # in the least significant bit
+        bits = numpy.fliplr(has_delays[:num_delay_blocks].reshape((-1, 32)))
+        delay_blocks = numpy.packbits(bits).view(">u4").astype("uint32")
+        return num_delay_blocks, delay_blocks.reshape(
+            (num_delay_blocks, num_words_per_row))
 
     def write_delay_parameters(self, spec, processor_chip_x, processor_chip_y,
                                processor_id, subvertex, num_delay_blocks,
@@ -273,8 +268,8 @@ class DelayExtensionVertex(AbstractPartitionableVertex,
         spec.write_value(data=num_delay_blocks)
 
         # Write the actual delay blocks
-        for i in range(0, num_delay_blocks):
-            spec.write_array(array_values=delay_block[i])
+        if num_delay_blocks > 0:
+            spec.write_array(array_values=delay_block.flatten())
 
     # inherited from partitionable vertex
     def get_cpu_usage_for_atoms(self, vertex_slice, graph):
@@ -64,6 +64,8 @@ from spynnaker.pyNN.models\
     AbstractPopulationRecordableVertex
 from spynnaker.pyNN.models.pynn_population import Population
 from spynnaker.pyNN.models.pynn_projection import Projection
+from spynnaker.pyNN.models.neural_projections.projection_partitioned_edge \
+    import ProjectionPartitionedEdge
 from spynnaker.pyNN.overridden_pacman_functions.graph_edge_filter \
     import GraphEdgeFilter
 from spynnaker.pyNN.spynnaker_configurations import \
@@ -79,12 +81,20 @@ from spynnaker.pyNN.models.abstract_models\
 from spynnaker.pyNN.models.abstract_models\
     .abstract_vertex_with_dependent_vertices \
     import AbstractVertexWithEdgeToDependentVertices
+from spynnaker.pyNN.models.abstract_models\
+    .abstract_independent_data_spec_vertex \
+    import AbstractIndependentDataSpecVertex
 from spynnaker.pyNN.utilities.database.spynnaker_data_base_interface import \
     SpynnakerDataBaseInterface
+from spynnaker.pyNN.utilities.region_data_cache import RegionDataCache
+from spynnaker.pyNN.utilities.host_emulator import HostEmulator
+from spynnaker.pyNN.utilities.mapping_cache import MappingCache
 
 # general imports
 import logging
 import math
+import multiprocessing
+import numpy
 import os
 import sys
 
@@ -93,6 +103,36 @@ logger = logging.getLogger(__name__)
 
 executable_finder = ExecutableFinder()
 
+# The Spinnaker object, placements and base random seed of the data
+# specifications being generated by a pool of processes.  This is set before
+# the pool is created, so that the processes inherit it rather than it having
+# to be pickled.
+_data_spec_generation_state = None
+
+
+def _generate_data_spec_in_process(placement_index):
+    """ Generates the data specification of one of the placements of\
+        _data_spec_generation_state within a process of the pool.  The\
+        random number generator is seeded from the base seed and the index\
+        of the placement, so that the random values of each placement do\
+        not depend on which process generates it, and are the same in each\
+        run of a script which seeds numpy
+
+    :return: the index of the placement, and the weight scales set on each\
+                projection subedge coming in to the placement while the\
+                data specification was generated, as these are needed by\
+                the main process to read the synapses back from the machine
+    """
+    spinnaker, placements, base_seed = _data_spec_generation_state
+    placement = placements[placement_index]
+    numpy.random.seed([base_seed, placement_index])
+    spinnaker._generate_data_spec(
+        placement, spinnaker._graph_mapper.get_vertex_from_subvertex(
+            placement.subvertex))
+    return placement_index, [
+        subedge.weight_scales for subedge in
+        spinnaker._get_incoming_projection_subedges(placement.subvertex)]
+
 
 class Spinnaker(FrontEndCommonConfigurationFunctions,
                 FrontEndCommonInterfaceFunctions,
@@ -115,6 +155,10 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         self._create_database = None
         self._populations = list()
 
+        # The first edge added between each pair of vertices, so that later
+        # projections between the vertices can find it without a search
+        self._edges_by_vertices = dict()
+
         if self._app_id is None:
             self._set_up_main_objects(
                 app_id=config.getint("Machine", "appID"),
@@ -197,12 +241,22 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         # Manager of buffered sending
         self._send_buffer_manager = None
 
+        # Cache of the data read back from the machine after a run
+        self._region_data_cache = None
+
+        # Emulator of the last run, when it was run on the host
+        self._host_emulator = None
+
     def run(self, run_time):
         """
 
         :param run_time:
         :return:
         """
+        # Any data read back before this run is about to be out of date
+        self._region_data_cache = None
+        self._host_emulator = None
+
         # sort out config param to be valid types
         width = config.get("Machine", "width")
         height = config.get("Machine", "height")
@@ -449,6 +503,22 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
                         progress.update()
                     progress.end()
 
+        elif (isinstance(self._machine, VirtualMachine) and
+                config.getboolean("Execute", "emulate_on_host")):
+            if self._no_machine_time_steps is None:
+                raise common_exceptions.ConfigurationException(
+                    "A simulation which runs forever cannot be emulated on "
+                    "the host")
+            logger.info("*** Emulating the simulation on the host ***")
+            if do_timing:
+                timer.start_timing()
+            self._host_emulator = HostEmulator(
+                self._partitioned_graph, self._graph_mapper,
+                self._machine_time_step, self._no_machine_time_steps)
+            self._host_emulator.run()
+            self._has_ran = True
+            if do_timing:
+                timer.take_sample()
         elif isinstance(self._machine, VirtualMachine):
             logger.info(
                 "*** Using a Virtual Machine so no simulation will occur")
@@ -471,6 +541,13 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         """
         return self._has_ran
 
+    @property
+    def host_emulator(self):
+        """ The emulator which ran the last run on the host, or None if it\
+            was not run on the host
+        """
+        return self._host_emulator
+
     @property
     def machine_time_step(self):
         """
@@ -551,6 +628,17 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         """
         return self._txrx
 
+    @property
+    def region_data_cache(self):
+        """ A cache of the memory regions read from the machine since the\
+            last run, which reads through the transceiver
+
+        :return:
+        """
+        if self._region_data_cache is None:
+            self._region_data_cache = RegionDataCache(self._txrx)
+        return self._region_data_cache
+
     @property
     def graph_mapper(self):
         """
@@ -596,6 +684,30 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
 
         self._add_virtual_chips()
 
+        # reuse the mapping of a previous run of the same network if there is
+        # one in the mapping cache
+        mapping_cache = None
+        if config.getboolean("Mapping", "use_mapping_cache"):
+            mapping_cache = self._get_mapping_cache()
+            fingerprint = mapping_cache.get_fingerprint(
+                self._partitionable_graph, self._machine,
+                self._get_mapping_config_items())
+            mapping = mapping_cache.load(
+                fingerprint, self._partitionable_graph, self._machine)
+            if mapping is not None:
+                logger.info("Reusing the mapping of a previous run from the "
+                            "mapping cache; no mapping reports are written")
+                (self._partitioned_graph, self._graph_mapper,
+                 self._placements, self._tags, self._routing_infos,
+                 self._router_tables) = mapping
+
+                # the synapses of the subedges are taken again from the
+                # projections of this run, as their weights may have changed
+                for subedge in self._partitioned_graph.subedges:
+                    if isinstance(subedge, ProjectionPartitionedEdge):
+                        subedge.free_sublist()
+                return
+
         # execute partitioner
         self._execute_partitioner(pacman_report_state)
 
@@ -616,6 +728,35 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         # execute router
         self._execute_router(pacman_report_state)
 
+        if mapping_cache is not None:
+            mapping_cache.save(
+                fingerprint, self._partitionable_graph, self._machine,
+                self._partitioned_graph, self._graph_mapper, self._placements,
+                self._tags, self._routing_infos, self._router_tables)
+
+    @staticmethod
+    def _get_mapping_cache():
+        """ Get the cache of mappings from the configuration
+        """
+        directory = config.get("Mapping", "mapping_cache_directory")
+        if directory == "DEFAULT":
+            directory = os.path.join(os.path.expanduser("~"),
+                                     ".spinnaker_mapping_cache")
+        return MappingCache(
+            directory, config.getint("Mapping", "max_mappings_kept"))
+
+    def _get_mapping_config_items(self):
+        """ Get the values other than the network and machine which the\
+            mapping depends on
+        """
+        config_items = [self._hostname, self._machine_time_step,
+                        self._time_scale_factor, self._no_machine_time_steps]
+        for section in ["Machine", "Routing", "Placer", "TagAllocator",
+                        "Partitioner", "KeyAllocator", "MasterPopTable",
+                        "Buffers"]:
+            config_items.append(sorted(config.items(section)))
+        return config_items
+
     def _execute_tag_allocator(self, pacman_report_state):
         """
 
@@ -788,6 +929,8 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         # iterate though subvertexes and call generate_data_spec for each
         # vertex
         executable_targets = ExecutableTargets()
+        n_processes = self._get_n_data_spec_processes()
+        parallel_placements = list()
 
         # create a progress bar for end users
         progress_bar = ProgressBar(len(list(self._placements.placements)),
@@ -797,20 +940,17 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
                 self._graph_mapper.get_vertex_from_subvertex(
                     placement.subvertex)
 
-            # if the vertex can generate a DSG, call it
+            # if the vertex can generate a DSG, call it, or leave it to the
+            # process pool if it can be generated independently
             if isinstance(associated_vertex, AbstractDataSpecableVertex):
 
-                ip_tags = self._tags.get_ip_tags_for_vertex(
-                    placement.subvertex)
-                reverse_ip_tags = self._tags.get_reverse_ip_tags_for_vertex(
-                    placement.subvertex)
-                associated_vertex.generate_data_spec(
-                    placement.subvertex, placement, self._partitioned_graph,
-                    self._partitionable_graph, self._routing_infos,
-                    self._hostname, self._graph_mapper,
-                    self._report_default_directory, ip_tags, reverse_ip_tags,
-                    self._writeTextSpecs, self._app_data_runtime_folder)
-                progress_bar.update()
+                if (n_processes > 1 and
+                        isinstance(associated_vertex,
+                                   AbstractIndependentDataSpecVertex)):
+                    parallel_placements.append(placement)
+                else:
+                    self._generate_data_spec(placement, associated_vertex)
+                    progress_bar.update()
 
                 # Get name of binary from vertex
                 binary_name = associated_vertex.get_binary_file_name()
@@ -826,11 +966,99 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
                 executable_targets.add_processor(
                     binary_path, placement.x, placement.y, placement.p)
 
+        if len(parallel_placements) > 0:
+            self._generate_data_specs_in_processes(
+                parallel_placements, n_processes, progress_bar)
+
         # finish the progress bar
         progress_bar.end()
 
         return executable_targets
 
+    def _generate_data_spec(self, placement, associated_vertex):
+        """ generates the dsg for a single placement
+
+        :param placement: the placement of the subvertex
+        :param associated_vertex: the vertex of the subvertex
+        :return:
+        """
+        ip_tags = self._tags.get_ip_tags_for_vertex(placement.subvertex)
+        reverse_ip_tags = self._tags.get_reverse_ip_tags_for_vertex(
+            placement.subvertex)
+        associated_vertex.generate_data_spec(
+            placement.subvertex, placement, self._partitioned_graph,
+            self._partitionable_graph, self._routing_infos,
+            self._hostname, self._graph_mapper,
+            self._report_default_directory, ip_tags, reverse_ip_tags,
+            self._writeTextSpecs, self._app_data_runtime_folder)
+
+    def _generate_data_specs_in_processes(
+            self, placements, n_processes, progress_bar):
+        """ generates the dsg for a list of placements using a pool of\
+            processes, each of which writes its data specifications to the\
+            application data folder
+
+        :param placements: the placements to generate the dsg for
+        :param n_processes: the number of processes in the pool
+        :param progress_bar: the progress bar to update as each placement\
+                    is completed
+        :return:
+        """
+        global _data_spec_generation_state
+        _data_spec_generation_state = (
+            self, placements, numpy.random.randint(0x7FFFFFFF))
+        pool = multiprocessing.Pool(processes=n_processes)
+        try:
+            for placement_index, weight_scales in pool.imap_unordered(
+                    _generate_data_spec_in_process, range(len(placements))):
+
+                # the weight scales were only set on the subedges of the
+                # process which generated the data specification
+                subedges = self._get_incoming_projection_subedges(
+                    placements[placement_index].subvertex)
+                for subedge, subedge_weight_scales in zip(
+                        subedges, weight_scales):
+                    subedge.weight_scales_setter(subedge_weight_scales)
+                progress_bar.update()
+        finally:
+
+            # every result has been received by now unless one of the
+            # processes failed, so stop any that are left
+            pool.terminate()
+            pool.join()
+            _data_spec_generation_state = None
+
+    def _get_incoming_projection_subedges(self, subvertex):
+        """ Get the projection subedges which end at a subvertex, in the\
+            same order in every process
+        """
+        return [subedge for subedge in
+                self._partitioned_graph.incoming_subedges_from_subvertex(
+                    subvertex)
+                if isinstance(subedge, ProjectionPartitionedEdge)]
+
+    @staticmethod
+    def _get_n_data_spec_processes():
+        """ Get the number of processes to generate data specifications\
+            with, from the SpecGeneration section of the configuration
+
+        :return: the number of processes, or 1 if they should all be\
+                    generated in this process
+        :rtype: int
+        """
+        n_processes = config.get("SpecGeneration", "n_processes")
+        if n_processes == "None":
+            n_processes = multiprocessing.cpu_count()
+        else:
+            n_processes = int(n_processes)
+
+        # The processes rely on inheriting the state of this one
+        if n_processes > 1 and not hasattr(os, "fork"):
+            logger.warn("Data specifications cannot be generated in parallel"
+                        " on this platform; using a single process")
+            return 1
+        return max(n_processes, 1)
+
     def add_vertex(self, vertex_to_add):
         """
 
@@ -868,6 +1096,18 @@ class Spinnaker(FrontEndCommonConfigurationFunctions,
         :return:
         """
         self._partitionable_graph.add_edge(edge_to_add)
+        self._edges_by_vertices.setdefault(
+            (edge_to_add.pre_vertex, edge_to_add.post_vertex), edge_to_add)
+
+    def get_edge(self, pre_vertex, post_vertex):
+        """ Get the first edge added between two vertices
+
+        :param pre_vertex: the vertex the edge starts at
+        :param post_vertex: the vertex the edge ends at
+        :return: the edge, or None if no edge has been added between the\
+                    vertices
+        """
+        return self._edges_by_vertices.get((pre_vertex, post_vertex))
 
     def create_population(self, size, cellclass, cellparams, structure, label):
         """
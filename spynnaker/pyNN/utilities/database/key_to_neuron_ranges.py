@@ -0,0 +1,102 @@
+"""
+KeyToNeuronRanges
+"""
+import bisect
+import numpy
+
+
+class KeyToNeuronRanges(object):
+    """ Decodes the keys of spikes sent by the machine into the population\
+        and neuron which sent them, using the ranges of keys of each\
+        subvertex stored in the key_to_neuron_ranges table of the live output\
+        database.  The ranges are sorted by base key so that the range of a\
+        key can be found by bisection.
+    """
+
+    def __init__(self, labels, base_keys, masks, lo_atoms, n_atoms):
+        """
+
+        :param labels: the label of the population of each range
+        :param base_keys: the first key of each range
+        :param masks: the mask of the keys of each range
+        :param lo_atoms: the neuron sending the base key of each range
+        :param n_atoms: the number of neurons in each range
+        """
+        order = numpy.argsort(base_keys, kind="mergesort")
+        self._labels = [labels[i] for i in order]
+        self._base_keys = numpy.asarray(base_keys, dtype="int64")[order]
+        self._masks = numpy.asarray(masks, dtype="int64")[order]
+        self._lo_atoms = numpy.asarray(lo_atoms, dtype="int64")[order]
+        self._n_atoms = numpy.asarray(n_atoms, dtype="int64")[order]
+        self._base_key_list = self._base_keys.tolist()
+
+    @staticmethod
+    def from_database(database_path):
+        """ Read the ranges from a live output database
+
+        :param database_path: the path of the database file
+        """
+        import sqlite3 as sqlite
+        connection = sqlite.connect(database_path)
+        rows = connection.execute(
+            "SELECT vertex_label, base_key, mask, lo_atom, n_atoms "
+            "FROM key_to_neuron_ranges NATURAL JOIN Partitionable_vertices "
+            "ORDER BY base_key").fetchall()
+        connection.close()
+        if len(rows) == 0:
+            return KeyToNeuronRanges([], [], [], [], [])
+        return KeyToNeuronRanges(*zip(*rows))
+
+    @property
+    def labels(self):
+        """ The label of the population of each range, in key order
+        """
+        return self._labels
+
+    def _find_ranges(self, keys):
+        """ Get the index of the range containing each key, or -1 for keys\
+            which are not in any range
+        """
+        indices = numpy.searchsorted(self._base_keys, keys, side="right") - 1
+        found = indices >= 0
+        offsets = keys - self._base_keys[indices]
+        found &= (keys & self._masks[indices]) == self._base_keys[indices]
+        found &= offsets < self._n_atoms[indices]
+        indices[~found] = -1
+        return indices
+
+    def get_neuron(self, key):
+        """ Get the population and neuron which sends a key
+
+        :param key: the key of the spike
+        :return: a tuple of the label of the population and the neuron id,\
+                    or None if the key is not sent by any neuron
+        """
+        index = bisect.bisect_right(self._base_key_list, key) - 1
+        if index < 0:
+            return None
+        base_key = self._base_key_list[index]
+        if ((key & int(self._masks[index])) != base_key or
+                key - base_key >= self._n_atoms[index]):
+            return None
+        return (self._labels[index],
+                int(self._lo_atoms[index]) + key - base_key)
+
+    def get_neurons(self, keys):
+        """ Get the populations and neurons which send an array of keys
+
+        :param keys: the keys of the spikes
+        :return: a tuple of an array of the range of each key, which is\
+                    also the index of the label of its population in\
+                    labels (or -1 if the key is not sent by any neuron), and\
+                    an array of the neuron id of each key
+        """
+        keys = numpy.asarray(keys, dtype="int64")
+        if len(self._labels) == 0:
+            return (-numpy.ones(keys.shape, dtype="int64"),
+                    numpy.zeros(keys.shape, dtype="int64"))
+        indices = self._find_ranges(keys)
+        neuron_ids = (self._lo_atoms[indices] + keys -
+                      self._base_keys[indices])
+        neuron_ids[indices < 0] = 0
+        return indices, neuron_ids
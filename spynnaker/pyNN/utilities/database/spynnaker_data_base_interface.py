@@ -8,6 +8,7 @@ from spinn_front_end_common.utilities.database.\
 # general imports
 import logging
 import traceback
+from spynnaker.pyNN.utilities.conf import config
 from spynnaker.pyNN.models.abstract_models.\
     abstract_population_recordable_vertex import \
     AbstractPopulationRecordableVertex
@@ -37,13 +38,23 @@ class SpynnakerDataBaseInterface(FrontEndCommonDataBaseInterface):
         self._thread_pool.apply_async(self._add_partitionable_vertices,
                                       args=[partitionable_graph])
 
+    def _connect(self):
+        """ Connect to the database for a bulk load; unless writes are\
+            configured to be synchronous, sqlite is told not to wait for\
+            each write to reach the disk
+        """
+        import sqlite3 as sqlite
+        connection = sqlite.connect(self._database_path)
+        if not config.getboolean("Database", "synchronous_writes"):
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
     def _add_partitionable_vertices(self, partitionable_graph):
         # noinspection PyBroadException
         try:
             self._lock_condition.acquire()
-            import sqlite3 as sqlite
-            self._lock_condition.acquire()
-            connection = sqlite.connect(self._database_path)
+            connection = self._connect()
             cur = connection.cursor()
             cur.execute(
                 "CREATE TABLE Partitionable_vertices("
@@ -66,48 +77,45 @@ class SpynnakerDataBaseInterface(FrontEndCommonDataBaseInterface):
                 "FOREIGN KEY (edge_id) "
                 "REFERENCES Partitionable_edges(edge_id), "
                 "PRIMARY KEY (vertex_id, edge_id))")
-            # add vertices
-            for vertex in partitionable_graph.vertices:
+
+            # add vertices, numbering them in the order of the graph
+            vertices = list(partitionable_graph.vertices)
+            vertex_ids = dict(
+                (vertex, vertex_id + 1)
+                for vertex_id, vertex in enumerate(vertices))
+            vertex_rows = list()
+            for vertex in vertices:
+                recorded = 0
                 if isinstance(vertex, AbstractPopulationRecordableVertex):
-                    cur.execute(
-                        "INSERT INTO Partitionable_vertices("
-                        "vertex_label, no_atoms, max_atom_constrant, recorded)"
-                        " VALUES('{}', {}, {}, {});"
-                        .format(vertex.label, vertex.n_atoms,
-                                vertex.get_max_atoms_per_core(),
-                                int(vertex.record)))
-                else:
-                    cur.execute(
-                        "INSERT INTO Partitionable_vertices("
-                        "vertex_label, no_atoms, max_atom_constrant, recorded)"
-                        " VALUES('{}', {}, {}, 0);"
-                        .format(vertex.label, vertex.n_atoms,
-                                vertex.get_max_atoms_per_core()))
-            # add edges
-            vertices = partitionable_graph.vertices
-            for vertex in partitionable_graph.vertices:
-                for edge in partitionable_graph.\
-                        outgoing_edges_from_vertex(vertex):
-                    cur.execute(
-                        "INSERT INTO Partitionable_edges ("
-                        "pre_vertex, post_vertex, edge_label) "
-                        "VALUES({}, {}, '{}');"
-                        .format(vertices.index(edge.pre_vertex) + 1,
-                                vertices.index(edge.post_vertex) + 1,
-                                edge.label))
-            # update graph
-            edge_id_offset = 0
-            for vertex in partitionable_graph.vertices:
-                edges = partitionable_graph.outgoing_edges_from_vertex(vertex)
+                    recorded = int(vertex.record)
+                vertex_rows.append(
+                    (vertex_ids[vertex], vertex.label, vertex.n_atoms,
+                     vertex.get_max_atoms_per_core(), recorded))
+            cur.executemany(
+                "INSERT INTO Partitionable_vertices("
+                "vertex_id, vertex_label, no_atoms, max_atom_constrant,"
+                " recorded) VALUES(?, ?, ?, ?, ?)", vertex_rows)
+
+            # add edges, numbering them in the order of the outgoing edges
+            # of each vertex, and the graph linking each vertex to its
+            # outgoing edges
+            edge_rows = list()
+            graph_rows = list()
+            for vertex in vertices:
                 for edge in partitionable_graph.\
                         outgoing_edges_from_vertex(vertex):
-                    cur.execute(
-                        "INSERT INTO Partitionable_graph ("
-                        "vertex_id, edge_id)"
-                        " VALUES({}, {})"
-                        .format(vertices.index(vertex) + 1,
-                                edges.index(edge) + edge_id_offset))
-                edge_id_offset += len(edges)
+                    edge_id = len(edge_rows) + 1
+                    edge_rows.append(
+                        (edge_id, vertex_ids[edge.pre_vertex],
+                         vertex_ids[edge.post_vertex], edge.label))
+                    graph_rows.append((vertex_ids[vertex], edge_id))
+            cur.executemany(
+                "INSERT INTO Partitionable_edges ("
+                "edge_id, pre_vertex, post_vertex, edge_label) "
+                "VALUES(?, ?, ?, ?)", edge_rows)
+            cur.executemany(
+                "INSERT INTO Partitionable_graph ("
+                "vertex_id, edge_id) VALUES(?, ?)", graph_rows)
             connection.commit()
             connection.close()
             self._lock_condition.release()
@@ -135,9 +143,8 @@ class SpynnakerDataBaseInterface(FrontEndCommonDataBaseInterface):
             graph_mapper):
         # noinspection PyBroadException
         try:
-            import sqlite3 as sqlite
             self._lock_condition.acquire()
-            connection = sqlite.connect(self._database_path)
+            connection = self._connect()
             cur = connection.cursor()
             # create table
             self._done_mapping = True
@@ -148,32 +155,91 @@ class SpynnakerDataBaseInterface(FrontEndCommonDataBaseInterface):
                 "FOREIGN KEY (vertex_id)"
                 " REFERENCES Partitioned_vertices(vertex_id))")
 
-            # insert into table
-            vertices = list(partitionable_graph.vertices)
-            for partitioned_vertex in partitioned_graph.subvertices:
-                out_going_edges = (partitioned_graph
-                                   .outgoing_subedges_from_subvertex(
-                                       partitioned_vertex))
-                if len(out_going_edges) > 0:
-                    routing_info = (routing_infos
-                                    .get_subedge_information_from_subedge(
-                                        out_going_edges[0]))
-                    vertex = graph_mapper.get_vertex_from_subvertex(
-                        partitioned_vertex)
-                    vertex_id = vertices.index(vertex) + 1
-                    vertex_slice = graph_mapper.get_subvertex_slice(
-                        partitioned_vertex)
-                    keys = routing_info.get_keys(vertex_slice.n_atoms)
-                    neuron_id = vertex_slice.lo_atom
-                    for key in keys:
-                        cur.execute(
-                            "INSERT INTO key_to_neuron_mapping("
-                            "vertex_id, key, neuron_id) "
-                            "VALUES ({}, {}, {})"
-                            .format(vertex_id, key, neuron_id))
-                        neuron_id += 1
+            vertex_ids = dict(
+                (vertex, vertex_id + 1) for vertex_id, vertex in
+                enumerate(partitionable_graph.vertices))
+
+            # The keys of each subvertex are a contiguous range, so a row
+            # for each subvertex is enough to decode any key
+            cur.execute(
+                "CREATE TABLE key_to_neuron_ranges("
+                "vertex_id INTEGER, base_key INTEGER PRIMARY KEY, "
+                "mask INTEGER, lo_atom INTEGER, n_atoms INTEGER, "
+                "FOREIGN KEY (vertex_id)"
+                " REFERENCES Partitionable_vertices(vertex_id))")
+            cur.executemany(
+                "INSERT INTO key_to_neuron_ranges("
+                "vertex_id, base_key, mask, lo_atom, n_atoms) "
+                "VALUES (?, ?, ?, ?, ?)",
+                self._get_key_to_neuron_ranges(
+                    partitioned_graph, routing_infos, graph_mapper,
+                    vertex_ids))
+
+            if config.getboolean("Database", "create_per_neuron_key_mapping"):
+
+                # insert into table, in one batch generated a subvertex at a
+                # time
+                cur.executemany(
+                    "INSERT INTO key_to_neuron_mapping("
+                    "vertex_id, key, neuron_id) VALUES (?, ?, ?)",
+                    self._get_key_to_neuron_rows(
+                        partitioned_graph, routing_infos, graph_mapper,
+                        vertex_ids))
+
+                # index the neurons once they have all been added, so that
+                # the key of a neuron can also be looked up
+                cur.execute(
+                    "CREATE INDEX key_to_neuron_mapping_neuron "
+                    "ON key_to_neuron_mapping(vertex_id, neuron_id)")
             connection.commit()
             connection.close()
             self._lock_condition.release()
         except Exception:
             traceback.print_exc()
+
+    @staticmethod
+    def _get_key_to_neuron_ranges(
+            partitioned_graph, routing_infos, graph_mapper, vertex_ids):
+        """ Generate the (vertex id, base key, mask, lo atom, n atoms) rows\
+            of the key ranges of each subvertex with outgoing subedges
+        """
+        for partitioned_vertex in partitioned_graph.subvertices:
+            out_going_edges = (partitioned_graph
+                               .outgoing_subedges_from_subvertex(
+                                   partitioned_vertex))
+            if len(out_going_edges) > 0:
+                routing_info = (routing_infos
+                                .get_subedge_information_from_subedge(
+                                    out_going_edges[0]))
+                key_and_mask = routing_info.keys_and_masks[0]
+                vertex = graph_mapper.get_vertex_from_subvertex(
+                    partitioned_vertex)
+                vertex_slice = graph_mapper.get_subvertex_slice(
+                    partitioned_vertex)
+                yield (vertex_ids[vertex], int(key_and_mask.key),
+                       int(key_and_mask.mask), vertex_slice.lo_atom,
+                       vertex_slice.n_atoms)
+
+    @staticmethod
+    def _get_key_to_neuron_rows(
+            partitioned_graph, routing_infos, graph_mapper, vertex_ids):
+        """ Generate the (vertex id, key, neuron id) rows of the key to\
+            neuron mapping of each subvertex with outgoing subedges
+        """
+        for partitioned_vertex in partitioned_graph.subvertices:
+            out_going_edges = (partitioned_graph
+                               .outgoing_subedges_from_subvertex(
+                                   partitioned_vertex))
+            if len(out_going_edges) > 0:
+                routing_info = (routing_infos
+                                .get_subedge_information_from_subedge(
+                                    out_going_edges[0]))
+                vertex = graph_mapper.get_vertex_from_subvertex(
+                    partitioned_vertex)
+                vertex_id = vertex_ids[vertex]
+                vertex_slice = graph_mapper.get_subvertex_slice(
+                    partitioned_vertex)
+                keys = routing_info.get_keys(vertex_slice.n_atoms)
+                for neuron_id, key in enumerate(
+                        keys, vertex_slice.lo_atom):
+                    yield (vertex_id, int(key), neuron_id)
@@ -0,0 +1,688 @@
+"""
+HostEmulator
+"""
+from spynnaker.pyNN.models.abstract_models.abstract_model_components\
+    .abstract_conductance_vertex import AbstractConductanceVertex
+from spynnaker.pyNN.models.abstract_models.abstract_model_components\
+    .abstract_dual_exponential_vertex import AbstractDualExponentialVertex
+from spynnaker.pyNN.models.abstract_models.abstract_model_components\
+    .abstract_exp_population_vertex import AbstractExponentialPopulationVertex
+from spynnaker.pyNN.models.abstract_models.abstract_model_components\
+    .abstract_integrate_and_fire_properties \
+    import AbstractIntegrateAndFireProperties
+from spynnaker.pyNN.models.abstract_models.abstract_model_components\
+    .abstract_Izhikevich_vertex import AbstractIzhikevichVertex
+from spynnaker.pyNN.models.neural_projections.delay_afferent_partitioned_edge\
+    import DelayAfferentPartitionedEdge
+from spynnaker.pyNN.models.neural_projections.delay_partitioned_edge \
+    import DelayPartitionedEdge
+from spynnaker.pyNN.models.neural_projections.projection_partitioned_edge \
+    import ProjectionPartitionedEdge
+from spynnaker.pyNN.models.neural_properties.randomDistributions \
+    import generate_parameter
+from spynnaker.pyNN.models.spike_source.spike_source_array \
+    import SpikeSourceArray
+from spynnaker.pyNN.models.spike_source.spike_source_poisson \
+    import SpikeSourcePoisson
+from spynnaker.pyNN.models.utility_models.delay_extension_vertex \
+    import DelayExtensionVertex
+from spynnaker.pyNN.utilities.recorded_neuron_parameter \
+    import RecordedNeuronParameter
+from spynnaker.pyNN import exceptions
+
+from pacman.utilities.progress_bar import ProgressBar
+
+from abc import ABCMeta
+from abc import abstractmethod
+from six import add_metaclass
+import logging
+import numpy
+
+logger = logging.getLogger(__name__)
+
+# The membrane voltage at which an Izhikevich neuron spikes
+_IZHIKEVICH_V_PEAK = 30.0
+
+
+def _get_slice_values(values, vertex_slice):
+    """ Get the values of a parameter for the atoms of a slice, from either\
+        a single value for all atoms or a value for each atom
+    """
+    values = numpy.asarray(values, dtype="float").ravel()
+    if values.size == 1:
+        return numpy.repeat(values, vertex_slice.n_atoms)
+    return values[vertex_slice.lo_atom:vertex_slice.hi_atom + 1].copy()
+
+
+class _SynapseShaping(object):
+    """ Exponentially decaying synaptic input of each synapse type of the\
+        atoms of a core
+    """
+
+    def __init__(self, taus, vertex_slice, machine_time_step):
+        taus = numpy.vstack([_get_slice_values(tau, vertex_slice)
+                             for tau in taus])
+        self._decay = numpy.exp(-float(machine_time_step) / (1000.0 * taus))
+        self._init = (taus * (1.0 - self._decay) *
+                      (1000.0 / float(machine_time_step)))
+        self._input = numpy.zeros(taus.shape)
+
+    @property
+    def n_synapse_types(self):
+        return self._input.shape[0]
+
+    def step(self, ring_buffer_input):
+        """ Decay the input and add the input of the ring buffer for the time\
+            step
+
+        :param ring_buffer_input: a (n_synapse_types, n_atoms) array
+        :return: a tuple of the excitatory and the inhibitory input, where\
+                    the last synapse type is the inhibitory one
+        """
+        self._input *= self._decay
+        self._input += ring_buffer_input * self._init
+        return self._input[:-1].sum(axis=0), self._input[-1]
+
+
+class _LeakyIntegrateAndFireModel(object):
+    """ Leaky integrate and fire neurons with current or conductance based\
+        input, updated with the same closed form as the machine
+    """
+
+    def __init__(self, vertex, vertex_slice, machine_time_step):
+        self._v = _get_slice_values(vertex._v_init, vertex_slice)
+        self._v_thresh = _get_slice_values(vertex._v_thresh, vertex_slice)
+        self._v_reset = _get_slice_values(vertex._v_reset, vertex_slice)
+        self._v_rest = _get_slice_values(vertex._v_rest, vertex_slice)
+        self._r_membrane = _get_slice_values(
+            vertex._r_membrane, vertex_slice)
+        self._i_offset = _get_slice_values(vertex._i_offset, vertex_slice)
+        self._exp_tc = _get_slice_values(
+            vertex._exp_tc(machine_time_step), vertex_slice)
+        self._t_refract = numpy.ceil(
+            _get_slice_values(vertex._tau_refrac, vertex_slice) /
+            (machine_time_step / 1000.0)).astype("int32")
+        self._refract_timer = numpy.zeros(vertex_slice.n_atoms, dtype="int32")
+        self._e_rev_e = None
+        self._e_rev_i = None
+        if isinstance(vertex, AbstractConductanceVertex):
+            self._e_rev_e = _get_slice_values(vertex._e_rev_E, vertex_slice)
+            self._e_rev_i = _get_slice_values(vertex._e_rev_I, vertex_slice)
+
+    @property
+    def v(self):
+        return self._v
+
+    def step(self, exc_input, inh_input):
+        """ Update the neurons by one time step
+
+        :return: a boolean array of the neurons which spiked
+        """
+        if self._e_rev_e is None:
+            input_this_timestep = exc_input - inh_input + self._i_offset
+        else:
+            input_this_timestep = (exc_input * (self._e_rev_e - self._v) +
+                                   inh_input * (self._e_rev_i - self._v) +
+                                   self._i_offset)
+        active = self._refract_timer <= 0
+        alpha = input_this_timestep * self._r_membrane + self._v_rest
+        self._v = numpy.where(
+            active, alpha - self._exp_tc * (alpha - self._v), self._v)
+        self._refract_timer = numpy.where(
+            active, self._refract_timer, self._refract_timer - 1)
+
+        spiked = active & (self._v >= self._v_thresh)
+        self._v[spiked] = self._v_reset[spiked]
+        self._refract_timer[spiked] = self._t_refract[spiked]
+        return spiked
+
+
+class _IzhikevichModel(object):
+    """ Izhikevich neurons with current based input, updated with the same\
+        midpoint Runge-Kutta step as the machine
+    """
+
+    def __init__(self, vertex, vertex_slice, machine_time_step):
+        self._a = _get_slice_values(vertex._a, vertex_slice)
+        self._b = _get_slice_values(vertex._b, vertex_slice)
+        self._c = _get_slice_values(vertex._c, vertex_slice)
+        self._d = _get_slice_values(vertex._d, vertex_slice)
+        self._v = _get_slice_values(vertex._v_init, vertex_slice)
+        self._u = _get_slice_values(vertex._u_init, vertex_slice)
+        self._i_offset = _get_slice_values(vertex._i_offset, vertex_slice)
+        self._h = machine_time_step / 1000.0
+
+    @property
+    def v(self):
+        return self._v
+
+    def step(self, exc_input, inh_input):
+        """ Update the neurons by one time step
+
+        :return: a boolean array of the neurons which spiked
+        """
+        input_this_timestep = exc_input - inh_input + self._i_offset
+        last_v = self._v
+        last_u = self._u
+        pre_alpha = 140.0 + input_this_timestep - last_u
+        alpha = pre_alpha + (5.0 + 0.04 * last_v) * last_v
+        eta = last_v + 0.5 * self._h * alpha
+        beta = 0.5 * self._h * (self._b * last_v - last_u) * self._a
+        self._v = last_v + self._h * (
+            pre_alpha - beta + (5.0 + 0.04 * eta) * eta)
+        self._u = last_u + self._a * self._h * (
+            -last_u - beta + self._b * eta)
+
+        spiked = self._v >= _IZHIKEVICH_V_PEAK
+        self._v[spiked] = self._c[spiked]
+        self._u[spiked] += self._d[spiked]
+        return spiked
+
+
+@add_metaclass(ABCMeta)
+class _Core(object):
+    """ The atoms of one subvertex, which produce a number of spikes for\
+        each atom at each time step
+    """
+
+    def __init__(self, vertex, vertex_slice):
+        self._vertex = vertex
+        self._vertex_slice = vertex_slice
+        self._spikes = numpy.zeros(vertex_slice.n_atoms, dtype="uint32")
+        self._spike_times = None
+        self._spike_ids = None
+        if getattr(vertex, "record", False):
+            self._spike_times = list()
+            self._spike_ids = list()
+
+    @property
+    def vertex(self):
+        return self._vertex
+
+    @property
+    def vertex_slice(self):
+        return self._vertex_slice
+
+    @property
+    def spikes(self):
+        """ The number of spikes of each atom in the last time step
+        """
+        return self._spikes
+
+    def _set_spikes(self, timestep, spikes):
+        self._spikes = spikes
+        if self._spike_times is not None:
+            ids = numpy.flatnonzero(spikes)
+            if ids.size > 0:
+                self._spike_ids.append(ids + self._vertex_slice.lo_atom)
+                self._spike_times.append(numpy.repeat(timestep, ids.size))
+
+    def get_recorded_spikes(self):
+        """ Get the ids and time steps of the spikes recorded
+        """
+        if self._spike_times is None or len(self._spike_times) == 0:
+            return numpy.zeros(0, dtype="int64"), numpy.zeros(0, dtype="int64")
+        return (numpy.concatenate(self._spike_ids),
+                numpy.concatenate(self._spike_times))
+
+    @abstractmethod
+    def step(self, timestep):
+        """ Work out the spikes of the time step
+        """
+
+
+class _SpikeSourceArrayCore(_Core):
+    """ The spikes of a spike source array, which are sent at the time steps\
+        given
+    """
+
+    def __init__(self, vertex, vertex_slice):
+        _Core.__init__(self, vertex, vertex_slice)
+        self._ticks, self._neurons = vertex._get_spike_ticks_and_keys(
+            vertex_slice)
+
+    def step(self, timestep):
+        start, end = numpy.searchsorted(
+            self._ticks, [timestep, timestep + 1])
+        self._set_spikes(timestep, numpy.bincount(
+            self._neurons[start:end],
+            minlength=self._vertex_slice.n_atoms).astype("uint32"))
+
+
+class _SpikeSourcePoissonCore(_Core):
+    """ The spikes of a Poisson spike source, with a number of spikes drawn\
+        for each atom at each time step between the start and end of the atom
+    """
+
+    def __init__(self, vertex, vertex_slice, machine_time_step):
+        _Core.__init__(self, vertex, vertex_slice)
+        ticks_per_ms = 1000.0 / machine_time_step
+        self._spikes_per_tick = numpy.zeros(vertex_slice.n_atoms)
+        self._start_ticks = numpy.zeros(vertex_slice.n_atoms, dtype="int64")
+        self._end_ticks = numpy.empty(vertex_slice.n_atoms, dtype="int64")
+        self._end_ticks.fill(numpy.iinfo("int64").max)
+        for i, atom in enumerate(xrange(vertex_slice.lo_atom,
+                                        vertex_slice.hi_atom + 1)):
+            rate = generate_parameter(vertex._rate, atom)
+            start = generate_parameter(vertex._start, atom)
+            self._spikes_per_tick[i] = rate / (ticks_per_ms * 1000.0)
+            self._start_ticks[i] = int(start * ticks_per_ms)
+            if vertex._duration is not None:
+                self._end_ticks[i] = int(
+                    (generate_parameter(vertex._duration, atom) + start) *
+                    ticks_per_ms)
+
+        # Each core has a stream of its own, as on the machine
+        if vertex._seed is None:
+            self._rng = numpy.random.RandomState()
+        else:
+            self._rng = numpy.random.RandomState(
+                list(vertex._seed) + [vertex_slice.lo_atom])
+
+    def step(self, timestep):
+        spikes = self._rng.poisson(self._spikes_per_tick).astype("uint32")
+        spikes[(timestep < self._start_ticks) |
+               (timestep >= self._end_ticks)] = 0
+        self._set_spikes(timestep, spikes)
+
+
+class _DelayExtensionCore(_Core):
+    """ A delay extension, which sends the spikes of its source at the same\
+        time step; the extra delay is added to the connections from it
+    """
+
+    def __init__(self, vertex, vertex_slice):
+        _Core.__init__(self, vertex, vertex_slice)
+        self._source = None
+
+    def set_source(self, source):
+        self._source = source
+
+    def step(self, timestep):
+        if self._source is not None:
+            self._spikes = self._source.spikes
+
+
+class _NeuronCore(_Core):
+    """ The neurons of a population, with a ring buffer of the input to each\
+        synapse type of each neuron at each of the next time steps
+    """
+
+    def __init__(self, vertex, vertex_slice, n_timesteps, machine_time_step,
+                 neuron_model, synapse_taus):
+        _Core.__init__(self, vertex, vertex_slice)
+        self._neuron_model = neuron_model
+        self._synapse_shaping = _SynapseShaping(
+            synapse_taus, vertex_slice, machine_time_step)
+        self._n_inputs = (self._synapse_shaping.n_synapse_types *
+                          vertex_slice.n_atoms)
+        self._ring_buffer_size = 1
+        self._ring_buffer = None
+        self._pending_indices = list()
+        self._pending_weights = list()
+
+        self._v = None
+        self._gsyn = None
+        if vertex.record_v:
+            self._v = numpy.zeros((n_timesteps, vertex_slice.n_atoms))
+        if vertex.record_gsyn:
+            self._gsyn = numpy.zeros((n_timesteps, vertex_slice.n_atoms))
+
+    @property
+    def n_inputs(self):
+        """ The number of inputs of each time step of the ring buffer, one\
+            per synapse type per neuron, with the inputs of each synapse\
+            type together
+        """
+        return self._n_inputs
+
+    @property
+    def ring_buffer_size(self):
+        return self._ring_buffer_size
+
+    @property
+    def recorded_v(self):
+        return self._v
+
+    @property
+    def recorded_gsyn(self):
+        return self._gsyn
+
+    def add_max_delay(self, max_delay):
+        """ Make sure that the ring buffer can hold input with a delay
+        """
+        self._ring_buffer_size = max(self._ring_buffer_size, max_delay + 1)
+
+    def add_input(self, indices, weights):
+        """ Add input to the ring buffer
+
+        :param indices: the index of each input in the flattened ring buffer
+        :param weights: the weight of each input
+        """
+        self._pending_indices.append(indices)
+        self._pending_weights.append(weights)
+
+    def step(self, timestep):
+        if self._ring_buffer is None:
+            self._ring_buffer = numpy.zeros(
+                (self._ring_buffer_size, self._n_inputs))
+
+        # Add all of the input received since the last time step at once
+        if len(self._pending_indices) > 0:
+            self._ring_buffer += numpy.bincount(
+                numpy.concatenate(self._pending_indices),
+                numpy.concatenate(self._pending_weights),
+                minlength=self._ring_buffer.size).reshape(
+                    self._ring_buffer.shape)
+            self._pending_indices = list()
+            self._pending_weights = list()
+
+        slot = timestep % self._ring_buffer_size
+        exc_input, inh_input = self._synapse_shaping.step(
+            self._ring_buffer[slot].reshape((-1, self._vertex_slice.n_atoms)))
+        self._ring_buffer[slot] = 0
+
+        self._set_spikes(timestep, self._neuron_model.step(
+            exc_input, inh_input).astype("uint32"))
+        if self._v is not None:
+            self._v[timestep] = self._neuron_model.v
+        if self._gsyn is not None:
+            self._gsyn[timestep] = exc_input - inh_input
+
+
+class _Connection(object):
+    """ The synapses from the atoms of one core to the neurons of another,\
+        held in compressed sparse row form with a row for each source atom
+    """
+
+    def __init__(self, pre_core, post_core, pre_atoms, synaptic_list,
+                 delays):
+        """
+
+        :param pre_core: the core sending the spikes
+        :param post_core: the core receiving the spikes
+        :param pre_atoms: the source atom of each synapse, relative to the\
+                    first atom of the pre_core
+        :param synaptic_list: the list of the synapses
+        :param delays: the delay of each synapse in time steps
+        """
+        self._pre_core = pre_core
+        self._post_core = post_core
+        order = numpy.argsort(pre_atoms, kind="mergesort")
+        self._row_offsets = numpy.searchsorted(
+            pre_atoms[order],
+            numpy.arange(pre_core.vertex_slice.n_atoms + 1))
+        self._delays = delays[order].astype("int64")
+        self._input_indices = (
+            synaptic_list.synapse_types[order].astype("int64") *
+            post_core.vertex_slice.n_atoms +
+            synaptic_list.target_indices[order])
+        self._weights = (synaptic_list.weights[order] /
+                         post_core.vertex.weight_scale)
+        if self._delays.size > 0:
+            post_core.add_max_delay(int(self._delays.max()))
+
+    def send(self, timestep):
+        """ Send the spikes of the pre_core in a time step to the post_core
+        """
+        spikes = self._pre_core.spikes
+        fired = numpy.flatnonzero(spikes)
+        if fired.size == 0:
+            return
+        starts = self._row_offsets[fired]
+        lengths = self._row_offsets[fired + 1] - starts
+        n_synapses = lengths.sum()
+        if n_synapses == 0:
+            return
+        synapses = numpy.arange(n_synapses) + numpy.repeat(
+            starts - (numpy.cumsum(lengths) - lengths), lengths)
+        slots = (timestep + self._delays[synapses]) % \
+            self._post_core.ring_buffer_size
+        self._post_core.add_input(
+            slots * self._post_core.n_inputs + self._input_indices[synapses],
+            self._weights[synapses] * numpy.repeat(spikes[fired], lengths))
+
+
+class HostEmulator(object):
+    """ Runs a partitioned graph on the host rather than on a machine, using\
+        the synaptic lists of the subedges and the neuron parameters of the\
+        vertices.  The neurons of each subvertex are updated together at\
+        each time step, in the same way as on the machine, and the spikes,\
+        v and gsyn of the populations set to record them are recorded.\
+        Leaky integrate and fire neurons (current and conductance based),\
+        Izhikevich neurons, exponential and dual exponential synapses,\
+        spike source arrays, Poisson spike sources and delay extensions are\
+        emulated; any other vertex does not send or receive spikes.
+    """
+
+    def __init__(self, partitioned_graph, graph_mapper, machine_time_step,
+                 n_timesteps):
+        """
+
+        :param partitioned_graph: the graph to run
+        :param graph_mapper: the mapping between the partitioned graph and\
+                    the partitionable graph
+        :param machine_time_step: the length of a time step in microseconds
+        :param n_timesteps: the number of time steps to run for
+        """
+        self._machine_time_step = machine_time_step
+        self._n_timesteps = n_timesteps
+        self._n_timesteps_run = 0
+        self._cores = dict()
+        self._cores_by_vertex = dict()
+        not_emulated = set()
+        for subvertex in partitioned_graph.subvertices:
+            vertex = graph_mapper.get_vertex_from_subvertex(subvertex)
+            core = self._create_core(
+                vertex, graph_mapper.get_subvertex_slice(subvertex))
+            if core is None:
+                not_emulated.add(vertex)
+            else:
+                self._cores[subvertex] = core
+                self._cores_by_vertex.setdefault(vertex, list()).append(core)
+        for vertex in not_emulated:
+            logger.warn("{} cannot be emulated on the host, so it will not "
+                        "send or receive spikes".format(vertex.label))
+
+        self._connections = list()
+        for subedge in partitioned_graph.subedges:
+            self._add_subedge(subedge, graph_mapper)
+
+        # Delay extensions send the spikes of their sources in the same
+        # time step, so they must be updated after everything else
+        self._ordered_cores = sorted(
+            self._cores.values(),
+            key=lambda core: isinstance(core, _DelayExtensionCore))
+
+    def _create_core(self, vertex, vertex_slice):
+        if isinstance(vertex, SpikeSourceArray):
+            return _SpikeSourceArrayCore(vertex, vertex_slice)
+        if isinstance(vertex, SpikeSourcePoisson):
+            return _SpikeSourcePoissonCore(
+                vertex, vertex_slice, self._machine_time_step)
+        if isinstance(vertex, DelayExtensionVertex):
+            return _DelayExtensionCore(vertex, vertex_slice)
+
+        if isinstance(vertex, AbstractDualExponentialVertex):
+            synapse_taus = [vertex.tau_syn_E, vertex.tau_syn_E2,
+                            vertex.tau_syn_I]
+        elif isinstance(vertex, AbstractExponentialPopulationVertex):
+            synapse_taus = [vertex.tau_syn_E, vertex.tau_syn_I]
+        else:
+            return None
+
+        if isinstance(vertex, AbstractIzhikevichVertex):
+            neuron_model = _IzhikevichModel(
+                vertex, vertex_slice, self._machine_time_step)
+        elif isinstance(vertex, AbstractIntegrateAndFireProperties):
+            neuron_model = _LeakyIntegrateAndFireModel(
+                vertex, vertex_slice, self._machine_time_step)
+        else:
+            return None
+        return _NeuronCore(
+            vertex, vertex_slice, self._n_timesteps, self._machine_time_step,
+            neuron_model, synapse_taus)
+
+    def _add_subedge(self, subedge, graph_mapper):
+        pre_core = self._cores.get(subedge.pre_subvertex)
+        post_core = self._cores.get(subedge.post_subvertex)
+        if pre_core is None or post_core is None:
+            return
+
+        if isinstance(subedge, DelayAfferentPartitionedEdge):
+            post_core.set_source(pre_core)
+            return
+        if (not isinstance(subedge, ProjectionPartitionedEdge) or
+                not isinstance(post_core, _NeuronCore)):
+            return
+
+        synaptic_list = subedge.get_synapse_sublist(graph_mapper)
+        pre_atoms = synaptic_list.get_row_indices()
+        delays = synaptic_list.delays.astype("int64")
+        if isinstance(subedge, DelayPartitionedEdge):
+
+            # The rows of each delay stage follow those of the stage before,
+            # and the delays of each stage are relative to its start
+            delay_edge = \
+                graph_mapper.get_partitionable_edge_from_partitioned_edge(
+                    subedge)
+            n_pre_atoms = pre_core.vertex_slice.n_atoms
+            stages = pre_atoms // n_pre_atoms
+            pre_atoms = pre_atoms % n_pre_atoms
+            delays = delays + ((stages + 1) *
+                               delay_edge.max_delay_per_neuron)
+        self._connections.append(_Connection(
+            pre_core, post_core, pre_atoms, synaptic_list, delays))
+
+    @property
+    def n_timesteps_run(self):
+        return self._n_timesteps_run
+
+    def run(self):
+        """ Run all of the time steps
+        """
+        progress_bar = ProgressBar(self._n_timesteps,
+                                   "Emulating the simulation on the host")
+        for timestep in xrange(self._n_timesteps):
+            for core in self._ordered_cores:
+                core.step(timestep)
+            for connection in self._connections:
+                connection.send(timestep)
+            self._n_timesteps_run += 1
+            progress_bar.update()
+        progress_bar.end()
+
+    def get_spikes(self, vertex):
+        """ Get the spikes recorded by a vertex
+
+        :return: a 2-column numpy array of cell ids and spike times, ordered\
+                    by id and then by time
+        """
+        ids, timesteps = self._get_recorded_spikes(vertex)
+        order = numpy.lexsort((timesteps, ids))
+        return numpy.column_stack((
+            ids[order], timesteps[order] * (self._machine_time_step / 1000.0)))
+
+    def iter_spikes(self, vertex, chunk_timesteps):
+        """ Iterate over the spikes recorded by a vertex in chunks of time,\
+            as they would be read from a machine
+
+        :param chunk_timesteps: the number of time steps in each chunk
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one for each chunk of time steps in order of\
+                    time, with each ordered by time and then by id
+        """
+        if chunk_timesteps < 1:
+            raise exceptions.ConfigurationException(
+                "The number of time steps in each chunk must be at least 1")
+        ids, timesteps = self._get_recorded_spikes(vertex)
+        order = numpy.lexsort((ids, timesteps))
+        ids = ids[order]
+        timesteps = timesteps[order]
+        ms_per_tick = self._machine_time_step / 1000.0
+        for first_timestep in xrange(
+                0, self._n_timesteps_run, chunk_timesteps):
+            start, end = numpy.searchsorted(
+                timesteps, [first_timestep, first_timestep + chunk_timesteps])
+            yield numpy.column_stack((
+                ids[start:end], timesteps[start:end] * ms_per_tick))
+
+    def iter_spikes_by_core(self, vertex):
+        """ Iterate over the spikes recorded by each core of a vertex, as\
+            they would be read from a machine
+
+        :return: an iterable of 2-column numpy arrays of cell ids and spike\
+                    times, one for each core in order of cell id, with each\
+                    ordered by id and then by time
+        """
+        ms_per_tick = self._machine_time_step / 1000.0
+        cores = sorted(self._cores_by_vertex.get(vertex, list()),
+                       key=lambda core: core.vertex_slice.lo_atom)
+        for core in cores:
+            ids, timesteps = core.get_recorded_spikes()
+            order = numpy.lexsort((timesteps, ids))
+            yield numpy.column_stack((
+                ids[order], timesteps[order] * ms_per_tick))
+
+    def _get_recorded_spikes(self, vertex):
+        """ Get the ids and time steps of the spikes recorded by every core\
+            of a vertex, in no particular order
+        """
+        ids = [numpy.zeros(0, dtype="int64")]
+        timesteps = [numpy.zeros(0, dtype="int64")]
+        for core in self._cores_by_vertex.get(vertex, list()):
+            core_ids, core_timesteps = core.get_recorded_spikes()
+            ids.append(core_ids)
+            timesteps.append(core_timesteps)
+        return numpy.concatenate(ids), numpy.concatenate(timesteps)
+
+    def get_spike_counts(self, vertex):
+        """ Count the spikes recorded by a vertex
+
+        :return: a tuple of an array of the number of spikes of each atom\
+                    and an array of the number of spikes of all of the atoms\
+                    at each time step
+        """
+        atom_counts = numpy.zeros(vertex.n_atoms, dtype="uint32")
+        timestep_counts = numpy.zeros(self._n_timesteps, dtype="uint32")
+        for core in self._cores_by_vertex.get(vertex, list()):
+            ids, timesteps = core.get_recorded_spikes()
+            atom_counts += numpy.bincount(
+                ids, minlength=vertex.n_atoms).astype("uint32")
+            timestep_counts += numpy.bincount(
+                timesteps, minlength=self._n_timesteps).astype("uint32")
+        return atom_counts, timestep_counts
+
+    def _get_recorded_parameter(self, vertex, get_values, filename):
+        recorded = RecordedNeuronParameter(
+            self._n_timesteps, vertex.n_atoms,
+            self._machine_time_step / 1000.0, filename)
+        for core in self._cores_by_vertex.get(vertex, list()):
+            values = get_values(core)
+            if values is not None:
+                recorded.set_values(core.vertex_slice.lo_atom, values)
+        return recorded
+
+    def get_v(self, vertex, filename=None):
+        """ Get the v recorded by a vertex
+
+        :param filename: a file to memory map the values into, or None to\
+                    hold them in memory
+        :rtype: \
+            :py:class:`spynnaker.pyNN.utilities.recorded_neuron_parameter.RecordedNeuronParameter`
+        """
+        return self._get_recorded_parameter(
+            vertex, lambda core: getattr(core, "recorded_v", None), filename)
+
+    def get_gsyn(self, vertex, filename=None):
+        """ Get the gsyn recorded by a vertex, which is the excitatory minus\
+            the inhibitory input of each neuron as on the machine
+
+        :param filename: a file to memory map the values into, or None to\
+                    hold them in memory
+        :rtype: \
+            :py:class:`spynnaker.pyNN.utilities.recorded_neuron_parameter.RecordedNeuronParameter`
+        """
+        return self._get_recorded_parameter(
+            vertex, lambda core: getattr(core, "recorded_gsyn", None),
+            filename)
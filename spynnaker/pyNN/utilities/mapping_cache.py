@@ -0,0 +1,274 @@
+"""
+MappingCache
+"""
+from pacman.model.graph_mapper.slice import Slice
+
+from spynnaker.pyNN.models.spike_source.spike_source_array \
+    import SpikeSourceArray
+
+import cPickle
+import hashlib
+import logging
+import numpy
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Changed whenever the objects kept in the cache change, so that mappings
+# kept by an older version are not reused
+_CACHE_FORMAT_VERSION = 1
+
+# The extension of the files of the cache
+_CACHE_FILE_EXTENSION = ".mapping"
+
+# How deep into the attributes of objects such as constraints to go when
+# working out a fingerprint
+_MAX_DESCRIPTION_DEPTH = 8
+
+
+def _update_hash(hasher, value, names, depth=0):
+    """ Add a description of a value to a hash, which does not depend on\
+        where any objects are in memory
+
+    :param hasher: the hashlib object to update
+    :param value: the value to describe
+    :param names: a dict of the id of objects to the name to describe them\
+                by, such as the vertices of the graph by their index
+    :param depth: the number of objects that the value is inside
+    """
+    if id(value) in names:
+        hasher.update(names[id(value)])
+    elif value is None or isinstance(value, (bool, int, long, float,
+                                             basestring)):
+        hasher.update(repr(value))
+    elif isinstance(value, numpy.ndarray):
+        hasher.update("{}{}".format(value.dtype, value.shape))
+        hasher.update(numpy.ascontiguousarray(value).tostring())
+    elif isinstance(value, (list, tuple)):
+        hasher.update("[{}".format(len(value)))
+        for item in value:
+            _update_hash(hasher, item, names, depth + 1)
+    elif isinstance(value, (set, frozenset)):
+        hasher.update("{{{}".format(len(value)))
+        for digest in sorted(_get_digest(item, names, depth + 1)
+                             for item in value):
+            hasher.update(digest)
+    elif isinstance(value, dict):
+        hasher.update("{{{}".format(len(value)))
+        for digest in sorted(_get_digest(item, names, depth + 1)
+                             for item in value.iteritems()):
+            hasher.update(digest)
+    elif isinstance(value, type):
+        hasher.update("{}.{}".format(value.__module__, value.__name__))
+    else:
+        hasher.update("{}.{}".format(type(value).__module__,
+                                     type(value).__name__))
+        if hasattr(value, "__dict__") and depth < _MAX_DESCRIPTION_DEPTH:
+            _update_hash(hasher, vars(value), names, depth + 1)
+
+
+def _get_digest(value, names, depth=0):
+    """ Get the hash of the description of a value on its own
+    """
+    hasher = hashlib.sha1()
+    _update_hash(hasher, value, names, depth)
+    return hasher.digest()
+
+
+class MappingCache(object):
+    """ A cache on disk of the results of mapping partitionable graphs onto\
+        machines, so that a script which maps the same network onto the same\
+        machine as a previous run can skip partitioning, placement, tag\
+        allocation, key allocation and routing.
+
+        Each mapping is kept in a file named by a fingerprint of the network\
+        and the machine.  The fingerprint covers everything which the\
+        mapping depends on - the types, sizes, resources and constraints\
+        of the vertices, the connectivity and delays of the edges, the\
+        machine and the configuration of the mapping algorithms - but not\
+        parameters such as weights, which only change the data written to\
+        the machine.  The vertices and edges of the partitionable graph are\
+        kept by their index in the graph, so that the mapping reloaded\
+        refers to the vertices and edges of the current script.
+    """
+
+    def __init__(self, directory, max_mappings_kept):
+        """
+
+        :param directory: the directory to keep the mappings in
+        :param max_mappings_kept: the number of mappings to keep, after\
+                    which the least recently used are removed
+        """
+        self._directory = directory
+        self._max_mappings_kept = max_mappings_kept
+
+    @staticmethod
+    def _get_names(partitionable_graph, machine):
+        """ Get the names by which the objects of the script which the\
+            mapping refers to are kept, keyed by their id
+        """
+        names = dict()
+        for index, vertex in enumerate(partitionable_graph.vertices):
+            names[id(vertex)] = "vertex {}".format(index)
+        for index, edge in enumerate(partitionable_graph.edges):
+            names[id(edge)] = "edge {}".format(index)
+        names[id(partitionable_graph)] = "graph"
+        names[id(machine)] = "machine"
+        return names
+
+    def get_fingerprint(self, partitionable_graph, machine, config_items):
+        """ Get the fingerprint of mapping a network onto a machine
+
+        :param partitionable_graph: the graph of the network
+        :param machine: the machine, including any virtual chips
+        :param config_items: any other values which the mapping depends on,\
+                    such as the configuration of the algorithms
+        :return: the fingerprint, as a string of hexadecimal digits
+        """
+        names = self._get_names(partitionable_graph, machine)
+        hasher = hashlib.sha1()
+        _update_hash(hasher, _CACHE_FORMAT_VERSION, names)
+        _update_hash(hasher, config_items, names)
+
+        for vertex in partitionable_graph.vertices:
+            vertex_slice = Slice(0, vertex.n_atoms - 1)
+            _update_hash(hasher, [
+                type(vertex), vertex.label, vertex.n_atoms,
+                vertex.constraints, vertex.get_max_atoms_per_core(),
+                vertex.get_sdram_usage_for_atoms(
+                    vertex_slice, partitionable_graph),
+                vertex.get_dtcm_usage_for_atoms(
+                    vertex_slice, partitionable_graph),
+                vertex.get_cpu_usage_for_atoms(
+                    vertex_slice, partitionable_graph)], names)
+
+            # The spikes of a spike source array are held by its partitioned
+            # vertices, so they cannot change without mapping again
+            if isinstance(vertex, SpikeSourceArray):
+                _update_hash(hasher, vertex._get_spike_ticks(), names)
+
+        for edge in partitionable_graph.edges:
+            _update_hash(hasher, [
+                type(edge), edge.label, edge.pre_vertex, edge.post_vertex,
+                edge.constraints], names)
+            synapse_list = getattr(edge, "synapse_list", None)
+            if synapse_list is not None:
+                _update_hash(hasher, [
+                    synapse_list.row_offsets, synapse_list.target_indices,
+                    synapse_list.delays, synapse_list.synapse_types], names)
+
+        for chip in machine.chips:
+            _update_hash(hasher, [
+                chip.x, chip.y, chip.virtual, chip.sdram.size,
+                [(processor.processor_id, processor.is_monitor)
+                 for processor in chip.processors],
+                [(link.source_link_id, link.destination_x,
+                  link.destination_y) for link in chip.router.links]], names)
+        return hasher.hexdigest()
+
+    def _get_file_path(self, fingerprint):
+        return os.path.join(self._directory,
+                            fingerprint + _CACHE_FILE_EXTENSION)
+
+    def load(self, fingerprint, partitionable_graph, machine):
+        """ Load the mapping with a fingerprint, if it is in the cache
+
+        :param fingerprint: the fingerprint of the mapping
+        :param partitionable_graph: the graph of the network mapped
+        :param machine: the machine mapped onto
+        :return: a tuple of the partitioned graph, graph mapper, placements,\
+                    tags, routing infos and router tables, or None if the\
+                    mapping is not in the cache or cannot be read
+        """
+        names = self._get_names(partitionable_graph, machine)
+        objects = dict()
+        for obj in ([partitionable_graph, machine] +
+                    list(partitionable_graph.vertices) +
+                    list(partitionable_graph.edges)):
+            objects[names[id(obj)]] = obj
+
+        # The cache may be shared with other processes, which can remove
+        # the mapping at any time
+        file_path = self._get_file_path(fingerprint)
+        try:
+            cache_file = open(file_path, "rb")
+        except IOError:
+            return None
+        try:
+            with cache_file:
+                unpickler = cPickle.Unpickler(cache_file)
+                unpickler.persistent_load = objects.__getitem__
+                mapping = unpickler.load()
+        except Exception as e:
+            logger.warn("The mapping in {} could not be read, so the network"
+                        " will be mapped again: {}".format(file_path, e))
+            return None
+
+        # Mark the mapping as the most recently used; if it has been
+        # removed since it was read, the mapping read is still good
+        try:
+            os.utime(file_path, None)
+        except OSError:
+            pass
+        return mapping
+
+    def save(self, fingerprint, partitionable_graph, machine,
+             partitioned_graph, graph_mapper, placements, tags, routing_infos,
+             router_tables):
+        """ Keep a mapping in the cache; if it cannot be kept, a warning is\
+            logged and the run carries on
+
+        :param fingerprint: the fingerprint of the mapping
+        :param partitionable_graph: the graph of the network mapped
+        :param machine: the machine mapped onto
+        """
+        try:
+            os.makedirs(self._directory)
+        except OSError:
+            if not os.path.isdir(self._directory):
+                logger.warn("The mapping cache directory {} could not be"
+                            " created".format(self._directory))
+                return
+        names = self._get_names(partitionable_graph, machine)
+        file_path = self._get_file_path(fingerprint)
+
+        # Write to a temporary file first, so that a mapping which fails
+        # part of the way through is never read
+        (handle, temp_path) = tempfile.mkstemp(
+            suffix=".tmp", dir=self._directory)
+        try:
+            with os.fdopen(handle, "wb") as cache_file:
+                pickler = cPickle.Pickler(cache_file,
+                                          cPickle.HIGHEST_PROTOCOL)
+                pickler.persistent_id = \
+                    lambda obj: names.get(id(obj), None)
+                pickler.dump((partitioned_graph, graph_mapper, placements,
+                              tags, routing_infos, router_tables))
+            os.rename(temp_path, file_path)
+        except Exception as e:
+            os.remove(temp_path)
+            logger.warn("The mapping could not be kept in the mapping cache:"
+                        " {}".format(e))
+            return
+        self._remove_old_mappings()
+
+    def _remove_old_mappings(self):
+        """ Remove the least recently used mappings beyond the number to be\
+            kept; mappings removed by other processes sharing the cache in\
+            the meantime are skipped
+        """
+        mappings = list()
+        for filename in os.listdir(self._directory):
+            if filename.endswith(_CACHE_FILE_EXTENSION):
+                file_path = os.path.join(self._directory, filename)
+                try:
+                    mappings.append((os.path.getmtime(file_path), file_path))
+                except OSError:
+                    pass
+        mappings.sort(reverse=True)
+        for _, file_path in mappings[self._max_mappings_kept:]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
@@ -0,0 +1,125 @@
+"""
+RecordedNeuronParameter
+"""
+import numpy
+
+# The scale of the fixed point values that neuron parameters are recorded in
+_FIXED_POINT_SCALE = 32767.0
+
+# The number of rows of the compatible output built at a time when iterating
+_CHUNK_ROWS = 65536
+
+
+class RecordedNeuronParameter(object):
+    """ The values of a neuron parameter recorded for every atom of a\
+        population at every time step, held in the layout in which they\
+        are recorded, as a (n_timesteps, n_atoms) matrix of fixed point\
+        values
+    """
+
+    def __init__(self, n_timesteps, n_atoms, ms_per_tick, filename=None):
+        """
+
+        :param n_timesteps: the number of time steps recorded
+        :param n_atoms: the number of atoms recorded
+        :param ms_per_tick: the number of milliseconds in each time step
+        :param filename: the name of a file to memory map the values into,\
+                    or None to hold them in memory
+        """
+        if filename is None:
+            self._raw_values = numpy.zeros((n_timesteps, n_atoms),
+                                           dtype="int32")
+        else:
+            self._raw_values = numpy.memmap(
+                filename, dtype="int32", mode="w+",
+                shape=(n_timesteps, n_atoms))
+        self._ms_per_tick = ms_per_tick
+        self._compatible_output = None
+
+    @property
+    def raw_values(self):
+        """ The fixed point values as a (n_timesteps, n_atoms) matrix of\
+            int32, which may be memory mapped
+        """
+        return self._raw_values
+
+    @property
+    def values(self):
+        """ The values as a (n_timesteps, n_atoms) matrix of float32
+        """
+        return (self._raw_values.astype("float32") /
+                numpy.float32(_FIXED_POINT_SCALE))
+
+    @property
+    def n_timesteps(self):
+        return self._raw_values.shape[0]
+
+    @property
+    def n_atoms(self):
+        return self._raw_values.shape[1]
+
+    @property
+    def ids(self):
+        """ The ids of the atoms of each column of the values
+        """
+        return numpy.arange(self.n_atoms)
+
+    @property
+    def times(self):
+        """ The times in milliseconds of each row of the values
+        """
+        return numpy.arange(self.n_timesteps) * self._ms_per_tick
+
+    def set_raw_values(self, lo_atom, data):
+        """ Set the values of a range of atoms from the data recorded by\
+            a core
+
+        :param lo_atom: the first atom of the range
+        :param data: the recorded data, as a (n_timesteps_written,\
+                    n_atoms_in_range) array of int32
+        """
+        self._raw_values[:data.shape[0], lo_atom:lo_atom + data.shape[1]] = \
+            data
+
+    def set_values(self, lo_atom, values):
+        """ Set the values of a range of atoms from values which are not in\
+            fixed point, such as those of a simulation run on the host
+
+        :param lo_atom: the first atom of the range
+        :param values: the values, as a (n_timesteps_written,\
+                    n_atoms_in_range) array of floats
+        """
+        self.set_raw_values(lo_atom, numpy.round(
+            numpy.asarray(values) * _FIXED_POINT_SCALE).astype("int32"))
+
+    @property
+    def compatible_output(self):
+        """ The values as a 3-column numpy array of atom ids, times and\
+            values, ordered by id and then by time; this is only built the\
+            first time that it is asked for
+        """
+        if self._compatible_output is None:
+            self._compatible_output = numpy.column_stack((
+                numpy.repeat(self.ids, self.n_timesteps),
+                numpy.tile(self.times, self.n_atoms),
+                self._raw_values.T.ravel() / _FIXED_POINT_SCALE))
+        return self._compatible_output
+
+    def iter_compatible_output(self):
+        """ Iterate over the rows of the compatible output in chunks of the\
+            rows of a number of atoms, without building the whole array
+
+        :return: an iterable of 3-column numpy arrays of atom ids, times and\
+                    values, ordered by id and then by time
+        """
+        times = self.times
+        n_atoms_per_chunk = max(1, _CHUNK_ROWS // max(1, self.n_timesteps))
+        for lo_atom in xrange(0, self.n_atoms, n_atoms_per_chunk):
+            raw_values = self._raw_values[
+                :, lo_atom:lo_atom + n_atoms_per_chunk]
+            n_atoms = raw_values.shape[1]
+            yield numpy.column_stack((
+                numpy.repeat(numpy.arange(lo_atom, lo_atom + n_atoms),
+                             self.n_timesteps),
+                numpy.tile(times, n_atoms),
+                raw_values.T.ravel() / _FIXED_POINT_SCALE))
@@ -0,0 +1,142 @@
+"""
+RecordingReader
+"""
+from data_specification import utility_calls as dsg_utility_calls
+
+from multiprocessing.pool import ThreadPool
+from collections import OrderedDict
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingReader(object):
+    """ Reads recording regions back from a set of cores.  The addresses\
+        and sizes of the regions of every core are found in a single pass\
+        before any of the recorded data is read, and the reads of each pass\
+        are shared between a pool of threads, with the cores of each chip\
+        read by the same thread.
+    """
+
+    def __init__(self, transceiver, n_threads=1):
+        """
+
+        :param transceiver: the transceiver to read the memory with
+        :param n_threads: the maximum number of reads to do at the same\
+                    time; 1 does all of the reads in this thread
+        """
+        self._transceiver = transceiver
+        self._n_threads = n_threads
+
+    def get_recording_regions(self, placements, region):
+        """ Get the address and size of the data in a recording region of\
+            each of a list of placements
+
+        :param placements: the placements of the cores to read from
+        :param region: the id of the recording region
+        :return: a list of (data address, n bytes written), one per\
+                    placement, with the data address being after the\
+                    region's size word
+        """
+        def get_recording_region(placement):
+            (x, y, p) = placement.x, placement.y, placement.p
+
+            # Get the App Data for the core
+            app_data_base_address = \
+                self._transceiver.get_cpu_information_from_core(
+                    x, y, p).user[0]
+
+            # Get the position of the region
+            region_base_address_offset = \
+                dsg_utility_calls.get_region_base_address_offset(
+                    app_data_base_address, region)
+            region_base_address_buf = self._transceiver.read_memory(
+                x, y, region_base_address_offset, 4)
+            region_base_address = struct.unpack_from(
+                "<I", region_base_address_buf)[0]
+            region_base_address += app_data_base_address
+
+            # Read the size
+            number_of_bytes_written_buf = self._transceiver.read_memory(
+                x, y, region_base_address, 4)
+            number_of_bytes_written = struct.unpack_from(
+                "<I", number_of_bytes_written_buf)[0]
+            return region_base_address + 4, number_of_bytes_written
+
+        return self._map_by_chip(get_recording_region, placements)
+
+    def read_recording_regions(self, placements, recording_regions,
+                               progress_bar=None):
+        """ Read the data of the recording regions of each of a list of\
+            placements
+
+        :param placements: the placements of the cores to read from
+        :param recording_regions: a list of (data address, n bytes) for each\
+                    placement, as returned by get_recording_regions
+        :param progress_bar: an optional progress bar to update as the data\
+                    of each placement is read
+        :return: a list of the data read, one per placement
+        """
+        def read_recording_region(placement_and_region):
+            placement, (address, n_bytes) = placement_and_region
+            logger.debug("Reading {} ({}) bytes starting at {}".format(
+                n_bytes, hex(n_bytes), hex(address)))
+            return self._transceiver.read_memory(
+                placement.x, placement.y, address, n_bytes)
+
+        return self._map_by_chip(
+            read_recording_region, zip(placements, recording_regions),
+            lambda item: (item[0].x, item[0].y), progress_bar)
+
+    def _map_by_chip(self, function, items, get_chip=None,
+                     progress_bar=None):
+        """ Call a function on each of a list of items, with the items\
+            on the same chip handled by the same thread
+
+        :param function: the function to call on each item
+        :param items: the items
+        :param get_chip: a function to get the (x, y) of the chip of an\
+                    item; by default the item is a placement
+        :param progress_bar: an optional progress bar to update as each item\
+                    is completed
+        :return: a list of the results, in the order of the items
+        """
+        if get_chip is None:
+            get_chip = (lambda placement: (placement.x, placement.y))
+        items = list(items)
+        results = [None] * len(items)
+
+        # Group the items by chip
+        chip_items = OrderedDict()
+        for index, item in enumerate(items):
+            chip_items.setdefault(get_chip(item), list()).append(index)
+
+        def process_chip(indices):
+            return [(index, function(items[index])) for index in indices]
+
+        if self._n_threads <= 1 or len(chip_items) <= 1:
+            chip_results = (process_chip(indices)
+                            for indices in chip_items.itervalues())
+            return self._gather(chip_results, results, progress_bar)
+
+        pool = ThreadPool(min(self._n_threads, len(chip_items)))
+        try:
+            return self._gather(
+                pool.imap_unordered(process_chip, chip_items.values()),
+                results, progress_bar)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    @staticmethod
+    def _gather(chip_results, results, progress_bar):
+        """ Put the results of each chip into the list of results in the\
+            order of the items, as each chip is completed
+        """
+        for indexed_results in chip_results:
+            for index, result in indexed_results:
+                results[index] = result
+                if progress_bar is not None:
+                    progress_bar.update()
+        return results
@@ -0,0 +1,115 @@
+"""
+RegionDataCache
+"""
+from data_specification import utility_calls as dsg_utility_calls
+
+import struct
+
+
+class RegionDataCache(object):
+    """ Reads the memory regions of cores on the machine, keeping the data\
+        read keyed on the placement of the core and the region, so that\
+        each part of a region is only read once.  The data is only valid\
+        until the simulation is run again, at which point the cache must be\
+        cleared.
+
+        The cache can be used in place of a transceiver by anything that only\
+        reads memory; a read which falls within the data of a region already\
+        read is answered from that data, and any other read is passed on to\
+        the transceiver and kept to answer the same read again
+    """
+
+    def __init__(self, transceiver):
+        """
+
+        :param transceiver: the transceiver to read with
+        """
+        self._transceiver = transceiver
+        self._cpu_information = dict()
+        self._region_addresses = dict()
+        self._region_data = dict()
+        self._chip_regions = dict()
+        self._reads = dict()
+
+    @property
+    def transceiver(self):
+        return self._transceiver
+
+    def get_cpu_information_from_core(self, x, y, p):
+        """ Get the information about a core, which is only read once
+        """
+        key = (x, y, p)
+        if key not in self._cpu_information:
+            self._cpu_information[key] = \
+                self._transceiver.get_cpu_information_from_core(x, y, p)
+        return self._cpu_information[key]
+
+    def get_region_address(self, placement, region):
+        """ Get the address of the start of a region of a core
+
+        :param placement: the placement of the core
+        :param region: the region
+        :return: the address in the SDRAM of the chip of the core
+        """
+        key = (placement.x, placement.y, placement.p, region)
+        if key not in self._region_addresses:
+            app_data_base_address = self.get_cpu_information_from_core(
+                placement.x, placement.y, placement.p).user[0]
+            region_pointer_address = \
+                dsg_utility_calls.get_region_base_address_offset(
+                    app_data_base_address, region)
+            region_offset = struct.unpack_from("<I", buffer(self.read_memory(
+                placement.x, placement.y, region_pointer_address, 4)))[0]
+            self._region_addresses[key] = app_data_base_address + region_offset
+        return self._region_addresses[key]
+
+    def read_region(self, placement, region, n_bytes):
+        """ Read the start of a region of a core; only the part of the\
+            region which has not already been read is read from the machine
+
+        :param placement: the placement of the core
+        :param region: the region to read
+        :param n_bytes: the number of bytes from the start of the region\
+                    to read
+        :return: a bytearray holding at least n_bytes of the region
+        """
+        key = (placement.x, placement.y, placement.p, region)
+        data = self._region_data.get(key, bytearray())
+        if len(data) < n_bytes:
+
+            # Replace the data rather than extending it, as there may be
+            # views on to the old data
+            address = self.get_region_address(placement, region)
+            data = data + self._transceiver.read_memory(
+                placement.x, placement.y, address + len(data),
+                n_bytes - len(data))
+            if key not in self._region_data:
+                self._chip_regions.setdefault(
+                    (placement.x, placement.y), list()).append(key)
+            self._region_data[key] = data
+        return data
+
+    def read_memory(self, x, y, base_address, length):
+        """ Read memory from a chip, answering from the data already read\
+            where possible
+        """
+        for key in self._chip_regions.get((x, y), list()):
+            offset = base_address - self._region_addresses[key]
+            data = self._region_data[key]
+            if 0 <= offset and offset + length <= len(data):
+                return data[offset:offset + length]
+
+        read_key = (x, y, base_address, length)
+        if read_key not in self._reads:
+            self._reads[read_key] = self._transceiver.read_memory(
+                x, y, base_address, length)
+        return self._reads[read_key]
+
+    def clear(self):
+        """ Forget all the data that has been read
+        """
+        self._cpu_information = dict()
+        self._region_addresses = dict()
+        self._region_data = dict()
+        self._chip_regions = dict()
+        self._reads = dict()
@@ -6,11 +6,23 @@ from spynnaker.pyNN.models.neural_properties.randomDistributions \
 from spinn_front_end_common.utilities import exceptions
 import numpy
 import os
+import itertools
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# The number of rows of a data file read at a time
+_DATA_CHUNK_ROWS = 65536
+
+# The extensions of data files which hold binary numpy arrays rather than
+# lines of text
+_BINARY_EXTENSIONS = (".npy", ".npz")
+
+# The name of the array of rows in a .npz data file; the other arrays of the
+# file hold the values of the header of a text file
+_NPZ_DATA_NAME = "data"
+
 
 def check_directory_exists_and_create_if_not(filename):
     """
@@ -49,73 +61,166 @@ def convert_param_to_numpy(param, no_atoms):
         return numpy.array(param, dtype=float)
 
 
+def is_binary_data_file(file_path):
+    """ Determine if a data file holds a binary numpy array rather than\
+        lines of text, from its extension
+    """
+    return os.path.splitext(file_path)[1].lower() in _BINARY_EXTENSIONS
+
+
+def write_binary_data_file(file_path, chunks, n_rows, n_columns, first_id,
+                           n_atoms, dt=None):
+    """ Write rows of data values to a .npy or .npz file, in the columns of\
+        the text files read by read_in_data_from_file and\
+        read_spikes_from_file.  The rows of a .npy file are written to the\
+        file as each chunk is given, so that they are never all in memory at\
+        once, and can be memory mapped when they are read.  A .npz file also\
+        holds the first_id, n, dimensions, last_id and dt written in the\
+        header of a text file, and is compressed.
+
+    :param file_path: the path of the file to write
+    :param chunks: an iterable of arrays of n_columns columns
+    :param n_rows: the total number of rows in the chunks
+    :param n_columns: the number of values in each row
+    :param first_id: the id of the first atom
+    :param n_atoms: the number of atoms
+    :param dt: the time between values in milliseconds, or None if the values\
+                are not at regular times
+    """
+    check_directory_exists_and_create_if_not(file_path)
+    if os.path.splitext(file_path)[1].lower() == ".npy":
+        data = numpy.lib.format.open_memmap(
+            file_path, mode="w+", dtype="float", shape=(n_rows, n_columns))
+        row = 0
+        for chunk in chunks:
+            data[row:row + chunk.shape[0]] = chunk
+            row += chunk.shape[0]
+        data.flush()
+        del data
+        return
+
+    data = numpy.concatenate(
+        [numpy.zeros((0, n_columns))] + list(chunks)).astype("float")
+    header = {"first_id": first_id, "n": n_atoms, "dimensions": [n_atoms],
+              "last_id": first_id + n_atoms - 1}
+    if dt is not None:
+        header["dt"] = dt
+    header[_NPZ_DATA_NAME] = data
+    numpy.savez_compressed(file_path, **header)
+
+
+def _read_data_chunks(file_path, n_columns, chunk_size=_DATA_CHUNK_ROWS):
+    """ Read the rows of a file of data values in chunks, each of which is an\
+        array with a row per line of the file.  Text files have one row of\
+        tab separated values per line, with lines starting with # ignored.\
+        .npy files hold a single 2D array of the rows, which is memory mapped\
+        rather than read in one go, and .npz files hold the same array as\
+        their "data" array, or as their first array if there is no "data".
+
+    :param file_path: the path of the file to read
+    :param n_columns: the number of values in each row
+    :param chunk_size: the number of rows in each chunk
+    :return: an iterable of arrays of n_columns columns
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in _BINARY_EXTENSIONS:
+        if extension == ".npy":
+            data = numpy.load(file_path, mmap_mode="r")
+        else:
+            archive = numpy.load(file_path)
+            if _NPZ_DATA_NAME in archive.files:
+                data = archive[_NPZ_DATA_NAME]
+            else:
+                data = archive[archive.files[0]]
+        if data.ndim != 2 or data.shape[1] < n_columns:
+            raise exceptions.ConfigurationException(
+                "The data in {} must be an array with {} columns".format(
+                    file_path, n_columns))
+        for start in xrange(0, data.shape[0], chunk_size):
+            yield numpy.array(data[start:start + chunk_size, :n_columns],
+                              dtype="float")
+        return
+
+    with open(file_path, "r") as data_file:
+        while True:
+            lines = list(itertools.islice(data_file, chunk_size))
+            if len(lines) == 0:
+                return
+            values = numpy.fromstring(
+                " ".join(line for line in lines if not line.startswith("#")),
+                dtype="float", sep=" ")
+            if values.size % n_columns != 0:
+                raise exceptions.ConfigurationException(
+                    "Each line of {} must hold {} values".format(
+                        file_path, n_columns))
+            yield values.reshape((-1, n_columns))
+
+
+def _read_filtered_data(file_path, n_columns, min_atom, max_atom, min_time,
+                        max_time):
+    """ Read the rows of a file of data values with a time in the first\
+        column and an atom id in the second, keeping only those rows with\
+        atoms and times in the given ranges (where each limit of the ranges\
+        is ignored if it is None), and sorting them by atom and then time
+
+    :return: an array of the atom id, the time and any other values of each\
+                row kept
+    """
+    chunks = list()
+    for chunk in _read_data_chunks(file_path, n_columns):
+        times = chunk[:, 0]
+        atom_ids = chunk[:, 1]
+        keep = numpy.ones(chunk.shape[0], dtype="bool")
+        if min_atom is not None:
+            keep &= atom_ids >= min_atom
+        if max_atom is not None:
+            keep &= atom_ids < max_atom
+        if min_time is not None:
+            keep &= times >= min_time
+        if max_time is not None:
+            keep &= times < max_time
+        chunk = chunk[keep]
+        chunk[:, [0, 1]] = chunk[:, [1, 0]]
+        chunks.append(chunk)
+
+    if len(chunks) == 0:
+        return numpy.zeros((0, n_columns))
+    result = numpy.concatenate(chunks)
+    return result[numpy.lexsort((result[:, 1], result[:, 0]))]
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time):
     """method for helping code read in files of data values where the values are
-    in a format of <Time><tab><atom_id><tab><data_value>
+    in a format of <Time><tab><atom_id><tab><data_value>, or from a .npy or
+    .npz file holding an array of the same columns
 
     :param file_path: absolute filepath to a file where gsyn values have been
     written
-    :param min_atom: min neuron id to which neurons to read in
-    :param max_atom: max neuron id to which neurons to read in
-    :param min_time: min time slot to read neurons values of.
-    :param max_time:max time slot to read neurons values of.
-    :return: a numpi destacked array containing time stamps, neuron id and the
+    :param min_atom: min neuron id to which neurons to read in, or None
+    :param max_atom: max neuron id to which neurons to read in, or None
+    :param min_time: min time slot to read neurons values of, or None
+    :param max_time:max time slot to read neurons values of, or None
+    :return: a numpi destacked array containing neuron id, time stamps and the
     data value.
     """
-    times = list()
-    atom_ids = list()
-    data_items = list()
-
-    with open(file_path, 'r') as fsource:
-            read_data = fsource.readlines()
-
-    for line in read_data:
-        if not line.startswith('#'):
-            values = line.split("\t")
-            neuron_id = int(eval(values[1]))
-            time = float(eval(values[0]))
-            data_value = float(eval(values[2]))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                times.append(time)
-                atom_ids.append(neuron_id)
-                data_items.append(data_value)
-            else:
-                print "failed to enter {}:{}".format(neuron_id, time)
-
-    result = numpy.dstack((atom_ids, times, data_items))[0]
-    result = result[numpy.lexsort((times, atom_ids))]
-    return result
+    return _read_filtered_data(
+        file_path, 3, min_atom, max_atom, min_time, max_time)
 
 
 def read_spikes_from_file(file_path, min_atom, max_atom, min_time, max_time):
     """
-    helper method for reading spikes from a file
+    helper method for reading spikes from a file, in a format of
+    <Time><tab><atom_id>, or from a .npy or .npz file holding an array of
+    the same columns
     :param file_path: absolute filepath to a file where gsyn values have been
     written
-    :param min_atom: min neuron id to which neurons to read in
-    :param max_atom: max neuron id to which neurons to read in
-    :param min_time: min time slot to read neurons values of.
-    :param max_time:max time slot to read neurons values of.
-    :return: a numpi destacked array containing time stamps, neuron id and the
+    :param min_atom: min neuron id to which neurons to read in, or None
+    :param max_atom: max neuron id to which neurons to read in, or None
+    :param min_time: min time slot to read neurons values of, or None
+    :param max_time:max time slot to read neurons values of, or None
+    :return: a numpi destacked array containing neuron id and the
     spike times.
     """
-    spike_times = list()
-    spike_ids = list()
-    with open(file_path, 'r') as fsource:
-            read_data = fsource.readlines()
-
-    for line in read_data:
-        if not line.startswith('#'):
-            values = line.split("\t")
-            neuron_id = int(eval(values[1]))
-            time = float(eval(values[0]))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                spike_times.append(time)
-                spike_ids.append(neuron_id)
-
-    result = numpy.dstack((spike_ids, spike_times))[0]
-    result = result[numpy.lexsort((spike_times, spike_ids))]
-    return result
+    return _read_filtered_data(
+        file_path, 2, min_atom, max_atom, min_time, max_time)
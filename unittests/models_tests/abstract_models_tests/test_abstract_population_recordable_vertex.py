@@ -0,0 +1,145 @@
+import unittest
+import numpy
+from collections import namedtuple
+from pacman.model.graph_mapper.slice import Slice
+from spynnaker.pyNN.models.abstract_models\
+    .abstract_population_recordable_vertex \
+    import AbstractPopulationRecordableVertex
+from unittests.utilities_tests.test_recording_reader import MockTransceiver
+
+Placement = namedtuple("Placement", "x y p")
+SPIKE_REGION = 6
+V_REGION = 7
+
+
+class RecordableVertex(AbstractPopulationRecordableVertex):
+
+    def __init__(self, n_atoms, n_time_steps):
+        AbstractPopulationRecordableVertex.__init__(self, 1000, "Test")
+        self._n_atoms = n_atoms
+        self._no_machine_time_steps = n_time_steps
+
+    def is_recordable(self):
+        return True
+
+
+class GraphMapper(object):
+
+    def __init__(self, slices):
+        self._slices = slices
+
+    def get_subvertices_from_vertex(self, vertex):
+        return reversed(range(len(self._slices)))
+
+    def get_subvertex_slice(self, subvertex):
+        return self._slices[subvertex]
+
+
+class Placements(object):
+
+    def get_placement_of_subvertex(self, subvertex):
+        return Placement(subvertex % 2, 0, subvertex + 1)
+
+
+class TestAbstractPopulationRecordableVertex(unittest.TestCase):
+
+    def setUp(self):
+        self._n_time_steps = 20
+        self._slices = [Slice(0, 39), Slice(40, 49), Slice(50, 99)]
+        rng = numpy.random.RandomState(1)
+        self._spikes = rng.uniform(size=(self._n_time_steps, 100)) < 0.1
+
+        # Pack the spikes of each core into one bitfield per time step
+        core_data = dict()
+        for subvertex, vertex_slice in enumerate(self._slices):
+            n_words = (vertex_slice.n_atoms + 31) // 32
+            spikes = numpy.zeros((self._n_time_steps, n_words * 32),
+                                 dtype="uint8")
+            spikes[:, :vertex_slice.n_atoms] = self._spikes[
+                :, vertex_slice.lo_atom:vertex_slice.hi_atom + 1]
+            bits = numpy.fliplr(spikes.reshape((-1, 32)))
+            data = numpy.packbits(bits).view("uint32").byteswap()
+            placement = Placements().get_placement_of_subvertex(subvertex)
+            core_data[placement] = data.astype("<u4").tostring()
+        self._transceiver = MockTransceiver(SPIKE_REGION, core_data)
+        self._vertex = RecordableVertex(100, self._n_time_steps)
+        self._graph_mapper = GraphMapper(self._slices)
+
+    def _spike_bytes(self, subvertex, vertex_slice):
+        return ((vertex_slice.n_atoms + 31) // 32) * 4
+
+    def _expected_spikes(self):
+        times, ids = numpy.where(self._spikes)
+        return numpy.dstack((ids, times))[0]
+
+    def test_get_spikes(self):
+        spikes = self._vertex._get_spikes(
+            self._graph_mapper, Placements(), self._transceiver, False,
+            SPIKE_REGION, self._spike_bytes)
+        expected = self._expected_spikes()
+        expected = expected[numpy.lexsort((expected[:, 1], expected[:, 0]))]
+        self.assertTrue(numpy.array_equal(spikes, expected))
+
+    def test_iter_spikes_by_core(self):
+        chunks = list(self._vertex._iter_spikes_by_core(
+            self._graph_mapper, Placements(), self._transceiver,
+            SPIKE_REGION, self._spike_bytes))
+        self.assertEqual(len(chunks), len(self._slices))
+        for chunk, vertex_slice in zip(chunks, self._slices):
+            self.assertTrue(numpy.all(chunk[:, 0] >= vertex_slice.lo_atom))
+            self.assertTrue(numpy.all(chunk[:, 0] <= vertex_slice.hi_atom))
+        spikes = self._vertex._get_spikes(
+            self._graph_mapper, Placements(), self._transceiver, False,
+            SPIKE_REGION, self._spike_bytes)
+        self.assertTrue(numpy.array_equal(numpy.vstack(chunks), spikes))
+
+    def test_iter_spikes(self):
+        chunks = list(self._vertex._iter_spikes(
+            self._graph_mapper, Placements(), self._transceiver,
+            SPIKE_REGION, self._spike_bytes, 7))
+        self.assertEqual(len(chunks), 3)
+        for index, chunk in enumerate(chunks):
+            self.assertTrue(numpy.all(chunk[:, 1] >= index * 7))
+            self.assertTrue(numpy.all(chunk[:, 1] < (index + 1) * 7))
+        self.assertTrue(numpy.array_equal(
+            numpy.vstack(chunks), self._expected_spikes()))
+
+    def test_get_spike_counts(self):
+        atom_counts, timestep_counts = self._vertex._get_spike_counts(
+            self._graph_mapper, Placements(), self._transceiver,
+            SPIKE_REGION, self._spike_bytes)
+        self.assertTrue(numpy.array_equal(
+            atom_counts, self._spikes.sum(axis=0)))
+        self.assertTrue(numpy.array_equal(
+            timestep_counts, self._spikes.sum(axis=1)))
+
+    def test_get_neuron_parameter(self):
+        rng = numpy.random.RandomState(2)
+        values = rng.randint(-0x7FFFFFFF, 0x7FFFFFFF,
+                             size=(self._n_time_steps, 100))
+        core_data = dict()
+        for subvertex, vertex_slice in enumerate(self._slices):
+            placement = Placements().get_placement_of_subvertex(subvertex)
+            core_data[placement] = values[
+                :, vertex_slice.lo_atom:vertex_slice.hi_atom + 1].astype(
+                "<i4").tostring()
+        transceiver = MockTransceiver(V_REGION, core_data)
+
+        recorded = self._vertex.get_neuron_parameter(
+            V_REGION, False, True, self._graph_mapper, Placements(),
+            transceiver, 1000, self._n_time_steps * 1.0)
+        self.assertTrue(numpy.array_equal(recorded.raw_values, values))
+        self.assertEqual(recorded.values.dtype, numpy.float32)
+        self.assertTrue(numpy.allclose(recorded.values, values / 32767.0))
+        self.assertTrue(numpy.array_equal(recorded.ids, numpy.arange(100)))
+        self.assertTrue(numpy.array_equal(
+            recorded.times, numpy.arange(self._n_time_steps)))
+
+        compatible = recorded.compatible_output
+        self.assertEqual(compatible.shape, (100 * self._n_time_steps, 3))
+        self.assertEqual(list(compatible[self._n_time_steps + 3]),
+                         [1.0, 3.0, values[3][1] / 32767.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import unittest
+import numpy
 import spynnaker.pyNN as pyNN
 from pprint import pprint as pp
 from spynnaker.pyNN.exceptions import ConfigurationException
@@ -100,6 +101,31 @@ class TestingFixedProbabilityConnector(unittest.TestCase):
         synaptic_list = connection.generate_synapse_list(
             first_population, first_population, 1, 1.0, synapse_type)
         pp(synaptic_list.get_rows())
+        for pre_atom, row in enumerate(synaptic_list.get_rows()):
+            self.assertEqual(list(row.target_indices),
+                             [post_atom for post_atom in
+                              range(number_of_neurons)
+                              if post_atom != pre_atom])
+
+    def test_seed(self):
+        first_population = pyNN.Population(300, pyNN.IF_curr_exp,
+                                           cell_params_lif, label="One pop")
+        second_population = pyNN.Population(600, pyNN.IF_curr_exp,
+                                            cell_params_lif, label="Two pop")
+        connection = pyNN.FixedProbabilityConnector(0.1, 2, 1, seed=5)
+        synaptic_list = connection.generate_synapse_list(
+            first_population, second_population, 1, 1.0, 0)
+
+        # The same seed gives the same connections, whatever else has been
+        # drawn from the random stream in between
+        pyNN.FixedProbabilityConnector(0.1, 2, 1).generate_synapse_list(
+            first_population, second_population, 1, 1.0, 0)
+        other_list = connection.generate_synapse_list(
+            first_population, second_population, 1, 1.0, 0)
+        self.assertTrue(numpy.array_equal(synaptic_list.row_lengths,
+                                          other_list.row_lengths))
+        self.assertTrue(numpy.array_equal(synaptic_list.target_indices,
+                                          other_list.target_indices))
 
 
 if __name__ == "__main__":
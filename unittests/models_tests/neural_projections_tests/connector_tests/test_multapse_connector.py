@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import unittest
+import numpy
 import spynnaker.pyNN as pyNN
 from pprint import pprint as pp
 cell_params_lif = {
@@ -48,6 +49,20 @@ class MultapseConnectorTest(unittest.TestCase):
             first_population, first_population, 1, 1.0, synapse_type)
         pp(synaptic_list.get_rows())
 
+    def test_seed(self):
+        first_population = pyNN.Population(300, pyNN.IF_curr_exp,
+                                           cell_params_lif, label="One pop")
+        connection = pyNN.MultapseConnector(1000, 2, 1, seed=5)
+        synaptic_list = connection.generate_synapse_list(
+            first_population, first_population, 1, 1.0, 0)
+        other_list = connection.generate_synapse_list(
+            first_population, first_population, 1, 1.0, 0)
+        self.assertEqual(synaptic_list.get_n_synapses(), 1000)
+        self.assertTrue(numpy.array_equal(synaptic_list.row_lengths,
+                                          other_list.row_lengths))
+        self.assertTrue(numpy.array_equal(synaptic_list.target_indices,
+                                          other_list.target_indices))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
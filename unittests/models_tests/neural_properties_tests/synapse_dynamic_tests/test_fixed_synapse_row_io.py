@@ -1,13 +1,55 @@
 import unittest
+import numpy
 from spynnaker.pyNN.models.neural_properties.synapse_dynamics\
     .fixed_synapse_row_io import FixedSynapseRowIO
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
+from spynnaker.pyNN.models.neural_properties.synapse_row_info \
+    import SynapseRowInfo
+from spynnaker.pyNN.utilities import constants
 
 
-class MyTestCase(unittest.TestCase):
+class TestFixedSynapseRowIO(unittest.TestCase):
 
-    @unittest.skip("Not implemented")
-    def test_something(self):
-        self.assertEqual(True, False, "Test not implemented yet")
+    def test_packed_synaptic_block(self):
+        rows = [SynapseRowInfo([0, 5, 7], [1.0, 0.5, 0.25], [1, 2, 3],
+                               [0, 1, 0]),
+                SynapseRowInfo([], [], [], []),
+                SynapseRowInfo([3], [2.0], [4], [1])]
+        synaptic_list = SynapticList(rows)
+        row_io = FixedSynapseRowIO()
+        weight_scales = [256.0, 256.0]
+        row_length = row_io.get_max_n_words(synaptic_list) + 1
+        self.assertEqual(row_length, 4)
+
+        block = row_io.get_packed_synaptic_block(
+            synaptic_list, row_length, weight_scales, 1)
+        row_stride = row_length + constants.SYNAPTIC_ROW_HEADER_WORDS
+        self.assertEqual(block.size, row_stride * len(rows))
+        for row_no, row in enumerate(rows):
+            row_words = block[row_no * row_stride:(row_no + 1) * row_stride]
+            n_synapses = len(row.target_indices)
+            self.assertTrue(numpy.array_equal(
+                row_words[:3], [0, n_synapses, 0]))
+            self.assertTrue(numpy.array_equal(
+                row_words[3:3 + n_synapses],
+                row_io.get_packed_fixed_fixed_region(row, weight_scales, 1)))
+            self.assertTrue((row_words[3 + n_synapses:] == 0xBBCCDDEE).all())
+
+    def test_read_packed_synaptic_block(self):
+        synaptic_list = SynapticList.from_arrays(
+            [3, 0, 1], [0, 5, 7, 3], [1.0, 0.5, 0.25, 2.0], [1, 2, 3, 4],
+            [0, 1, 0, 1])
+        row_io = FixedSynapseRowIO()
+        weight_scales = [256.0, 128.0]
+        block = row_io.get_packed_synaptic_block(
+            synaptic_list, 5, weight_scales, 1)
+
+        read_list = row_io.read_packed_synaptic_block(
+            block, 3, 5, weight_scales, 1)
+        self.assertTrue(numpy.array_equal(read_list.row_lengths, [3, 0, 1]))
+        for name in ("target_indices", "weights", "delays", "synapse_types"):
+            self.assertTrue(numpy.array_equal(
+                getattr(read_list, name), getattr(synaptic_list, name)))
 
 
 if __name__ == '__main__':
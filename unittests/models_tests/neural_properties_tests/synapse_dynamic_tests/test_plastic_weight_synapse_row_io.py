@@ -1,13 +1,73 @@
 import unittest
+import numpy
 from spynnaker.pyNN.models.neural_properties.synapse_dynamics\
     .plastic_weight_synapse_row_io import PlasticWeightSynapseRowIo
+from spynnaker.pyNN.models.neural_properties.synapse_dynamics\
+    .plastic_weight_control_synapse_row_io \
+    import PlasticWeightControlSynapseRowIo
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
+from spynnaker.pyNN.models.neural_properties.synapse_row_info \
+    import SynapseRowInfo
+from spynnaker.pyNN.utilities import constants
+
+
+class TestPlasticWeightSynapseRowIo(unittest.TestCase):
+
+    def test_packed_synaptic_block(self):
+        rows = [SynapseRowInfo([0, 5, 7], [1.0, 0.5, 0.25], [1, 2, 3],
+                               [0, 1, 0]),
+                SynapseRowInfo([], [], [], []),
+                SynapseRowInfo([3, 4], [2.0, 1.0], [4, 1], [1, 0])]
+        synaptic_list = SynapticList(rows)
+        row_io = PlasticWeightSynapseRowIo(2, 1.0)
+        weight_scales = [256.0, 256.0]
+        row_length = row_io.get_max_n_words(synaptic_list)
+        self.assertEqual(row_length, max([row_io.get_n_words(row)
+                                          for row in rows]))
+
+        block = row_io.get_packed_synaptic_block(
+            synaptic_list, row_length, weight_scales, 1)
+        row_stride = row_length + constants.SYNAPTIC_ROW_HEADER_WORDS
+        for row_no, row in enumerate(rows):
+            row_words = block[row_no * row_stride:(row_no + 1) * row_stride]
+            plastic_region = row_io.get_packed_plastic_region(
+                row, weight_scales, 1)
+            fixed_plastic_region = row_io.get_packed_fixed_plastic_region(
+                row, weight_scales, 1)
+            self.assertEqual(row_words[0], plastic_region.size)
+            self.assertTrue(numpy.array_equal(
+                row_words[1:1 + plastic_region.size], plastic_region))
+            fixed_start = 1 + plastic_region.size
+            self.assertEqual(row_words[fixed_start], 0)
+            self.assertEqual(row_words[fixed_start + 1],
+                             fixed_plastic_region.size)
+            half_words = row_words[fixed_start + 2:].view(dtype="uint16")
+            self.assertTrue(numpy.array_equal(
+                half_words[:fixed_plastic_region.size], fixed_plastic_region))
+
+    def _check_read_packed_synaptic_block(self, row_io):
+        synaptic_list = SynapticList.from_arrays(
+            [3, 0, 2], [0, 5, 7, 3, 4], [1.0, 0.5, 0.25, 2.0, 1.0],
+            [1, 2, 3, 4, 1], [0, 1, 0, 1, 0])
+        weight_scales = [256.0, 128.0]
+        row_length = row_io.get_max_n_words(synaptic_list) + 2
+        block = row_io.get_packed_synaptic_block(
+            synaptic_list, row_length, weight_scales, 1)
 
+        read_list = row_io.read_packed_synaptic_block(
+            block, 3, row_length, weight_scales, 1)
+        self.assertTrue(numpy.array_equal(read_list.row_lengths, [3, 0, 2]))
+        for name in ("target_indices", "weights", "delays", "synapse_types"):
+            self.assertTrue(numpy.array_equal(
+                getattr(read_list, name), getattr(synaptic_list, name)))
 
-class MyTestCase(unittest.TestCase):
+    def test_read_packed_synaptic_block(self):
+        self._check_read_packed_synaptic_block(
+            PlasticWeightSynapseRowIo(2, 1.0))
 
-    @unittest.skip("Not implemented")
-    def test_something(self):
-        self.assertEqual(True, False, "Test not implemented yet")
+    def test_read_packed_synaptic_block_with_weight_control(self):
+        self._check_read_packed_synaptic_block(
+            PlasticWeightControlSynapseRowIo(1, 1.0, False))
 
 
 if __name__ == '__main__':
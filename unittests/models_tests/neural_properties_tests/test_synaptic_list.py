@@ -1,12 +1,151 @@
 import unittest
+import numpy
+from pacman.model.graph_mapper.slice import Slice
 from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
+from spynnaker.pyNN.models.neural_properties.synapse_row_info \
+    import SynapseRowInfo
+from spynnaker.pyNN import exceptions
 
 
-class MyTestCase(unittest.TestCase):
+class TestSynapticList(unittest.TestCase):
 
-    @unittest.skip("Not implemented")
-    def test_something(self):
-        self.assertEqual(True, False, "Test not implemented yet")
+    def _create_rows(self):
+        return [SynapseRowInfo([0, 2, 5], [1.0, 2.0, 3.0], [1, 5, 20],
+                               [0, 1, 0]),
+                SynapseRowInfo([], [], [], []),
+                SynapseRowInfo([1, 3], [4.0, 5.0], [17, 2], [1, 1])]
+
+    def test_rows_round_trip(self):
+        rows = self._create_rows()
+        synaptic_list = SynapticList(rows)
+        self.assertEqual(synaptic_list.get_n_rows(), 3)
+        self.assertEqual(synaptic_list.get_n_synapses(), 5)
+        for row, original in zip(synaptic_list.get_rows(), rows):
+            self.assertTrue(numpy.array_equal(row.target_indices,
+                                              original.target_indices))
+            self.assertTrue(numpy.array_equal(row.weights, original.weights))
+
+    def test_from_arrays(self):
+        synaptic_list = SynapticList.from_arrays(
+            [2, 0, 1], [0, 1, 2], [1.0, 2.0, 3.0], [1, 1, 1], 1)
+        self.assertTrue(numpy.array_equal(synaptic_list.row_offsets,
+                                          [0, 2, 2, 3]))
+        self.assertTrue(numpy.array_equal(synaptic_list.synapse_types,
+                                          [1, 1, 1]))
+
+    def test_create_atom_sublist(self):
+        synaptic_list = SynapticList(self._create_rows())
+        sublist = synaptic_list.create_atom_sublist(Slice(1, 2), Slice(1, 3))
+        rows = sublist.get_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(len(rows[0].target_indices), 0)
+        self.assertTrue(numpy.array_equal(rows[1].target_indices, [0, 2]))
+
+    def test_create_delay_sublist(self):
+        synaptic_list = SynapticList(self._create_rows())
+        sublist = synaptic_list.create_delay_sublist(2, 17)
+        self.assertTrue(numpy.array_equal(sublist.row_lengths, [1, 0, 2]))
+        self.assertEqual(synaptic_list.get_max_n_connections(
+            vertex_slice=Slice(0, 2), lo_delay=1, hi_delay=5), 2)
+
+    def test_get_n_connections(self):
+        rng = numpy.random.RandomState(3)
+        row_lengths = rng.randint(0, 20, size=30)
+        n_synapses = numpy.sum(row_lengths)
+        synaptic_list = SynapticList.from_arrays(
+            row_lengths, rng.randint(0, 100, size=n_synapses),
+            numpy.ones(n_synapses), rng.randint(1, 32, size=n_synapses), 0)
+        rows = synaptic_list.get_rows()
+        for vertex_slice, lo_delay, hi_delay in (
+                (Slice(0, 99), None, None), (Slice(10, 37), None, None),
+                (None, 5, 16), (Slice(50, 50), 17, 32)):
+            n_connections = synaptic_list.get_n_connections(
+                vertex_slice, lo_delay, hi_delay)
+            self.assertEqual(list(n_connections),
+                             [row.get_n_connections(vertex_slice, lo_delay,
+                                                    hi_delay)
+                              for row in rows])
+            self.assertEqual(
+                synaptic_list.get_max_n_connections(
+                    vertex_slice, lo_delay, hi_delay),
+                max(n_connections))
+
+    def test_max_n_connections_follows_changes(self):
+        synaptic_list = SynapticList(self._create_rows())
+        self.assertEqual(synaptic_list.get_max_n_connections(Slice(0, 2)), 2)
+        synaptic_list.merge(SynapticList(self._create_rows()))
+        self.assertEqual(synaptic_list.get_max_n_connections(Slice(0, 2)), 4)
+        synaptic_list.set_slice_values(
+            SynapticList.from_arrays([2, 0, 0], [3, 3], [1.0, 1.0], [1, 1],
+                                     [0, 0]),
+            Slice(0, 2), Slice(0, 0))
+        self.assertEqual(synaptic_list.get_max_n_connections(Slice(0, 2)), 2)
+
+    def test_copy(self):
+        synaptic_list = SynapticList(self._create_rows())
+        copied = synaptic_list.copy()
+        self.assertIs(copied.weights, synaptic_list.weights)
+
+        # Changing either list leaves the other as it was
+        copied.flip_weights()
+        self.assertTrue(numpy.array_equal(synaptic_list.weights,
+                                          [1.0, 2.0, 3.0, 4.0, 5.0]))
+        self.assertTrue(numpy.array_equal(copied.weights,
+                                          [-1.0, -2.0, -3.0, -4.0, -5.0]))
+        rows = synaptic_list.copy().get_rows()
+        rows[0].delays[0] = 7
+        self.assertEqual(synaptic_list.delays[0], 1)
+        synaptic_list.copy().merge(SynapticList(self._create_rows()))
+        self.assertEqual(synaptic_list.get_n_synapses(), 5)
+
+    def test_merge(self):
+        synaptic_list = SynapticList(self._create_rows())
+        ranges = synaptic_list.merge(SynapticList(self._create_rows()))
+        rows = synaptic_list.get_rows()
+        self.assertTrue(numpy.array_equal(rows[0].target_indices,
+                                          [0, 2, 5, 0, 2, 5]))
+        self.assertTrue(numpy.array_equal(rows[2][ranges[2]].target_indices,
+                                          [1, 3]))
+
+    def test_create_range_sublist(self):
+        synaptic_list = SynapticList(self._create_rows())
+        sublist = synaptic_list.create_range_sublist(
+            [slice(1, 3), slice(0, 0), slice(0, 1)])
+        self.assertTrue(numpy.array_equal(sublist.row_lengths, [2, 0, 1]))
+        self.assertTrue(numpy.array_equal(sublist.target_indices, [2, 5, 1]))
+        self.assertTrue(numpy.array_equal(sublist.delays, [5, 20, 17]))
+
+    def test_set_slice_values(self):
+        synaptic_list = SynapticList(self._create_rows())
+        values = SynapticList.from_arrays([1, 0], [1], [9.0], [3], [0])
+        synaptic_list.set_slice_values(values, Slice(0, 1), Slice(1, 2))
+        self.assertTrue(numpy.array_equal(synaptic_list.weights,
+                                          [1.0, 9.0, 3.0, 4.0, 5.0]))
+        self.assertTrue(numpy.array_equal(synaptic_list.delays,
+                                          [1, 3, 20, 17, 2]))
+
+        # The values of a delay range can come from any row of the values
+        delay_values = SynapticList.from_arrays([0, 1], [0], [8.0], [17], [0])
+        synaptic_list.set_slice_values(
+            delay_values, Slice(2, 2), Slice(0, 3), 10, 20, first_row=1)
+        self.assertTrue(numpy.array_equal(synaptic_list.weights,
+                                          [1.0, 9.0, 3.0, 8.0, 5.0]))
+        self.assertEqual(synaptic_list.target_indices[3], 0)
+
+        self.assertRaises(
+            exceptions.SynapticBlockReadException,
+            synaptic_list.set_slice_values, values, Slice(0, 1), Slice(0, 5))
+
+    def test_get_weight_statistics(self):
+        synaptic_list = SynapticList(self._create_rows())
+        total_weights, total_square_weights, n_connections, max_weights = \
+            synaptic_list.get_weight_statistics(2, 6)
+        self.assertEqual(total_weights.shape, (2, 6))
+        self.assertEqual(total_weights[0][0], 1.0)
+        self.assertEqual(total_weights[1][3], 5.0)
+        self.assertEqual(total_square_weights[0][5], 9.0)
+        self.assertEqual(n_connections.sum(), 5)
+        self.assertTrue(numpy.array_equal(max_weights, [3.0, 5.0]))
 
 
 if __name__ == '__main__':
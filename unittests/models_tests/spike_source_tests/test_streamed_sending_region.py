@@ -0,0 +1,38 @@
+import unittest
+from spynnaker.pyNN.models.spike_source.streamed_sending_region \
+    import StreamedSendingRegion
+
+
+class TestStreamedSendingRegion(unittest.TestCase):
+
+    def _send_all(self, region):
+        sent = list()
+        while region.is_next_timestamp:
+            timestamp = region.next_timestamp
+            keys = list()
+            while region.is_next_key(timestamp):
+                keys.append(region.next_key)
+            sent.append((timestamp, keys))
+        return sent
+
+    def test_send_keys(self):
+        region = StreamedSendingRegion([1, 1, 4, 9, 9, 9], [3, 0, 2, 1, 2, 3])
+        self.assertEqual(list(region.timestamps), [1, 4, 9])
+        self.assertEqual(region.get_n_keys(9), 3)
+        self.assertEqual(region.get_n_keys(5), 0)
+        expected = [(1, [3, 0]), (4, [2]), (9, [1, 2, 3])]
+        self.assertEqual(self._send_all(region), expected)
+        self.assertIsNone(region.next_timestamp)
+
+        # Rewinding sends the same keys again
+        region.rewind()
+        self.assertEqual(self._send_all(region), expected)
+
+    def test_empty(self):
+        region = StreamedSendingRegion([], [])
+        self.assertFalse(region.is_next_timestamp)
+        self.assertEqual(region.n_timestamps, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
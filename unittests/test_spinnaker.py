@@ -1,4 +1,165 @@
 import unittest
+import numpy
+from collections import namedtuple
+from pacman.model.graph_mapper.slice import Slice
+from spynnaker.pyNN.models.abstract_models.abstract_synaptic_manager import \
+    AbstractSynapticManager
+from spynnaker.pyNN.models.neural_projections.projection_partitioned_edge \
+    import ProjectionPartitionedEdge
+from spynnaker.pyNN.spinnaker import Spinnaker
+
+Placement = namedtuple("Placement", "subvertex x y p")
+KeyAndMask = namedtuple("KeyAndMask", "key mask")
+RoutingInfo = namedtuple("RoutingInfo", "keys_and_masks")
+
+
+class PartitionedGraph(object):
+
+    def __init__(self, subedges):
+        self._subedges = subedges
+
+    def incoming_subedges_from_subvertex(self, subvertex):
+        return [subedge for subedge in self._subedges
+                if subedge.post_subvertex == subvertex]
+
+
+class GraphMapper(object):
+
+    def __init__(self, vertex):
+        self._vertex = vertex
+
+    def get_vertex_from_subvertex(self, subvertex):
+        return self._vertex
+
+    def get_subvertex_slice(self, subvertex):
+        return Slice(0, 9)
+
+
+class Tags(object):
+
+    def get_ip_tags_for_vertex(self, subvertex):
+        return list()
+
+    def get_reverse_ip_tags_for_vertex(self, subvertex):
+        return list()
+
+
+class RoutingInfos(object):
+
+    def get_subedge_information_from_subedge(self, subedge):
+        return RoutingInfo([KeyAndMask(0, 0xFFFFF800)])
+
+
+class Placements(object):
+
+    def get_placement_of_subvertex(self, subvertex):
+        return Placement(subvertex, 0, 0, 1)
+
+
+class Population(AbstractSynapticManager):
+    """ A population which sets the weight scales of its incoming subedges\
+        when its data specification is generated, and which reads back the\
+        weight scales that the blocks of its synapses would be read with
+    """
+
+    def __init__(self):
+        pass
+
+    def generate_data_spec(
+            self, subvertex, placement, subgraph, graph, routing_info,
+            hostname, graph_mapper, report_folder, ip_tags, reverse_ip_tags,
+            write_text_specs, application_run_time_folder):
+        for subedge in subgraph.incoming_subedges_from_subvertex(subvertex):
+            subedge.weight_scales_setter([float(placement.p), 2.0])
+
+    def _read_synaptic_lists_from_machine(
+            self, post_placement, transceiver, synapse_io, blocks):
+        return [weight_scales for (_, _, weight_scales) in blocks]
+
+    def get_n_synapse_type_bits(self):
+        return 1
+
+    def write_synapse_parameters(self, spec, subvertex, vertex_slice):
+        pass
+
+
+class PoissonSource(Population):
+    """ A source which draws its seed from the global random numbers when\
+        its data specification is generated, and passes it back as the\
+        weight scales of its incoming subedges
+    """
+
+    def generate_data_spec(
+            self, subvertex, placement, subgraph, graph, routing_info,
+            hostname, graph_mapper, report_folder, ip_tags, reverse_ip_tags,
+            write_text_specs, application_run_time_folder):
+        for subedge in subgraph.incoming_subedges_from_subvertex(subvertex):
+            subedge.weight_scales_setter(
+                [numpy.random.randint(0x7FFFFFFF)])
+
+
+class ProgressBar(object):
+
+    def __init__(self):
+        self.n_updates = 0
+
+    def update(self):
+        self.n_updates += 1
+
+
+class TestSpinnaker(unittest.TestCase):
+
+    def _create_spinnaker(self, vertex, subedges):
+        spinnaker = Spinnaker.__new__(Spinnaker)
+        spinnaker._partitioned_graph = PartitionedGraph(subedges)
+        spinnaker._partitionable_graph = None
+        spinnaker._graph_mapper = GraphMapper(vertex)
+        spinnaker._tags = Tags()
+        spinnaker._routing_infos = RoutingInfos()
+        spinnaker._hostname = None
+        spinnaker._report_default_directory = None
+        spinnaker._writeTextSpecs = False
+        spinnaker._app_data_runtime_folder = None
+        return spinnaker
+
+    def _generate_data_specs(self, vertex):
+        subedges = [ProjectionPartitionedEdge("pre", "post_{}".format(p),
+                                              None)
+                    for p in range(4)]
+        spinnaker = self._create_spinnaker(vertex, subedges)
+        placements = [Placement("post_{}".format(p), 0, 0, p)
+                      for p in range(4)]
+        progress_bar = ProgressBar()
+        spinnaker._generate_data_specs_in_processes(
+            placements, 2, progress_bar)
+        self.assertEqual(progress_bar.n_updates, 4)
+        return spinnaker, subedges
+
+    def test_generate_data_specs_in_processes(self):
+        population = Population()
+        spinnaker, subedges = self._generate_data_specs(population)
+
+        # The weight scales set in the processes are set in this process, so
+        # that the synapses can be read back
+        for p, subedge in enumerate(subedges):
+            self.assertEqual(subedge.weight_scales, [float(p), 2.0])
+            synaptic_lists = population.get_synaptic_lists_from_machine(
+                Placements(), None, subedge.post_subvertex, [subedge],
+                spinnaker._graph_mapper, spinnaker._partitioned_graph, None,
+                spinnaker._routing_infos)
+            self.assertEqual(synaptic_lists, [[float(p), 2.0]])
+
+    def test_generate_data_specs_in_processes_seeds(self):
+
+        # The same global seed gives the same seeds whichever process
+        # generates each data specification, and each placement differs
+        seeds = list()
+        for _ in range(2):
+            numpy.random.seed(1)
+            _, subedges = self._generate_data_specs(PoissonSource())
+            seeds.append([subedge.weight_scales[0] for subedge in subedges])
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertEqual(len(set(seeds[0])), 4)
 
 
 class MyTestCase(unittest.TestCase):
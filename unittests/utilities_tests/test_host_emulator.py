@@ -0,0 +1,119 @@
+import unittest
+import numpy
+from collections import namedtuple
+from pacman.model.graph_mapper.slice import Slice
+from spynnaker.pyNN.models.neural_models.if_curr_exp import \
+    IFCurrentExponentialPopulation
+from spynnaker.pyNN.models.neural_projections.projection_partitioned_edge \
+    import ProjectionPartitionedEdge
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
+from spynnaker.pyNN.models.pynn_population import Population
+from spynnaker.pyNN.models.spike_source.spike_source_array \
+    import SpikeSourceArray
+from spynnaker.pyNN.utilities.host_emulator import HostEmulator
+
+PartitionedGraph = namedtuple("PartitionedGraph", "subvertices subedges")
+PartitionableEdge = namedtuple("PartitionableEdge", "synapse_list")
+Spinnaker = namedtuple("Spinnaker", "host_emulator has_ran transceiver")
+
+
+class GraphMapper(object):
+
+    def __init__(self):
+        self._vertices = dict()
+        self._slices = dict()
+        self._edges = dict()
+
+    def add_subvertex(self, subvertex, vertex_slice, vertex):
+        self._vertices[subvertex] = vertex
+        self._slices[subvertex] = vertex_slice
+
+    def add_subedge(self, subedge, edge):
+        self._edges[subedge] = edge
+
+    def get_vertex_from_subvertex(self, subvertex):
+        return self._vertices[subvertex]
+
+    def get_subvertex_slice(self, subvertex):
+        return self._slices[subvertex]
+
+    def get_partitionable_edge_from_partitioned_edge(self, subedge):
+        return self._edges[subedge]
+
+
+class TestHostEmulator(unittest.TestCase):
+
+    def setUp(self):
+        self._source = SpikeSourceArray(
+            2, [[1.0], [4.0]], 1000, 1, 1, 1.0)
+        self._neurons = IFCurrentExponentialPopulation(
+            4, 1000, 1.0, 1, 1, tau_m=20.0, cm=1.0, v_rest=-65.0,
+            v_reset=-70.0, v_thresh=-50.0, tau_refrac=2.0)
+        self._neurons.set_record(True)
+        self._neurons.set_record_v(True)
+
+        # Source 0 connects to neuron 1 and source 1 to neuron 2, which is
+        # on the second core of the neurons
+        self._graph_mapper = GraphMapper()
+        self._graph_mapper.add_subvertex("source", Slice(0, 1), self._source)
+        self._graph_mapper.add_subvertex("lo", Slice(0, 1), self._neurons)
+        self._graph_mapper.add_subvertex("hi", Slice(2, 3), self._neurons)
+        synapse_list = SynapticList.from_arrays(
+            [1, 1], [1, 2], [20.0, 20.0], [2, 3], 0)
+        subedges = list()
+        for post_subvertex in ["lo", "hi"]:
+            subedge = ProjectionPartitionedEdge(
+                "source", post_subvertex, None)
+            self._graph_mapper.add_subedge(
+                subedge, PartitionableEdge(synapse_list))
+            subedges.append(subedge)
+        self._graph = PartitionedGraph(["source", "lo", "hi"], subedges)
+
+    def test_run(self):
+        emulator = HostEmulator(self._graph, self._graph_mapper, 1000, 8)
+        emulator.run()
+        self.assertEqual(emulator.n_timesteps_run, 8)
+
+        # Each neuron spikes in the time step that the input reaches it
+        self.assertTrue(numpy.array_equal(
+            emulator.get_spikes(self._neurons), [[1, 3.0], [2, 7.0]]))
+        atom_counts, timestep_counts = emulator.get_spike_counts(
+            self._neurons)
+        self.assertEqual(list(atom_counts), [0, 1, 1, 0])
+        self.assertEqual(list(timestep_counts), [0, 0, 0, 1, 0, 0, 0, 1])
+
+        v = emulator.get_v(self._neurons).values
+        self.assertEqual(v.shape, (8, 4))
+        self.assertTrue(numpy.allclose(v[:, [0, 3]], -65.0, atol=0.001))
+        self.assertAlmostEqual(v[3, 1], -70.0, places=3)
+        self.assertAlmostEqual(v[7, 2], -70.0, places=3)
+
+        # The neurons are refractory for 2 time steps after spiking
+        self.assertAlmostEqual(v[4, 1], -70.0, places=3)
+        self.assertAlmostEqual(v[5, 1], -70.0, places=3)
+        self.assertGreater(v[6, 1], -70.0)
+
+    def test_iter_spikes(self):
+        emulator = HostEmulator(self._graph, self._graph_mapper, 1000, 8)
+        emulator.run()
+
+        # Populations read the spikes of an emulated run from the emulator,
+        # as there is no machine to read them from
+        population = Population.__new__(Population)
+        population._vertex = self._neurons
+        population._spinnaker = Spinnaker(emulator, True, None)
+
+        chunks = list(population.iter_spikes(chunk_timesteps=3))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[0].shape, (0, 2))
+        self.assertTrue(numpy.array_equal(chunks[1], [[1, 3.0]]))
+        self.assertTrue(numpy.array_equal(chunks[2], [[2, 7.0]]))
+
+        chunks = list(population.iter_spikes_by_core())
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(numpy.array_equal(chunks[0], [[1, 3.0]]))
+        self.assertTrue(numpy.array_equal(chunks[1], [[2, 7.0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+import numpy
+from spynnaker.pyNN.utilities.database.key_to_neuron_ranges \
+    import KeyToNeuronRanges
+
+
+class TestKeyToNeuronRanges(unittest.TestCase):
+
+    def setUp(self):
+        self._ranges = KeyToNeuronRanges(
+            ["b", "a", "a"], [0x1000, 0x0000, 0x0800],
+            [0xFFFFF800, 0xFFFFF800, 0xFFFFF800], [0, 0, 256], [10, 256, 44])
+
+    def test_get_neuron(self):
+        self.assertEqual(self._ranges.get_neuron(0x0003), ("a", 3))
+        self.assertEqual(self._ranges.get_neuron(0x0805), ("a", 261))
+        self.assertEqual(self._ranges.get_neuron(0x1009), ("b", 9))
+
+        # Keys past the end of a range are not sent by any neuron
+        self.assertIsNone(self._ranges.get_neuron(0x0100))
+        self.assertIsNone(self._ranges.get_neuron(0x100A))
+        self.assertIsNone(self._ranges.get_neuron(0x2000))
+
+    def test_get_neurons(self):
+        keys = [0x1009, 0x0003, 0x0100, 0x0805]
+        indices, neuron_ids = self._ranges.get_neurons(keys)
+        self.assertEqual([self._ranges.labels[i] for i in indices if i >= 0],
+                         ["b", "a", "a"])
+        self.assertEqual(indices[2], -1)
+        self.assertTrue(numpy.array_equal(neuron_ids, [9, 3, 0, 261]))
+
+    def test_from_database(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "input_output_database.db")
+            connection = sqlite3.connect(path)
+            connection.execute(
+                "CREATE TABLE Partitionable_vertices("
+                "vertex_id INTEGER PRIMARY KEY, vertex_label TEXT)")
+            connection.execute(
+                "CREATE TABLE key_to_neuron_ranges("
+                "vertex_id INTEGER, base_key INTEGER PRIMARY KEY, "
+                "mask INTEGER, lo_atom INTEGER, n_atoms INTEGER)")
+            connection.executemany(
+                "INSERT INTO Partitionable_vertices VALUES (?, ?)",
+                [(1, "a"), (2, "b")])
+            connection.executemany(
+                "INSERT INTO key_to_neuron_ranges VALUES (?, ?, ?, ?, ?)",
+                [(2, 0x1000, 0xFFFFF800, 0, 10),
+                 (1, 0x0000, 0xFFFFF800, 0, 256)])
+            connection.commit()
+            connection.close()
+
+            ranges = KeyToNeuronRanges.from_database(path)
+            self.assertEqual(ranges.labels, ["a", "b"])
+            self.assertEqual(ranges.get_neuron(0x1002), ("b", 2))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+from spynnaker.pyNN.models.neural_properties.synaptic_list import SynapticList
+from spynnaker.pyNN.utilities.mapping_cache import MappingCache
+
+Chip = namedtuple("Chip", "x y virtual sdram processors router")
+SDRAM = namedtuple("SDRAM", "size")
+Processor = namedtuple("Processor", "processor_id is_monitor")
+Router = namedtuple("Router", "links")
+Machine = namedtuple("Machine", "chips")
+Graph = namedtuple("Graph", "vertices edges")
+
+
+class Vertex(object):
+
+    def __init__(self, n_atoms, label, tau_m=20.0):
+        self.n_atoms = n_atoms
+        self.label = label
+        self.constraints = list()
+        self.tau_m = tau_m
+
+    def get_max_atoms_per_core(self):
+        return 256
+
+    def get_sdram_usage_for_atoms(self, vertex_slice, graph):
+        return 1000 * (vertex_slice.hi_atom - vertex_slice.lo_atom + 1)
+
+    def get_dtcm_usage_for_atoms(self, vertex_slice, graph):
+        return 0
+
+    def get_cpu_usage_for_atoms(self, vertex_slice, graph):
+        return 0
+
+
+class Edge(object):
+
+    def __init__(self, pre_vertex, post_vertex, synapse_list):
+        self.pre_vertex = pre_vertex
+        self.post_vertex = post_vertex
+        self.label = None
+        self.constraints = list()
+        self.synapse_list = synapse_list
+
+
+class Mapping(object):
+
+    def __init__(self, vertices, placements):
+        self.vertices = vertices
+        self.placements = placements
+
+
+class TestMappingCache(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._cache = MappingCache(self._directory, 2)
+        self._machine = Machine([Chip(
+            0, 0, False, SDRAM(128 * 1024 * 1024),
+            [Processor(p, p == 0) for p in range(18)], Router([]))])
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def _create_graph(self, weight=1.0, delay=1, n_atoms=10, tau_m=20.0):
+        pre_vertex = Vertex(n_atoms, "pre")
+        post_vertex = Vertex(n_atoms, "post", tau_m)
+        synapse_list = SynapticList.from_arrays(
+            [1] * n_atoms, range(n_atoms), [weight] * n_atoms,
+            [delay] * n_atoms, 0)
+        return Graph([pre_vertex, post_vertex],
+                     [Edge(pre_vertex, post_vertex, synapse_list)])
+
+    def _get_fingerprint(self, graph):
+        return self._cache.get_fingerprint(graph, self._machine, [1000])
+
+    def test_fingerprint(self):
+        fingerprint = self._get_fingerprint(self._create_graph())
+        self.assertEqual(fingerprint,
+                         self._get_fingerprint(self._create_graph()))
+
+        # Parameters which do not change the mapping keep the fingerprint
+        self.assertEqual(fingerprint, self._get_fingerprint(
+            self._create_graph(weight=2.0, tau_m=10.0)))
+
+        # Anything which changes the mapping changes the fingerprint
+        self.assertNotEqual(fingerprint, self._get_fingerprint(
+            self._create_graph(delay=2)))
+        self.assertNotEqual(fingerprint, self._get_fingerprint(
+            self._create_graph(n_atoms=11)))
+        self.assertNotEqual(fingerprint, self._cache.get_fingerprint(
+            self._create_graph(), self._machine, [100]))
+
+    def test_save_and_load(self):
+        graph = self._create_graph()
+        fingerprint = self._get_fingerprint(graph)
+        self.assertIsNone(self._cache.load(fingerprint, graph, self._machine))
+        mapping = Mapping(graph.vertices, {graph.vertices[0]: (0, 0, 1)})
+        self._cache.save(fingerprint, graph, self._machine, mapping, None,
+                         None, None, None, None)
+
+        # The mapping loaded refers to the vertices of the new graph
+        new_graph = self._create_graph(weight=2.0)
+        loaded = self._cache.load(fingerprint, new_graph, self._machine)
+        self.assertIsNotNone(loaded)
+        new_mapping = loaded[0]
+        self.assertIs(new_mapping.vertices[0], new_graph.vertices[0])
+        self.assertIs(new_mapping.vertices[1], new_graph.vertices[1])
+        self.assertEqual(
+            new_mapping.placements[new_graph.vertices[0]], (0, 0, 1))
+
+    def test_max_mappings_kept(self):
+        for n_atoms in [10, 11, 12]:
+            graph = self._create_graph(n_atoms=n_atoms)
+            self._cache.save(
+                self._get_fingerprint(graph), graph, self._machine,
+                None, None, None, None, None, None)
+        self.assertEqual(len(os.listdir(self._directory)), 2)
+
+    def test_mappings_removed_by_other_processes(self):
+
+        # A mapping removed while it is being listed is skipped
+        os.symlink(os.path.join(self._directory, "removed"),
+                   os.path.join(self._directory, "removed.mapping"))
+        graph = self._create_graph()
+        fingerprint = self._get_fingerprint(graph)
+        self._cache.save(fingerprint, graph, self._machine, None, None, None,
+                         None, None, None)
+        self.assertIsNotNone(self._cache.load(
+            fingerprint, graph, self._machine))
+
+        # A mapping removed before it is loaded is not in the cache
+        os.remove(os.path.join(self._directory, fingerprint + ".mapping"))
+        self.assertIsNone(self._cache.load(fingerprint, graph, self._machine))
+
+
+if __name__ == '__main__':
+    unittest.main()
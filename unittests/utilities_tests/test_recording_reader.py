@@ -0,0 +1,77 @@
+import unittest
+import struct
+from collections import namedtuple
+from data_specification import utility_calls as dsg_utility_calls
+from spynnaker.pyNN.utilities.recording_reader import RecordingReader
+
+Placement = namedtuple("Placement", "x y p")
+CPUInfo = namedtuple("CPUInfo", "user")
+
+
+class MockTransceiver(object):
+    """ A transceiver whose cores each have a single recording region\
+        holding a given block of data
+    """
+
+    def __init__(self, region, core_data):
+        self._app_data_base_addresses = dict()
+        self._memory = dict()
+        for index, ((x, y, p), data) in enumerate(core_data.iteritems()):
+            app_data_base_address = 0x60000000 + (index * 0x10000)
+            region_address = 0x1000
+            self._app_data_base_addresses[(x, y, p)] = app_data_base_address
+            self._memory[(x, y, dsg_utility_calls
+                          .get_region_base_address_offset(
+                              app_data_base_address, region))] = \
+                struct.pack("<I", region_address)
+            self._memory[(x, y, app_data_base_address + region_address)] = \
+                struct.pack("<I", len(data)) + data
+        self.n_reads = 0
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return CPUInfo([self._app_data_base_addresses[(x, y, p)]])
+
+    def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
+        for (chip_x, chip_y, address), data in self._memory.iteritems():
+            if (chip_x == x and chip_y == y and
+                    address <= base_address < address + len(data)):
+                offset = base_address - address
+                return bytearray(data[offset:offset + length])
+        raise Exception("No memory at {}, {}: {}".format(
+            x, y, hex(base_address)))
+
+
+class TestRecordingReader(unittest.TestCase):
+
+    def _create_transceiver(self):
+        core_data = dict()
+        for x in range(3):
+            for p in range(1, 4):
+                core_data[(x, 0, p)] = bytes(bytearray(
+                    range(x * 10 + p, x * 10 + p + (4 * p))))
+        return MockTransceiver(2, core_data), core_data
+
+    def _check_reader(self, n_threads):
+        transceiver, core_data = self._create_transceiver()
+        placements = [Placement(x, y, p) for (x, y, p) in core_data]
+        reader = RecordingReader(transceiver, n_threads)
+        regions = reader.get_recording_regions(placements, 2)
+        self.assertEqual(transceiver.n_reads, 2 * len(placements))
+        for placement, (_, n_bytes) in zip(placements, regions):
+            self.assertEqual(n_bytes, 4 * placement.p)
+        data = reader.read_recording_regions(placements, regions)
+        for placement, placement_data in zip(placements, data):
+            self.assertEqual(
+                bytes(placement_data),
+                core_data[(placement.x, placement.y, placement.p)])
+
+    def test_read_in_one_thread(self):
+        self._check_reader(1)
+
+    def test_read_in_many_threads(self):
+        self._check_reader(4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import struct
+from collections import namedtuple
+from spynnaker.pyNN.utilities.region_data_cache import RegionDataCache
+from unittests.utilities_tests.test_recording_reader import MockTransceiver
+
+Placement = namedtuple("Placement", "x y p")
+
+
+class TestRegionDataCache(unittest.TestCase):
+
+    def setUp(self):
+        self._data = bytes(bytearray(range(64)))
+        self._placement = Placement(0, 0, 1)
+        self._transceiver = MockTransceiver(
+            2, {(0, 0, 1): self._data, (0, 0, 2): self._data})
+        self._cache = RegionDataCache(self._transceiver)
+
+    def test_read_region(self):
+        data = self._cache.read_region(self._placement, 2, 20)
+        self.assertEqual(self._transceiver.n_reads, 2)
+        self.assertEqual(bytes(data[:4]), struct.pack("<I", 64))
+        self.assertEqual(bytes(data[4:20]), self._data[:16])
+
+        # Reading the same or less of the region again reads nothing
+        self._cache.read_region(self._placement, 2, 8)
+        self.assertEqual(self._transceiver.n_reads, 2)
+
+        # Reading more of the region only reads the rest
+        data = self._cache.read_region(self._placement, 2, 40)
+        self.assertEqual(self._transceiver.n_reads, 3)
+        self.assertEqual(bytes(data[4:40]), self._data[:36])
+
+        # Another core has its own data
+        self._cache.read_region(Placement(0, 0, 2), 2, 8)
+        self.assertEqual(self._transceiver.n_reads, 5)
+
+    def test_read_memory(self):
+        self._cache.read_region(self._placement, 2, 40)
+        n_reads = self._transceiver.n_reads
+        address = self._cache.get_region_address(self._placement, 2)
+        self.assertEqual(bytes(self._cache.read_memory(0, 0, address + 4, 8)),
+                         self._data[:8])
+        self.assertEqual(self._transceiver.n_reads, n_reads)
+
+        # Reads outside of the region are passed on, but only once
+        self._cache.read_memory(0, 0, address + 36, 8)
+        self._cache.read_memory(0, 0, address + 36, 8)
+        self.assertEqual(self._transceiver.n_reads, n_reads + 1)
+
+    def test_clear(self):
+        self._cache.read_region(self._placement, 2, 20)
+        self._cache.clear()
+        self._cache.read_region(self._placement, 2, 20)
+        self.assertEqual(self._transceiver.n_reads, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 import spynnaker.pyNN.utilities.utility_calls as utility_calls
 import os, time
 import shutil
+import tempfile
+import numpy
 
 
 class TestUtilityCalls(unittest.TestCase):
@@ -63,6 +65,70 @@ class TestUtilityCalls(unittest.TestCase):
     def test_convert_param_to_numpy_exception(self):
         self.assertEqual(True, False, "Test not implemented yet")
 
+    def test_read_spikes_from_file(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            text_file = os.path.join(test_dir, "spikes.dat")
+            with open(text_file, "w") as spike_file:
+                spike_file.write("# first_id = 0\n")
+                spike_file.write("5.0\t2\n1.0\t2\n3.0\t0\n9.0\t1\n")
+                spike_file.write("2.0\t7\n")
+            spikes = utility_calls.read_spikes_from_file(
+                text_file, 0, 5, 0, 8)
+            self.assertTrue(numpy.array_equal(
+                spikes, [[0, 3.0], [2, 1.0], [2, 5.0]]))
+
+            # A binary file of the same columns gives the same spikes
+            binary_file = os.path.join(test_dir, "spikes.npy")
+            numpy.save(binary_file, numpy.array(
+                [[5.0, 2], [1.0, 2], [3.0, 0], [9.0, 1], [2.0, 7]]))
+            self.assertTrue(numpy.array_equal(
+                utility_calls.read_spikes_from_file(
+                    binary_file, 0, 5, 0, 8), spikes))
+
+            # Limits which are None are not applied
+            self.assertEqual(utility_calls.read_spikes_from_file(
+                text_file, None, None, None, None).shape, (5, 2))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_read_in_data_from_file(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            data_file = os.path.join(test_dir, "gsyn.npz")
+            numpy.savez(data_file, numpy.array(
+                [[1.0, 1, 0.5], [0.0, 1, 0.25], [0.0, 0, 0.75]]))
+            data = utility_calls.read_in_data_from_file(
+                data_file, 0, 2, 0, 2)
+            self.assertTrue(numpy.array_equal(
+                data, [[0, 0.0, 0.75], [1, 0.0, 0.25], [1, 1.0, 0.5]]))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_write_binary_data_file(self):
+        test_dir = tempfile.mkdtemp()
+        try:
+            chunks = [numpy.array([[0.0, 0, 0.5], [1.0, 0, 0.25]]),
+                      numpy.array([[0.0, 1, 0.75], [1.0, 1, 0.125]])]
+            for name in ["v.npy", "v.npz"]:
+                data_file = os.path.join(test_dir, "out", name)
+                self.assertTrue(utility_calls.is_binary_data_file(data_file))
+                utility_calls.write_binary_data_file(
+                    data_file, iter(chunks), 4, 3, 0, 2, dt=1.0)
+                data = utility_calls.read_in_data_from_file(
+                    data_file, None, None, None, None)
+                self.assertTrue(numpy.array_equal(
+                    data[:, [1, 0, 2]], numpy.vstack(chunks)))
+
+            # The .npz file also holds the header of a text file
+            archive = numpy.load(os.path.join(test_dir, "out", "v.npz"))
+            self.assertEqual(archive["first_id"], 0)
+            self.assertEqual(archive["last_id"], 1)
+            self.assertEqual(archive["dt"], 1.0)
+            self.assertFalse(utility_calls.is_binary_data_file("v.dat"))
+        finally:
+            shutil.rmtree(test_dir)
+
 
 if __name__ == '__main__':
     unittest.main()